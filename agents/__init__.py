@@ -1,6 +1,10 @@
 from .base_expert import BaseExpert
 from .pragmatic_pete import PragmaticPete
 from .innovative_izzy import InnovativeIzzy
+from .risk_averse_riley import RiskAverseRiley
+from .scalable_sam import ScalableSam
 from .senior_dev_sam import SeniorDevSam
+from .registry import discover, get_agent_class
 
-__all__ = ['BaseExpert', 'PragmaticPete', 'InnovativeIzzy', 'SeniorDevSam'] 
\ No newline at end of file
+__all__ = ['BaseExpert', 'PragmaticPete', 'InnovativeIzzy', 'RiskAverseRiley', 'ScalableSam',
+           'SeniorDevSam', 'discover', 'get_agent_class']
\ No newline at end of file
@@ -1,14 +1,29 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
-import yaml
-import os
 import logging
+from config.settings import REBUTTAL_BUDGET
+from .problem_features import extract_features
+from .rebuttal_budget import RebuttalBudget, RebuttalCandidate
+from .registry import register
+from .thoughts import Thought
+from telemetry.tracing import trace_public_methods
 
-# Set up logging with INFO level
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Problems with fewer words than this get clarifying questions instead of an analysis
+MIN_PROBLEM_WORDS = 10
+
 class BaseExpert(ABC):
+    # Name a persona is registered and built under; subclasses without one are not registered
+    default_name = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every persona's public methods show up as spans when tracing is on
+        trace_public_methods(cls)
+        if "default_name" in vars(cls):
+            register(cls)
+
     def __init__(self, name: str, config: Dict[str, Any] = None):
         self.name = name
         self.config = config or {}
@@ -32,12 +47,25 @@ class BaseExpert(ABC):
             self.analysis_framework = []
         
         self.persona = self._get_persona()
+        self.rebuttal_budget = RebuttalBudget(self.focus_areas, self.config.get("rebuttal_budget", REBUTTAL_BUDGET))
         self.conversation_history: List[Dict[str, str]] = []
         self.interaction_history: List[Dict[str, Any]] = []
         self.current_round = 0
         self._needs_clarification = False
         self.clarifying_questions = []
 
+    def reset(self) -> None:
+        """Drop conversation state so the agent can be reused for another battle
+
+        Histories are replaced rather than cleared, so results that still
+        reference them are left intact. The clarification flag belongs to the
+        agent's last analysis, which a battle may reuse, so it is only reset
+        by the next ``generate_analysis``.
+        """
+        self.conversation_history = []
+        self.interaction_history = []
+        self.current_round = 0
+
     def _get_persona(self) -> Dict[str, Any]:
         """Get the persona configuration"""
         return {
@@ -61,6 +89,20 @@ class BaseExpert(ABC):
         """Base method for generating a solution"""
         pass
 
+    def analysis_inputs(self, problem: str) -> Dict[str, Any]:
+        """Get the parts of a problem this agent's analysis depends on
+
+        Two problems with equal inputs produce the same analysis apart from
+        thought-process entries that reference the problem text, so a stored
+        analysis can be reused for a clarified problem. Personas whose analysis
+        reads the problem beyond ``extract_features`` must override this.
+        """
+        features = extract_features(problem)
+        return {
+            "keywords": sorted(features.keywords),
+            "needs_detail": features.word_count < MIN_PROBLEM_WORDS
+        }
+
     def generate_analysis(self, problem: str) -> Dict[str, List[str]]:
         """Generate a structured analysis with pros, cons, risks, and suggestions"""
         # Clear history before new analysis
@@ -82,20 +124,20 @@ class BaseExpert(ABC):
         }
         
         # Add initial thought process
-        analysis["thought_process"].append(f"{self.name} is analyzing the problem: {problem}")
+        analysis["thought_process"].append(Thought(self.name, "{agent} is analyzing the problem: {problem}", problem=problem))
         
         # Check if we need more information
-        if len(problem.split()) < 10:  # Simple heuristic for insufficient detail
+        if extract_features(problem).word_count < MIN_PROBLEM_WORDS:  # Simple heuristic for insufficient detail
             self._needs_clarification = True
             analysis["clarifying_questions"].append("Could you provide more details about your specific requirements?")
             analysis["clarifying_questions"].append("What are your key objectives and constraints?")
             analysis["clarifying_questions"].append("What is your target timeline and budget?")
-            analysis["thought_process"].append(f"{self.name} needs more information to provide a thorough analysis")
+            analysis["thought_process"].append(Thought(self.name, "{agent} needs more information to provide a thorough analysis"))
             return analysis
             
         # Get technical analysis
         technical_analysis = self.analyze_problem(problem)
-        analysis["thought_process"].append(f"{self.name} completed technical analysis: {technical_analysis}")
+        analysis["thought_process"].append(Thought(self.name, "{agent} completed technical analysis: {analysis}", analysis=technical_analysis))
         
         # Generate solution with context
         context = {
@@ -108,26 +150,26 @@ class BaseExpert(ABC):
         }
         
         solution = self.generate_solution(problem, context)
-        analysis["thought_process"].append(f"{self.name} generated initial solution based on technical analysis")
+        analysis["thought_process"].append(Thought(self.name, "{agent} generated initial solution based on technical analysis"))
         
         # Add persona-specific insights based on the problem context
         if "Pragmatic Pete" in self.name:
             analysis["pros"].append("Strong focus on business value and ROI")
             analysis["suggestions"].append("Consider implementing a phased approach to validate business impact")
             analysis["suggestions"].append("Start with a minimum viable product to test market fit")
-            analysis["thought_process"].append(f"{self.name} added business-focused insights")
+            analysis["thought_process"].append(Thought(self.name, "{agent} added business-focused insights"))
         
         elif "Innovative Izzy" in self.name:
             analysis["pros"].append("Forward-thinking approach to product development")
             analysis["suggestions"].append("Explore innovative features that could provide competitive advantage")
             analysis["suggestions"].append("Consider user experience and engagement strategies")
-            analysis["thought_process"].append(f"{self.name} added innovation-focused insights")
+            analysis["thought_process"].append(Thought(self.name, "{agent} added innovation-focused insights"))
         
         elif "Senior Dev Sam" in self.name:
             analysis["pros"].append("Technical excellence and scalability considerations")
             analysis["suggestions"].append("Implement robust testing and monitoring from the start")
             analysis["suggestions"].append("Focus on maintainable and scalable architecture")
-            analysis["thought_process"].append(f"{self.name} added technical-focused insights")
+            analysis["thought_process"].append(Thought(self.name, "{agent} added technical-focused insights"))
         
         # Add summary based on persona's focus areas and biases
         focus_areas = self.focus_areas or self.persona.get("focus_areas", [])
@@ -144,7 +186,7 @@ class BaseExpert(ABC):
             summary += f"Key recommendation: {analysis['suggestions'][0]}"
             
         analysis["summary"] = [summary]
-        analysis["thought_process"].append(f"{self.name} completed analysis with summary: {summary}")
+        analysis["thought_process"].append(Thought(self.name, "{agent} completed analysis with summary: {summary}", summary=summary))
         
         return analysis
 
@@ -161,11 +203,12 @@ class BaseExpert(ABC):
             "thought_process": []
         }
         
-        rebuttal["thought_process"].append(f"{self.name} is preparing rebuttal for round {self.current_round}")
+        rebuttal["thought_process"].append(Thought(self.name, "{agent} is preparing rebuttal for round {round}", round=self.current_round))
         
-        # Analyze each other agent's analysis
+        # Analyze each other agent's analysis, keeping points unformatted until the budget picks them
+        candidates: List[RebuttalCandidate] = []
         for agent_name, analysis in other_analysis.items():
-            rebuttal["thought_process"].append(f"{self.name} analyzing {agent_name}'s points")
+            rebuttal["thought_process"].append(Thought(self.name, "{agent} analyzing {other}'s points", other=agent_name))
             
             # Extract key points from their analysis
             their_pros = analysis.get("pros", [])
@@ -176,46 +219,60 @@ class BaseExpert(ABC):
             # Generate rebuttal based on persona and focus areas
             if "Pragmatic Pete" in self.name:
                 # Business-focused rebuttals
-                for pro in their_pros:
-                    if "market" in pro.lower() or "revenue" in pro.lower():
-                        rebuttal["cons"].append(f"While {pro} is important, we should consider the business implications")
-                for con in their_cons:
-                    if "cost" in con.lower() or "investment" in con.lower():
-                        rebuttal["pros"].append(f"Despite {con}, the long-term business value justifies the investment")
-                for risk in their_risks:
-                    if "market" in risk.lower() or "customer" in risk.lower():
-                        rebuttal["suggestions"].append(f"To mitigate {risk}, we should implement a phased market approach")
+                candidates.append((
+                    "cons", "While {item} is important, we should consider the business implications",
+                    [pro for pro in their_pros if "market" in pro.lower() or "revenue" in pro.lower()], analysis
+                ))
+                candidates.append((
+                    "pros", "Despite {item}, the long-term business value justifies the investment",
+                    [con for con in their_cons if "cost" in con.lower() or "investment" in con.lower()], analysis
+                ))
+                candidates.append((
+                    "suggestions", "To mitigate {item}, we should implement a phased market approach",
+                    [risk for risk in their_risks if "market" in risk.lower() or "customer" in risk.lower()], analysis
+                ))
             
             elif "Innovative Izzy" in self.name:
                 # Innovation-focused rebuttals
-                for pro in their_pros:
-                    if "technical" in pro.lower() or "feature" in pro.lower():
-                        rebuttal["pros"].append(f"{pro} demonstrates the potential for innovative solutions")
-                for con in their_cons:
-                    if "complexity" in con.lower() or "difficulty" in con.lower():
-                        rebuttal["suggestions"].append(f"To address {con}, we can implement innovative user-friendly solutions")
-                for risk in their_risks:
-                    if "technical" in risk.lower() or "implementation" in risk.lower():
-                        rebuttal["pros"].append(f"While {risk} exists, it presents an opportunity for creative problem-solving")
+                candidates.append((
+                    "pros", "{item} demonstrates the potential for innovative solutions",
+                    [pro for pro in their_pros if "technical" in pro.lower() or "feature" in pro.lower()], analysis
+                ))
+                candidates.append((
+                    "suggestions", "To address {item}, we can implement innovative user-friendly solutions",
+                    [con for con in their_cons if "complexity" in con.lower() or "difficulty" in con.lower()], analysis
+                ))
+                candidates.append((
+                    "pros", "While {item} exists, it presents an opportunity for creative problem-solving",
+                    [risk for risk in their_risks if "technical" in risk.lower() or "implementation" in risk.lower()], analysis
+                ))
             
             elif "Senior Dev Sam" in self.name:
                 # Technical-focused rebuttals
-                for pro in their_pros:
-                    if "technical" in pro.lower() or "architecture" in pro.lower():
-                        rebuttal["pros"].append(f"{pro} aligns with best technical practices")
-                for con in their_cons:
-                    if "technical" in con.lower() or "implementation" in con.lower():
-                        rebuttal["suggestions"].append(f"To overcome {con}, we should follow established technical patterns")
-                for risk in their_risks:
-                    if "technical" in risk.lower() or "system" in risk.lower():
-                        rebuttal["cons"].append(f"{risk} requires careful technical consideration")
+                candidates.append((
+                    "pros", "{item} aligns with best technical practices",
+                    [pro for pro in their_pros if "technical" in pro.lower() or "architecture" in pro.lower()], analysis
+                ))
+                candidates.append((
+                    "suggestions", "To overcome {item}, we should follow established technical patterns",
+                    [con for con in their_cons if "technical" in con.lower() or "implementation" in con.lower()], analysis
+                ))
+                candidates.append((
+                    "cons", "{item} requires careful technical consideration",
+                    [risk for risk in their_risks if "technical" in risk.lower() or "system" in risk.lower()], analysis
+                ))
+        
+        self.rebuttal_budget.fill(rebuttal, candidates)
         
         # If no rebuttals were generated, add a default message
         if not any(rebuttal.values()):
             rebuttal["suggestions"].append(f"{self.name} has no specific rebuttals to make at this time.")
-            rebuttal["thought_process"].append(f"{self.name} found no specific points to rebut")
+            rebuttal["thought_process"].append(Thought(self.name, "{agent} found no specific points to rebut"))
         else:
-            rebuttal["thought_process"].append(f"{self.name} completed rebuttal with {len(rebuttal['pros'])} pros, {len(rebuttal['cons'])} cons, and {len(rebuttal['suggestions'])} suggestions")
+            rebuttal["thought_process"].append(Thought(
+                self.name, "{agent} completed rebuttal with {pros} pros, {cons} cons, and {suggestions} suggestions",
+                pros=len(rebuttal['pros']), cons=len(rebuttal['cons']), suggestions=len(rebuttal['suggestions'])
+            ))
         
         return rebuttal
 
@@ -294,4 +351,7 @@ class BaseExpert(ABC):
         if not insights:
             insights.append(f"{area}: {framework}")
         
-        return insights 
\ No newline at end of file
+        return insights 
+
+
+trace_public_methods(BaseExpert)
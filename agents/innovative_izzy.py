@@ -1,14 +1,18 @@
 from .base_expert import BaseExpert
+from .rebuttal_budget import RebuttalCandidate
+from .problem_features import extract_features, AI_TERMS, AI_SOLUTION_TERMS, REAL_TIME_TERMS
 from typing import Dict, Any, List
 
 class InnovativeIzzy(BaseExpert):
-    def __init__(self, name: str = "Innovative Izzy", config: Dict[str, Any] = None):
+    default_name = "Innovative Izzy"
+
+    def __init__(self, name: str = default_name, config: Dict[str, Any] = None):
         super().__init__(name, config)
 
     def analyze_problem(self, problem: str) -> Dict[str, Any]:
         """Analyze the problem from an innovation perspective"""
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize analysis structure
         analysis = {
@@ -18,11 +22,11 @@ class InnovativeIzzy(BaseExpert):
         }
         
         # Analyze technical innovation
-        if any(word in problem_lower for word in ["ai", "ml", "smart", "intelligent"]):
+        if features.has_any(*AI_TERMS):
             analysis["technical_innovation"]["novelty"] = "High potential for AI-driven innovation"
             analysis["technical_innovation"]["technical_debt"] = "Requires careful AI architecture design"
             analysis["technical_innovation"]["future_proofing"] = "Strong foundation for AI advancements"
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             analysis["technical_innovation"]["novelty"] = "Opportunity for real-time innovation"
             analysis["technical_innovation"]["technical_debt"] = "Requires robust real-time architecture"
             analysis["technical_innovation"]["future_proofing"] = "Scalable real-time infrastructure"
@@ -32,11 +36,11 @@ class InnovativeIzzy(BaseExpert):
             analysis["technical_innovation"]["future_proofing"] = "Standard future-proofing measures"
         
         # Analyze user experience
-        if any(word in problem_lower for word in ["mobile", "app", "interface"]):
+        if features.has_any("mobile", "app", "interface"):
             analysis["user_experience"]["usability"] = "Focus on mobile-first design"
             analysis["user_experience"]["customization"] = "Mobile-optimized customization"
             analysis["user_experience"]["feedback_loops"] = "In-app feedback mechanisms"
-        elif any(word in problem_lower for word in ["web", "platform", "dashboard"]):
+        elif features.has_any("web", "platform", "dashboard"):
             analysis["user_experience"]["usability"] = "Web-optimized user experience"
             analysis["user_experience"]["customization"] = "Web-based customization options"
             analysis["user_experience"]["feedback_loops"] = "Web-based feedback collection"
@@ -46,7 +50,7 @@ class InnovativeIzzy(BaseExpert):
             analysis["user_experience"]["feedback_loops"] = "Standard feedback mechanisms"
         
         # Analyze scalability
-        if any(word in problem_lower for word in ["scale", "growth", "enterprise"]):
+        if features.has_any("scale", "growth", "enterprise"):
             analysis["scalability"]["architecture"] = "Enterprise-grade scalable architecture"
             analysis["scalability"]["performance"] = "High-performance optimization required"
             analysis["scalability"]["reliability"] = "Enterprise-level reliability needed"
@@ -64,7 +68,7 @@ class InnovativeIzzy(BaseExpert):
         biases = context.get("biases", [])
         
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize solution structure
         solution = {
@@ -75,7 +79,7 @@ class InnovativeIzzy(BaseExpert):
         }
         
         # Generate technical architecture based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["technical_architecture"] = {
                 "frontend": "Modern web framework",
                 "backend": "Scalable server framework",
@@ -83,7 +87,7 @@ class InnovativeIzzy(BaseExpert):
                 "caching": "Performance optimization layer",
                 "messaging": "Standard communication protocol"
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["technical_architecture"] = {
                 "frontend": "React with real-time updates",
                 "backend": "Node.js with WebSocket support",
@@ -101,14 +105,14 @@ class InnovativeIzzy(BaseExpert):
             }
         
         # Generate innovation features based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["innovation_features"] = {
                 "ai_integration": "Advanced AI capabilities",
                 "smart_automation": "AI-powered automation",
                 "predictive_analytics": "ML-based predictions",
                 "natural_language": "NLP features"
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["innovation_features"] = {
                 "real_time_updates": "Instant data synchronization",
                 "live_collaboration": "Real-time collaboration",
@@ -124,7 +128,7 @@ class InnovativeIzzy(BaseExpert):
             }
         
         # Generate user experience based on problem type
-        if any(word in problem_lower for word in ["mobile", "app"]):
+        if features.has_any("mobile", "app"):
             solution["user_experience"] = {
                 "interface": "Mobile-first responsive design",
                 "onboarding": "Mobile-optimized tutorials",
@@ -140,7 +144,7 @@ class InnovativeIzzy(BaseExpert):
             }
         
         # Generate future roadmap based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["future_roadmap"] = {
                 "short_term": [
                     "Basic AI features",
@@ -189,7 +193,8 @@ class InnovativeIzzy(BaseExpert):
             "suggestions": []
         }
         
-        # Analyze each other agent's analysis
+        # Analyze each other agent's analysis, keeping points unformatted until the budget picks them
+        candidates: List[RebuttalCandidate] = []
         for agent_name, analysis in other_analysis.items():
             # Extract key points from their analysis
             their_pros = analysis.get("pros", [])
@@ -198,17 +203,12 @@ class InnovativeIzzy(BaseExpert):
             their_suggestions = analysis.get("suggestions", [])
             
             # Generate rebuttal based on actual analysis content
-            for pro in their_pros:
-                rebuttal["cons"].append(f"While {pro} is valuable, we should consider the innovation potential")
-            
-            for con in their_cons:
-                rebuttal["pros"].append(f"Despite {con}, the innovative benefits justify the approach")
-            
-            for risk in their_risks:
-                rebuttal["suggestions"].append(f"To address {risk}, we should implement proper innovation safeguards")
-            
-            for suggestion in their_suggestions:
-                rebuttal["suggestions"].append(f"Building on {suggestion}, we should also consider innovative approaches")
+            candidates.append(("cons", "While {item} is valuable, we should consider the innovation potential", their_pros, analysis))
+            candidates.append(("pros", "Despite {item}, the innovative benefits justify the approach", their_cons, analysis))
+            candidates.append(("suggestions", "To address {item}, we should implement proper innovation safeguards", their_risks, analysis))
+            candidates.append(("suggestions", "Building on {item}, we should also consider innovative approaches", their_suggestions, analysis))
+        
+        self.rebuttal_budget.fill(rebuttal, candidates)
         
         # If no rebuttals were generated, add a default message
         if not any(rebuttal.values()):
@@ -1,8 +1,12 @@
 from .base_expert import BaseExpert
+from .rebuttal_budget import RebuttalCandidate
+from .thoughts import LazyText
 from typing import Dict, Any, List
 
 class PragmaticPete(BaseExpert):
-    def __init__(self, name: str = "Pragmatic Pete", config: Dict[str, Any] = None):
+    default_name = "Pragmatic Pete"
+
+    def __init__(self, name: str = default_name, config: Dict[str, Any] = None):
         super().__init__(name, config)
 
     def analyze_problem(self, problem: str) -> Dict[str, Any]:
@@ -36,45 +40,45 @@ class PragmaticPete(BaseExpert):
         
         return analysis
         
-    def _analyze_market_opportunity(self, problem: str) -> str:
+    def _analyze_market_opportunity(self, problem: str) -> LazyText:
         """Analyze market opportunity based on the problem"""
-        return f"Market opportunity analysis based on: {problem}"
+        return LazyText("Market opportunity analysis based on: {problem}", problem=problem)
         
-    def _analyze_competitive_advantage(self, problem: str) -> str:
+    def _analyze_competitive_advantage(self, problem: str) -> LazyText:
         """Analyze competitive advantage based on the problem"""
-        return f"Competitive advantage analysis based on: {problem}"
+        return LazyText("Competitive advantage analysis based on: {problem}", problem=problem)
         
-    def _analyze_revenue_potential(self, problem: str) -> str:
+    def _analyze_revenue_potential(self, problem: str) -> LazyText:
         """Analyze revenue potential based on the problem"""
-        return f"Revenue potential analysis based on: {problem}"
+        return LazyText("Revenue potential analysis based on: {problem}", problem=problem)
         
-    def _analyze_customer_adoption(self, problem: str) -> str:
+    def _analyze_customer_adoption(self, problem: str) -> LazyText:
         """Analyze customer adoption potential based on the problem"""
-        return f"Customer adoption analysis based on: {problem}"
+        return LazyText("Customer adoption analysis based on: {problem}", problem=problem)
         
-    def _analyze_development_costs(self, problem: str) -> str:
+    def _analyze_development_costs(self, problem: str) -> LazyText:
         """Analyze development costs based on the problem"""
-        return f"Development cost analysis based on: {problem}"
+        return LazyText("Development cost analysis based on: {problem}", problem=problem)
         
-    def _analyze_maintenance_costs(self, problem: str) -> str:
+    def _analyze_maintenance_costs(self, problem: str) -> LazyText:
         """Analyze maintenance costs based on the problem"""
-        return f"Maintenance cost analysis based on: {problem}"
+        return LazyText("Maintenance cost analysis based on: {problem}", problem=problem)
         
-    def _analyze_roi_timeline(self, problem: str) -> str:
+    def _analyze_roi_timeline(self, problem: str) -> LazyText:
         """Analyze ROI timeline based on the problem"""
-        return f"ROI timeline analysis based on: {problem}"
+        return LazyText("ROI timeline analysis based on: {problem}", problem=problem)
         
-    def _analyze_implementation_complexity(self, problem: str) -> str:
+    def _analyze_implementation_complexity(self, problem: str) -> LazyText:
         """Analyze implementation complexity based on the problem"""
-        return f"Implementation complexity analysis based on: {problem}"
+        return LazyText("Implementation complexity analysis based on: {problem}", problem=problem)
         
-    def _analyze_timeline(self, problem: str) -> str:
+    def _analyze_timeline(self, problem: str) -> LazyText:
         """Analyze timeline based on the problem"""
-        return f"Timeline analysis based on: {problem}"
+        return LazyText("Timeline analysis based on: {problem}", problem=problem)
         
-    def _analyze_resource_needs(self, problem: str) -> str:
+    def _analyze_resource_needs(self, problem: str) -> LazyText:
         """Analyze resource needs based on the problem"""
-        return f"Resource needs analysis based on: {problem}"
+        return LazyText("Resource needs analysis based on: {problem}", problem=problem)
 
     def generate_solution(self, problem: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a business-focused solution"""
@@ -95,7 +99,7 @@ class PragmaticPete(BaseExpert):
         }
         
         # Generate implementation plan based on complexity
-        if "complex" in technical_analysis.get("implementation", {}).get("complexity", "").lower():
+        if "complex" in str(technical_analysis.get("implementation", {}).get("complexity", "")).lower():
             solution["implementation_plan"] = {
                 "phase1": "Requirements gathering and architecture design",
                 "phase2": "Core functionality development",
@@ -112,7 +116,7 @@ class PragmaticPete(BaseExpert):
             }
         
         # Generate cost estimates based on complexity
-        if "significant" in technical_analysis.get("cost_benefit", {}).get("development_costs", "").lower():
+        if "significant" in str(technical_analysis.get("cost_benefit", {}).get("development_costs", "")).lower():
             solution["cost_estimates"] = {
                 "development": "$200k - $300k",
                 "marketing": "$75k - $100k",
@@ -128,7 +132,7 @@ class PragmaticPete(BaseExpert):
             }
         
         # Generate timeline based on complexity
-        if "complex" in technical_analysis.get("implementation", {}).get("complexity", "").lower():
+        if "complex" in str(technical_analysis.get("implementation", {}).get("complexity", "")).lower():
             solution["timeline"] = {
                 "planning": "4 weeks",
                 "development": "12 weeks",
@@ -144,7 +148,7 @@ class PragmaticPete(BaseExpert):
             }
         
         # Generate key metrics based on market opportunity
-        if "significant" in technical_analysis.get("business_impact", {}).get("market_opportunity", "").lower():
+        if "significant" in str(technical_analysis.get("business_impact", {}).get("market_opportunity", "")).lower():
             solution["key_metrics"] = {
                 "mrr_target": "$200k within 6 months",
                 "customer_target": "200 paying customers",
@@ -160,7 +164,7 @@ class PragmaticPete(BaseExpert):
             }
         
         # Generate monetization strategy based on revenue potential
-        if "recurring" in technical_analysis.get("business_impact", {}).get("revenue_potential", "").lower():
+        if "recurring" in str(technical_analysis.get("business_impact", {}).get("revenue_potential", "")).lower():
             solution["monetization"] = {
                 "pricing_tiers": [
                     "Free: Basic features",
@@ -237,7 +241,8 @@ class PragmaticPete(BaseExpert):
             "suggestions": []
         }
         
-        # Analyze each other agent's analysis
+        # Analyze each other agent's analysis, keeping points unformatted until the budget picks them
+        candidates: List[RebuttalCandidate] = []
         for agent_name, analysis in other_analysis.items():
             # Extract key points from their analysis
             their_pros = analysis.get("pros", [])
@@ -246,17 +251,12 @@ class PragmaticPete(BaseExpert):
             their_suggestions = analysis.get("suggestions", [])
             
             # Generate rebuttal based on actual analysis content
-            for pro in their_pros:
-                rebuttal["cons"].append(f"While {pro} is valuable, we should consider the business impact")
-            
-            for con in their_cons:
-                rebuttal["pros"].append(f"Despite {con}, the business benefits justify the approach")
-            
-            for risk in their_risks:
-                rebuttal["suggestions"].append(f"To address {risk}, we should implement proper business safeguards")
-            
-            for suggestion in their_suggestions:
-                rebuttal["suggestions"].append(f"Building on {suggestion}, we should also consider business best practices")
+            candidates.append(("cons", "While {item} is valuable, we should consider the business impact", their_pros, analysis))
+            candidates.append(("pros", "Despite {item}, the business benefits justify the approach", their_cons, analysis))
+            candidates.append(("suggestions", "To address {item}, we should implement proper business safeguards", their_risks, analysis))
+            candidates.append(("suggestions", "Building on {item}, we should also consider business best practices", their_suggestions, analysis))
+        
+        self.rebuttal_budget.fill(rebuttal, candidates)
         
         # If no rebuttals were generated, add a default message
         if not any(rebuttal.values()):
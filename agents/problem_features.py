@@ -0,0 +1,76 @@
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Tuple
+
+# Keyword groups shared by several personas
+AI_TERMS = ("ai", "ml", "smart", "intelligent")
+AI_SOLUTION_TERMS = ("ai", "ml", "smart")
+REAL_TIME_TERMS = ("real-time", "live", "instant")
+ENTERPRISE_TERMS = ("enterprise", "business", "corporate")
+DATA_TERMS = ("data", "privacy", "security")
+
+KEYWORDS = AI_TERMS + REAL_TIME_TERMS + ENTERPRISE_TERMS + DATA_TERMS + (
+    "mobile", "app", "interface", "user",
+    "web", "platform", "dashboard",
+    "market", "growth", "scale", "competition"
+)
+
+
+class KeywordMatcher:
+    """Precompiled substring matcher for a fixed keyword set
+
+    Keywords keep the ``word in problem.lower()`` substring semantics the
+    personas rely on. Each distinct keyword is searched once with CPython's
+    native substring search, and keywords contained in an already-matched
+    longer keyword are implied without scanning.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        unique = sorted({keyword.lower() for keyword in keywords}, key=len, reverse=True)
+        self.keywords: FrozenSet[str] = frozenset(unique)
+        # Longest first, so a hit can mark every keyword it contains as found
+        self._plan: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (keyword, tuple(other for other in unique if other != keyword and other in keyword))
+            for keyword in unique
+        )
+
+    def match(self, text_lower: str) -> FrozenSet[str]:
+        """Get the keywords that occur in already-lowercased text"""
+        found = set()
+        for keyword, implied in self._plan:
+            if keyword in found:
+                continue
+            if keyword in text_lower:
+                found.add(keyword)
+                found.update(implied)
+        return frozenset(found)
+
+
+MATCHER = KeywordMatcher(KEYWORDS)
+
+
+class ProblemFeatures:
+    """Keyword flags and basic statistics extracted once per problem statement"""
+
+    __slots__ = ("keywords", "word_count")
+
+    def __init__(self, keywords: FrozenSet[str], word_count: int):
+        self.keywords = keywords
+        self.word_count = word_count
+
+    def has_any(self, *words: str) -> bool:
+        """Check whether any of the given keywords occurs in the problem"""
+        for word in words:
+            if word not in MATCHER.keywords:
+                raise ValueError(f"Keyword {word} is not registered in problem_features.KEYWORDS")
+            if word in self.keywords:
+                return True
+        return False
+
+    def __repr__(self) -> str:
+        return f"ProblemFeatures(keywords={sorted(self.keywords)}, word_count={self.word_count})"
+
+
+@lru_cache(maxsize=256)
+def extract_features(problem: str) -> ProblemFeatures:
+    """Build the shared ProblemFeatures for a problem, cached so all agents reuse it"""
+    return ProblemFeatures(MATCHER.match(problem.lower()), len(problem.split()))
@@ -0,0 +1,146 @@
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, DefaultDict, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# Words too common to say anything about relevance
+STOPWORDS = frozenset((
+    "and", "are", "for", "from", "the", "this", "that", "with", "should", "we", "our",
+    "can", "its", "while", "despite", "into", "also", "more", "proper"
+))
+# Points whose significant words overlap at least this much (Jaccard) count as duplicates
+DUPLICATE_SIMILARITY = 0.8
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def terms(text: str) -> FrozenSet[str]:
+    """Significant lowercase words of a text, with a plural 's' stripped"""
+    words = set()
+    for word in _WORD.findall(text.lower()):
+        if len(word) < 3 or word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.add(word)
+    return frozenset(words)
+
+
+@lru_cache(maxsize=256)
+def template_terms(template: str) -> FrozenSet[str]:
+    """Significant words a rebuttal template adds around its item"""
+    return terms(template.format(item=""))
+
+
+class _TemplateParts(Dict[str, Tuple[str, str]]):
+    """Rebuttal templates, whose only field is ``{item}``, split into the text before and after it"""
+
+    def __missing__(self, template: str) -> Tuple[str, str]:
+        prefix, _, suffix = template.partition("{item}")
+        self[template] = (prefix, suffix)
+        return prefix, suffix
+
+
+template_parts = _TemplateParts()
+
+
+def overlap(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """Jaccard similarity of two term sets"""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+# Rebuttal points that share a category and template and have not been formatted yet:
+# (category, template, items, analysis). ``analysis`` is the analysis the items were
+# taken from; when it offers ``item_relevance()``, as battle snapshots do, the items'
+# scores are read from there instead of being worked out again by every agent. Plain tuples
+# keep building the candidates as cheap as formatting the points directly
+RebuttalCandidate = Tuple[str, str, Sequence[str], Any]
+
+
+class RebuttalBudget:
+    """Keeps the ``limit`` rebuttal points most relevant to an agent's focus areas
+
+    Points are ranked by how many focus-area terms their template and item
+    share, with ties kept in the order they were generated. A point is
+    dropped when a kept one uses the same template on a near-identical item.
+    Only the kept points are ever formatted. With no limit every point is
+    kept as is.
+    """
+
+    def __init__(self, focus_areas: Iterable[str], limit: Optional[int] = None):
+        self.focus_terms = frozenset().union(*(terms(area) for area in focus_areas))
+        self.limit = limit if limit is None else max(1, limit)
+        self._template_scores: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit is not None
+
+    def template_relevance(self, template: str) -> int:
+        """Count the focus-area terms a template adds around its item"""
+        score = self._template_scores.get(template)
+        if score is None:
+            score = self._template_scores[template] = len(template_terms(template) & self.focus_terms)
+        return score
+
+    def _select(self, candidates: List[RebuttalCandidate]) -> List[Tuple[int, int]]:
+        """Pick the most relevant distinct points as (candidate, item) positions, in their original order"""
+        # Scores are small counts, so bucketing by score ranks in linear time and keeps ties in order
+        buckets: DefaultDict[int, List[Tuple[int, int]]] = defaultdict(list)
+        focus_terms = self.focus_terms
+        template_scores = self._template_scores
+        # Candidates taken from the same analysis come one after another
+        source: Any = object()
+        for position, (_, template, items, analysis) in enumerate(candidates):
+            if not items:
+                continue
+            if analysis is not source:
+                source = analysis
+                item_relevance = getattr(analysis, "item_relevance", None)
+                known = item_relevance(focus_terms) if item_relevance is not None else None
+            scores = known if known is not None else {item: len(terms(item) & focus_terms) for item in items}
+            base = template_scores.get(template)
+            if base is None:
+                base = self.template_relevance(template)
+            for index, item in enumerate(items):
+                buckets[base + scores[item]].append((position, index))
+
+        kept: List[Tuple[int, int]] = []
+        kept_items: Dict[Tuple[str, str], List[FrozenSet[str]]] = {}
+        for score in sorted(buckets, reverse=True):
+            for position, index in buckets[score]:
+                category, template, items, _ = candidates[position]
+                words = terms(items[index])
+                seen = kept_items.setdefault((category, template), [])
+                # Agents often repeat each other word for word, which the membership test catches quickly
+                if words in seen or any(overlap(words, other) >= DUPLICATE_SIMILARITY for other in seen):
+                    continue
+                kept.append((position, index))
+                seen.append(words)
+                if len(kept) == self.limit:
+                    return sorted(kept)
+        return sorted(kept)
+
+    def fill(self, rebuttal: Dict[str, List[str]], candidates: List[RebuttalCandidate]) -> None:
+        """Format the points that fit the budget into the rebuttal's categories"""
+        if not self.enabled:
+            for category, template, items, _ in candidates:
+                if items:
+                    prefix, suffix = template_parts[template]
+                    points = rebuttal[category]
+                    for item in items:
+                        points.append(f"{prefix}{item}{suffix}")
+            return
+        for position, index in self._select(candidates):
+            category, template, items, _ = candidates[position]
+            prefix, suffix = template_parts[template]
+            rebuttal[category].append(f"{prefix}{items[index]}{suffix}")
+
+    def select_points(self, points: List[str]) -> List[str]:
+        """Apply the budget to points that are already formatted"""
+        if not self.enabled:
+            return points
+        return [points[index] for _, index in self._select([("", "", points, None)])]
@@ -0,0 +1,40 @@
+import importlib
+import pkgutil
+import threading
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
+
+# Persona classes by default name, filled in as persona modules are imported
+_REGISTRY: Dict[str, type] = {}
+_discovered = False
+_lock = threading.Lock()
+
+
+def register(agent_class: type) -> type:
+    """Register a persona class under its ``default_name``"""
+    with _lock:
+        _REGISTRY[agent_class.default_name] = agent_class
+    return agent_class
+
+
+def discover() -> Mapping[str, type]:
+    """Import every module of the agents package once and get the registered personas
+
+    Personas register themselves when their class is defined, so a new
+    persona module is picked up without being listed anywhere.
+    """
+    global _discovered
+    if not _discovered:
+        package = importlib.import_module(__package__)
+        for module in pkgutil.iter_modules(package.__path__):
+            importlib.import_module(f"{__package__}.{module.name}")
+        _discovered = True
+    return MappingProxyType(_REGISTRY)
+
+
+def get_agent_class(name: str) -> Type:
+    """Get the persona class registered under a name"""
+    registry = discover()
+    if name not in registry:
+        raise KeyError(f"No persona registered as {name!r}; known personas: {', '.join(registry)}")
+    return registry[name]
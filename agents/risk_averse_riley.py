@@ -1,14 +1,17 @@
 from .base_expert import BaseExpert
+from .problem_features import extract_features, AI_TERMS, AI_SOLUTION_TERMS, REAL_TIME_TERMS, ENTERPRISE_TERMS, DATA_TERMS
 from typing import Dict, Any, List
 
 class RiskAverseRiley(BaseExpert):
-    def __init__(self, name: str = "Risk-Averse Riley", config: Dict[str, Any] = None):
+    default_name = "Risk-Averse Riley"
+
+    def __init__(self, name: str = default_name, config: Dict[str, Any] = None):
         super().__init__(name, config)
 
     def analyze_problem(self, problem: str) -> Dict[str, Any]:
         """Analyze the problem from a risk-averse perspective"""
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize analysis structure
         analysis = {
@@ -18,11 +21,11 @@ class RiskAverseRiley(BaseExpert):
         }
         
         # Analyze technical risks
-        if any(word in problem_lower for word in ["ai", "ml", "smart", "intelligent"]):
+        if features.has_any(*AI_TERMS):
             analysis["technical_risks"]["complexity"] = "High risk due to AI complexity and potential for unexpected behavior"
             analysis["technical_risks"]["reliability"] = "Concerns about AI model reliability and consistency"
             analysis["technical_risks"]["maintenance"] = "Significant maintenance overhead for AI systems"
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             analysis["technical_risks"]["complexity"] = "High risk due to real-time processing requirements"
             analysis["technical_risks"]["reliability"] = "Critical reliability concerns for real-time systems"
             analysis["technical_risks"]["maintenance"] = "Complex maintenance requirements for real-time infrastructure"
@@ -32,11 +35,11 @@ class RiskAverseRiley(BaseExpert):
             analysis["technical_risks"]["maintenance"] = "Standard maintenance requirements"
         
         # Analyze business risks
-        if any(word in problem_lower for word in ["market", "competition", "growth"]):
+        if features.has_any("market", "competition", "growth"):
             analysis["business_risks"]["market"] = "High risk due to competitive market dynamics"
             analysis["business_risks"]["adoption"] = "Uncertain user adoption rates"
             analysis["business_risks"]["revenue"] = "Unpredictable revenue streams"
-        elif any(word in problem_lower for word in ["enterprise", "business", "corporate"]):
+        elif features.has_any(*ENTERPRISE_TERMS):
             analysis["business_risks"]["market"] = "Enterprise market risks and compliance requirements"
             analysis["business_risks"]["adoption"] = "Complex enterprise adoption process"
             analysis["business_risks"]["revenue"] = "Enterprise sales cycle risks"
@@ -46,7 +49,7 @@ class RiskAverseRiley(BaseExpert):
             analysis["business_risks"]["revenue"] = "Standard revenue risks"
         
         # Analyze security risks
-        if any(word in problem_lower for word in ["data", "privacy", "security"]):
+        if features.has_any(*DATA_TERMS):
             analysis["security_risks"]["data"] = "High risk due to sensitive data handling"
             analysis["security_risks"]["compliance"] = "Complex compliance requirements"
             analysis["security_risks"]["access"] = "Critical access control requirements"
@@ -64,7 +67,7 @@ class RiskAverseRiley(BaseExpert):
         biases = context.get("biases", [])
         
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize solution structure
         solution = {
@@ -75,7 +78,7 @@ class RiskAverseRiley(BaseExpert):
         }
         
         # Generate risk mitigation based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["risk_mitigation"] = {
                 "technical": [
                     "Phased AI implementation with human oversight",
@@ -93,7 +96,7 @@ class RiskAverseRiley(BaseExpert):
                     "Access control"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["risk_mitigation"] = {
                 "technical": [
                     "Redundant systems",
@@ -131,7 +134,7 @@ class RiskAverseRiley(BaseExpert):
             }
         
         # Generate implementation plan based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["implementation_plan"] = {
                 "phases": [
                     "Research and planning",
@@ -142,7 +145,7 @@ class RiskAverseRiley(BaseExpert):
                 "timeline": "Extended timeline for proper testing",
                 "resources": "Dedicated AI team with oversight"
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["implementation_plan"] = {
                 "phases": [
                     "Infrastructure setup",
@@ -166,7 +169,7 @@ class RiskAverseRiley(BaseExpert):
             }
         
         # Generate security measures based on problem type
-        if any(word in problem_lower for word in ["data", "privacy", "security"]):
+        if features.has_any(*DATA_TERMS):
             solution["security_measures"] = {
                 "data_protection": [
                     "Encryption at rest and in transit",
@@ -204,7 +207,7 @@ class RiskAverseRiley(BaseExpert):
             }
         
         # Generate fallback strategies based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["fallback_strategies"] = {
                 "technical": [
                     "Human-in-the-loop fallback",
@@ -267,6 +270,7 @@ class RiskAverseRiley(BaseExpert):
                 if any("complexity" in s.lower() for s in analysis.get("cons", [])):
                     concerns.append("The additional complexity of webhook security is a significant risk factor that supports an API-first approach")
         
+        concerns = self.rebuttal_budget.select_points(concerns)
         if not concerns:
             return "From a security perspective, an API-first approach provides better control over authentication, authorization, and data access patterns."
         
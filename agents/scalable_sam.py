@@ -1,14 +1,17 @@
 from .base_expert import BaseExpert
+from .problem_features import extract_features, AI_TERMS, AI_SOLUTION_TERMS, REAL_TIME_TERMS, ENTERPRISE_TERMS
 from typing import Dict, Any, List
 
 class ScalableSam(BaseExpert):
-    def __init__(self, name: str = "Scalable Sam", config: Dict[str, Any] = None):
+    default_name = "Scalable Sam"
+
+    def __init__(self, name: str = default_name, config: Dict[str, Any] = None):
         super().__init__(name, config)
 
     def analyze_problem(self, problem: str) -> Dict[str, Any]:
         """Analyze the problem from a scalability perspective"""
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize analysis structure
         analysis = {
@@ -18,11 +21,11 @@ class ScalableSam(BaseExpert):
         }
         
         # Analyze scalability requirements
-        if any(word in problem_lower for word in ["ai", "ml", "smart", "intelligent"]):
+        if features.has_any(*AI_TERMS):
             analysis["scalability_requirements"]["compute"] = "High compute requirements for AI processing"
             analysis["scalability_requirements"]["storage"] = "Large storage needs for AI models and data"
             analysis["scalability_requirements"]["network"] = "High bandwidth for AI inference"
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             analysis["scalability_requirements"]["compute"] = "High throughput processing requirements"
             analysis["scalability_requirements"]["storage"] = "Efficient real-time data storage"
             analysis["scalability_requirements"]["network"] = "Low latency network requirements"
@@ -32,11 +35,11 @@ class ScalableSam(BaseExpert):
             analysis["scalability_requirements"]["network"] = "Standard network requirements"
         
         # Analyze performance considerations
-        if any(word in problem_lower for word in ["enterprise", "business", "corporate"]):
+        if features.has_any(*ENTERPRISE_TERMS):
             analysis["performance_considerations"]["load"] = "Enterprise-scale load handling"
             analysis["performance_considerations"]["latency"] = "Low latency requirements"
             analysis["performance_considerations"]["availability"] = "High availability needs"
-        elif any(word in problem_lower for word in ["mobile", "app", "user"]):
+        elif features.has_any("mobile", "app", "user"):
             analysis["performance_considerations"]["load"] = "Mobile-scale load handling"
             analysis["performance_considerations"]["latency"] = "Mobile-optimized latency"
             analysis["performance_considerations"]["availability"] = "Mobile app availability"
@@ -46,7 +49,7 @@ class ScalableSam(BaseExpert):
             analysis["performance_considerations"]["availability"] = "Standard availability needs"
         
         # Analyze growth potential
-        if any(word in problem_lower for word in ["market", "growth", "scale"]):
+        if features.has_any("market", "growth", "scale"):
             analysis["growth_potential"]["users"] = "High user growth potential"
             analysis["growth_potential"]["data"] = "Significant data growth expected"
             analysis["growth_potential"]["features"] = "Expanding feature set planned"
@@ -64,7 +67,7 @@ class ScalableSam(BaseExpert):
         biases = context.get("biases", [])
         
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize solution structure
         solution = {
@@ -75,7 +78,7 @@ class ScalableSam(BaseExpert):
         }
         
         # Generate architecture based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["architecture"] = {
                 "frontend": "React with AI components",
                 "backend": "Python with FastAPI and ML libraries",
@@ -83,7 +86,7 @@ class ScalableSam(BaseExpert):
                 "caching": "Redis for AI model caching",
                 "messaging": "Kafka for AI event streaming"
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["architecture"] = {
                 "frontend": "React with real-time updates",
                 "backend": "Node.js with WebSocket support",
@@ -101,7 +104,7 @@ class ScalableSam(BaseExpert):
             }
         
         # Generate scaling strategy based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["scaling_strategy"] = {
                 "horizontal": [
                     "AI model serving clusters",
@@ -119,7 +122,7 @@ class ScalableSam(BaseExpert):
                     "Cost-optimized scaling"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["scaling_strategy"] = {
                 "horizontal": [
                     "WebSocket servers",
@@ -157,7 +160,7 @@ class ScalableSam(BaseExpert):
             }
         
         # Generate performance optimization based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["performance_optimization"] = {
                 "compute": [
                     "Model optimization",
@@ -175,7 +178,7 @@ class ScalableSam(BaseExpert):
                     "Connection pooling"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["performance_optimization"] = {
                 "compute": [
                     "Event batching",
@@ -213,7 +216,7 @@ class ScalableSam(BaseExpert):
             }
         
         # Generate monitoring based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["monitoring"] = {
                 "metrics": [
                     "Model performance",
@@ -231,7 +234,7 @@ class ScalableSam(BaseExpert):
                     "Resource usage"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["monitoring"] = {
                 "metrics": [
                     "Connection count",
@@ -329,6 +332,7 @@ class ScalableSam(BaseExpert):
                 if any("maintenance" in s.lower() for s in analysis.get("cons", [])):
                     concerns.append("The operational overhead of maintaining webhook infrastructure can impact system reliability")
         
+        concerns = self.rebuttal_budget.select_points(concerns)
         if not concerns:
             return "From a scalability perspective, an API-first approach provides better control over system resources and simpler scaling patterns."
         
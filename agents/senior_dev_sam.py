@@ -1,8 +1,13 @@
 from .base_expert import BaseExpert
+from .rebuttal_budget import RebuttalCandidate
+from .thoughts import LazyText
+from .problem_features import extract_features, AI_SOLUTION_TERMS, REAL_TIME_TERMS
 from typing import Dict, Any, List
 
 class SeniorDevSam(BaseExpert):
-    def __init__(self, name: str = "Senior Dev Sam", config: Dict[str, Any] = None):
+    default_name = "Senior Dev Sam"
+
+    def __init__(self, name: str = default_name, config: Dict[str, Any] = None):
         super().__init__(name, config)
 
     def analyze_problem(self, problem: str) -> Dict[str, Any]:
@@ -14,9 +19,6 @@ class SeniorDevSam(BaseExpert):
             "maintenance_requirements": {}
         }
         
-        # Extract key technical requirements from the problem
-        problem_words = problem.lower().split()
-        
         # Analyze technical complexity based on actual problem content
         analysis["technical_complexity"] = {
             "architecture": self._determine_architecture_complexity(problem),
@@ -40,42 +42,42 @@ class SeniorDevSam(BaseExpert):
         
         return analysis
         
-    def _determine_architecture_complexity(self, problem: str) -> str:
+    def _determine_architecture_complexity(self, problem: str) -> LazyText:
         """Analyze the architectural needs based on the actual problem"""
         # This should be implemented based on actual requirements
-        return f"Architecture complexity analysis based on: {problem}"
+        return LazyText("Architecture complexity analysis based on: {problem}", problem=problem)
         
-    def _determine_integration_needs(self, problem: str) -> str:
+    def _determine_integration_needs(self, problem: str) -> LazyText:
         """Determine integration requirements based on the problem"""
-        return f"Integration requirements based on: {problem}"
+        return LazyText("Integration requirements based on: {problem}", problem=problem)
         
-    def _determine_testing_requirements(self, problem: str) -> str:
+    def _determine_testing_requirements(self, problem: str) -> LazyText:
         """Determine testing needs based on the problem"""
-        return f"Testing requirements based on: {problem}"
+        return LazyText("Testing requirements based on: {problem}", problem=problem)
         
-    def _determine_team_requirements(self, problem: str) -> str:
+    def _determine_team_requirements(self, problem: str) -> LazyText:
         """Determine team needs based on the problem"""
-        return f"Team requirements based on: {problem}"
+        return LazyText("Team requirements based on: {problem}", problem=problem)
         
-    def _determine_development_process(self, problem: str) -> str:
+    def _determine_development_process(self, problem: str) -> LazyText:
         """Determine development process based on the problem"""
-        return f"Development process based on: {problem}"
+        return LazyText("Development process based on: {problem}", problem=problem)
         
-    def _determine_required_tools(self, problem: str) -> str:
+    def _determine_required_tools(self, problem: str) -> LazyText:
         """Determine required tools based on the problem"""
-        return f"Required tools based on: {problem}"
+        return LazyText("Required tools based on: {problem}", problem=problem)
         
-    def _determine_update_requirements(self, problem: str) -> str:
+    def _determine_update_requirements(self, problem: str) -> LazyText:
         """Determine update requirements based on the problem"""
-        return f"Update requirements based on: {problem}"
+        return LazyText("Update requirements based on: {problem}", problem=problem)
         
-    def _determine_monitoring_needs(self, problem: str) -> str:
+    def _determine_monitoring_needs(self, problem: str) -> LazyText:
         """Determine monitoring needs based on the problem"""
-        return f"Monitoring needs based on: {problem}"
+        return LazyText("Monitoring needs based on: {problem}", problem=problem)
         
-    def _determine_documentation_needs(self, problem: str) -> str:
+    def _determine_documentation_needs(self, problem: str) -> LazyText:
         """Determine documentation needs based on the problem"""
-        return f"Documentation needs based on: {problem}"
+        return LazyText("Documentation needs based on: {problem}", problem=problem)
 
     def generate_solution(self, problem: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a senior developer-focused solution"""
@@ -84,7 +86,7 @@ class SeniorDevSam(BaseExpert):
         biases = context.get("biases", [])
         
         # Extract key components from the problem
-        problem_lower = problem.lower()
+        features = extract_features(problem)
         
         # Initialize solution structure
         solution = {
@@ -95,7 +97,7 @@ class SeniorDevSam(BaseExpert):
         }
         
         # Generate architecture based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["architecture"] = {
                 "frontend": "React with AI visualization components",
                 "backend": "Python with FastAPI and ML frameworks",
@@ -103,7 +105,7 @@ class SeniorDevSam(BaseExpert):
                 "caching": "Redis for model caching",
                 "messaging": "Kafka for ML event streaming"
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["architecture"] = {
                 "frontend": "React with real-time UI components",
                 "backend": "Node.js with WebSocket support",
@@ -121,7 +123,7 @@ class SeniorDevSam(BaseExpert):
             }
         
         # Generate development approach based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["development_approach"] = {
                 "methodology": [
                     "Agile with ML sprints",
@@ -139,7 +141,7 @@ class SeniorDevSam(BaseExpert):
                     "Data quality checks"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["development_approach"] = {
                 "methodology": [
                     "Agile with real-time focus",
@@ -177,7 +179,7 @@ class SeniorDevSam(BaseExpert):
             }
         
         # Generate testing strategy based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["testing_strategy"] = {
                 "unit_tests": [
                     "Model component tests",
@@ -195,7 +197,7 @@ class SeniorDevSam(BaseExpert):
                     "API response times"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["testing_strategy"] = {
                 "unit_tests": [
                     "WebSocket handler tests",
@@ -233,7 +235,7 @@ class SeniorDevSam(BaseExpert):
             }
         
         # Generate documentation based on problem type
-        if any(word in problem_lower for word in ["ai", "ml", "smart"]):
+        if features.has_any(*AI_SOLUTION_TERMS):
             solution["documentation"] = {
                 "technical": [
                     "ML model documentation",
@@ -251,7 +253,7 @@ class SeniorDevSam(BaseExpert):
                     "Troubleshooting guide"
                 ]
             }
-        elif any(word in problem_lower for word in ["real-time", "live", "instant"]):
+        elif features.has_any(*REAL_TIME_TERMS):
             solution["documentation"] = {
                 "technical": [
                     "Real-time system architecture",
@@ -335,7 +337,8 @@ class SeniorDevSam(BaseExpert):
             "suggestions": []
         }
         
-        # Analyze each other agent's analysis
+        # Analyze each other agent's analysis, keeping points unformatted until the budget picks them
+        candidates: List[RebuttalCandidate] = []
         for agent_name, analysis in other_analysis.items():
             # Extract key points from their analysis
             their_pros = analysis.get("pros", [])
@@ -344,17 +347,12 @@ class SeniorDevSam(BaseExpert):
             their_suggestions = analysis.get("suggestions", [])
             
             # Generate rebuttal based on actual analysis content
-            for pro in their_pros:
-                rebuttal["cons"].append(f"While {pro} is important, we should consider the technical implications")
-            
-            for con in their_cons:
-                rebuttal["pros"].append(f"Despite {con}, the technical benefits justify the approach")
-            
-            for risk in their_risks:
-                rebuttal["suggestions"].append(f"To mitigate {risk}, we should implement proper technical safeguards")
-            
-            for suggestion in their_suggestions:
-                rebuttal["suggestions"].append(f"Building on {suggestion}, we should also consider technical best practices")
+            candidates.append(("cons", "While {item} is important, we should consider the technical implications", their_pros, analysis))
+            candidates.append(("pros", "Despite {item}, the technical benefits justify the approach", their_cons, analysis))
+            candidates.append(("suggestions", "To mitigate {item}, we should implement proper technical safeguards", their_risks, analysis))
+            candidates.append(("suggestions", "Building on {item}, we should also consider technical best practices", their_suggestions, analysis))
+        
+        self.rebuttal_budget.fill(rebuttal, candidates)
         
         # If no rebuttals were generated, add a default message
         if not any(rebuttal.values()):
@@ -0,0 +1,80 @@
+from typing import Any, Iterable, List
+
+
+class LazyText:
+    """Text built from a template and references to shared objects on demand
+
+    Agents describe their work in terms of the problem statement and analysis
+    dicts they already hold. Keeping references instead of formatting them
+    into new strings means a long problem is stored once per battle, not once
+    per message. The text is only built by ``str()``, for display or
+    serialization, and compares equal to the string it renders to.
+
+    Referenced objects must not be mutated after the text is created.
+    """
+
+    __slots__ = ("template", "fields")
+
+    def __init__(self, template: str, **fields: Any):
+        self.template = template
+        self.fields = fields
+
+    def render(self) -> str:
+        """Format the template with the referenced fields"""
+        return self.template.format(**self.fields)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        # Render like the equivalent string so dict reprs stay unchanged
+        return repr(self.render())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazyText, str)):
+            return self.render() == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.render())
+
+
+class Thought(LazyText):
+    """One thought-process entry of an agent"""
+
+    __slots__ = ()
+
+    def __init__(self, agent: str, template: str, **fields: Any):
+        super().__init__(template, agent=agent, **fields)
+
+    @property
+    def agent(self) -> str:
+        return self.fields["agent"]
+
+
+def rebind(value: Any, **fields: Any) -> Any:
+    """Copy a value, pointing every LazyText field with one of the given names at a new object
+
+    Dicts, lists and tuples are copied and LazyText values nested inside them
+    or inside other LazyText fields are rebound too. Anything else is shared.
+    """
+    if isinstance(value, LazyText):
+        copy = object.__new__(type(value))
+        copy.template = value.template
+        copy.fields = {
+            key: fields[key] if key in fields else rebind(item, **fields)
+            for key, item in value.fields.items()
+        }
+        return copy
+    if isinstance(value, dict):
+        return {key: rebind(item, **fields) for key, item in value.items()}
+    if isinstance(value, list):
+        return [rebind(item, **fields) for item in value]
+    if isinstance(value, tuple):
+        return tuple(rebind(item, **fields) for item in value)
+    return value
+
+
+def render_thoughts(thoughts: Iterable[Any]) -> List[str]:
+    """Render thought-process entries (Thought or plain str) to strings"""
+    return [str(thought) for thought in thoughts]
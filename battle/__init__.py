@@ -1,3 +1,14 @@
 from .battle_manager import BattleManager
+from .executor import AgentExecutor, AgentTimeoutError, create_executor
+from .dag import DagNode, DagScheduler
+from .events import (
+    BattleEvent, AnalysisReady, RebuttalReady, SolutionReady, VoteCast,
+    ClarificationNeeded, BattleComplete, collect, aiterate
+)
+from .records import Analysis, Rebuttal, Solution, AgentResult, BattleResult
 
-__all__ = ['BattleManager'] 
\ No newline at end of file
+__all__ = ['BattleManager', 'AgentExecutor', 'AgentTimeoutError', 'create_executor',
+           'DagNode', 'DagScheduler',
+           'BattleEvent', 'AnalysisReady', 'RebuttalReady', 'SolutionReady', 'VoteCast',
+           'ClarificationNeeded', 'BattleComplete', 'collect', 'aiterate',
+           'Analysis', 'Rebuttal', 'Solution', 'AgentResult', 'BattleResult']
@@ -0,0 +1,103 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from agents.base_expert import BaseExpert
+from agents.registry import discover
+from battle.battle_config import BattleConfig
+
+
+def build_agents(config: BattleConfig) -> List[BaseExpert]:
+    """Create one agent per registered persona with its configuration
+
+    Agents come in the order the battle config lists them, followed by
+    registered personas the config does not mention.
+    """
+    registry = discover()
+    names = [name for name in config.agents if name in registry]
+    names.extend(name for name in registry if name not in config.agents)
+    return [registry[name](name, config.get_agent_config(name)) for name in names]
+
+
+class AgentPool:
+    """Pre-built agent sets checked out one battle at a time
+
+    ``acquire`` hands out an idle set, building a new one only when every set
+    is in use, so concurrent battles never share agent state. ``release``
+    resets the agents and keeps up to ``size`` sets warm. With ``hot_reload``
+    and a config bound to a file, edits to it are picked up on acquire and
+    sets built from the old config are dropped instead of reused.
+    """
+
+    def __init__(self, config: Optional[BattleConfig] = None, size: int = 1, hot_reload: bool = True):
+        self.config = config or BattleConfig()
+        self.size = max(1, size)
+        self.hot_reload = hot_reload
+        # Config hash each checked-out set was built with, by id of the set
+        self._leased: Dict[int, str] = {}
+        self.built_count = 0
+        self.reuse_count = 0
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[str, List[BaseExpert]]] = [self._build() for _ in range(self.size)]
+
+    def _build(self) -> Tuple[str, List[BaseExpert]]:
+        self.built_count += 1
+        return self.config.content_hash, build_agents(self.config)
+
+    def acquire(self) -> List[BaseExpert]:
+        """Check out an agent set for one battle"""
+        with self._lock:
+            if self.hot_reload:
+                self.config = self.config.reload()
+            self._idle = [entry for entry in self._idle if entry[0] == self.config.content_hash]
+            if self._idle:
+                self.reuse_count += 1
+                built_with, agents = self._idle.pop()
+            else:
+                built_with, agents = self._build()
+            self._leased[id(agents)] = built_with
+            return agents
+
+    def release(self, agents: List[BaseExpert]) -> None:
+        """Return a checked-out set, resetting its agents for the next battle"""
+        for agent in agents:
+            agent.reset()
+        with self._lock:
+            built_with = self._leased.pop(id(agents), None)
+            if built_with == self.config.content_hash and len(self._idle) < self.size:
+                self._idle.append((built_with, agents))
+
+    @contextmanager
+    def lease(self) -> Iterator[List[BaseExpert]]:
+        """Check out an agent set for the duration of a with block"""
+        agents = self.acquire()
+        try:
+            yield agents
+        finally:
+            self.release(agents)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of built and reused agent sets"""
+        with self._lock:
+            return {
+                "built": self.built_count,
+                "reused": self.reuse_count,
+                "idle": len(self._idle),
+                "leased": len(self._leased)
+            }
+
+
+_shared_pools: Dict[str, AgentPool] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_pool(config: BattleConfig) -> AgentPool:
+    """Get the process-wide pool for a config, creating it on first use
+
+    Shared pools always build from the config they were created for; a
+    reloaded config has a new content hash and gets its own pool.
+    """
+    with _shared_lock:
+        pool = _shared_pools.get(config.content_hash)
+        if pool is None:
+            pool = _shared_pools[config.content_hash] = AgentPool(config, hot_reload=False)
+        return pool
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import threading
+from typing import Dict, List, Optional
+from agents.base_expert import BaseExpert
+from agents.thoughts import rebind
+from battle.records import Analysis
+
+
+class AnalysisStore:
+    """Per-battle store of agent analyses, computed once and shared read-only
+
+    Analyses are keyed on ``agent.analysis_inputs(problem)`` rather than the
+    raw text, so a store kept across battles reuses an agent's analysis for a
+    clarified problem that did not change its inputs. The reused analysis is
+    rebound to the new problem text. Lookups by the agent that produced an
+    analysis for the text it was produced for skip the fingerprint.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, Analysis] = {}
+        self._analyses: Dict[str, Dict[str, List[str]]] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._problems: Dict[str, str] = {}
+        self._agents: Dict[str, BaseExpert] = {}
+        self.compute_count = 0
+        self.hit_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(agent: BaseExpert, problem: str) -> str:
+        """Hash the inputs that determine an agent's analysis"""
+        payload = json.dumps(
+            {"inputs": agent.analysis_inputs(problem), "persona": agent.persona, "class": type(agent).__name__},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_analysis(self, agent: BaseExpert, problem: str) -> Dict[str, List[str]]:
+        """Get the agent's analysis, computing it only when its inputs changed"""
+        with self._lock:
+            # Every rebuttal reads every other analysis, so this is the common case
+            if self._agents.get(agent.name) is agent and self._problems[agent.name] == problem:
+                self.hit_count += 1
+                return self._analyses[agent.name]
+
+        fingerprint = self.fingerprint(agent, problem)
+        with self._lock:
+            if self._fingerprints.get(agent.name) == fingerprint:
+                self.hit_count += 1
+                self._agents[agent.name] = agent
+                if self._problems[agent.name] != problem:
+                    self._rebind(agent.name, problem)
+                return self._analyses[agent.name]
+
+        # Agents only touch their own state, so analyses can run concurrently
+        analysis = agent.generate_analysis(problem)
+        snapshot = Analysis.from_dict(analysis)
+        with self._lock:
+            self.compute_count += 1
+            self._analyses[agent.name] = analysis
+            self._snapshots[agent.name] = snapshot
+            self._fingerprints[agent.name] = fingerprint
+            self._problems[agent.name] = problem
+            self._agents[agent.name] = agent
+        return analysis
+
+    def _rebind(self, agent_name: str, problem: str) -> None:
+        """Point a stored analysis's thought process at a new problem text"""
+        analysis = rebind(self._analyses[agent_name], problem=problem)
+        self._analyses[agent_name] = analysis
+        self._snapshots[agent_name] = Analysis.from_dict(analysis)
+        self._problems[agent_name] = problem
+
+    def get_fingerprint(self, agent: BaseExpert) -> Optional[str]:
+        """Get the fingerprint of the agent's stored analysis, if there is one"""
+        with self._lock:
+            return self._fingerprints.get(agent.name)
+
+    def get_snapshot(self, agent: BaseExpert, problem: str) -> Analysis:
+        """Get a read-only snapshot of the agent's analysis"""
+        self.get_analysis(agent, problem)
+        with self._lock:
+            return self._snapshots[agent.name]
+
+    def other_snapshots(self, agent: BaseExpert, agents: List[BaseExpert],
+                        problem: str) -> Dict[str, Analysis]:
+        """Get read-only snapshots for every agent except the given one"""
+        return {
+            other.name: self.get_snapshot(other, problem)
+            for other in agents
+            if other != agent
+        }
+
+    def invalidate(self, agent_name: Optional[str] = None) -> None:
+        """Drop the stored analysis for one agent, or for all agents"""
+        with self._lock:
+            names = [agent_name] if agent_name is not None else list(self._fingerprints)
+            for name in names:
+                self._snapshots.pop(name, None)
+                self._analyses.pop(name, None)
+                self._fingerprints.pop(name, None)
+                self._problems.pop(name, None)
+                self._agents.pop(name, None)
+
+    def reset_stats(self) -> None:
+        """Zero the computed and reused counters, keeping the stored analyses"""
+        with self._lock:
+            self.compute_count = 0
+            self.hit_count = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of computed and reused analyses"""
+        return {
+            "computed": self.compute_count,
+            "reused": self.hit_count,
+            "stored": len(self._fingerprints)
+        }
@@ -0,0 +1,174 @@
+"""Run battles for many problem statements across worker processes
+
+Usage: ``python -m battle.batch problems.jsonl -o results.jsonl``
+
+Input is JSONL (objects with a ``problem`` field, or bare JSON strings) or CSV
+with a ``problem`` column; an ``id`` field/column is used when present,
+otherwise the 1-based record number. Results are appended to the output JSONL
+as battles finish, so re-running the same command resumes after the last
+recorded battle.
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from battle.agent_pool import build_agents
+from battle.battle_config import BattleConfig
+from battle.battle_run_example import iter_battle
+from battle.events import collect
+
+# Warm per-process state set up by _init_worker
+_worker_config: Optional[BattleConfig] = None
+_worker_agents: Optional[List[Any]] = None
+
+
+def read_problems(path: str, field: str = "problem") -> Iterator[Tuple[str, str]]:
+    """Yield (id, problem) pairs from a JSONL or CSV file"""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            for number, row in enumerate(csv.DictReader(f), 1):
+                problem = (row.get(field) or "").strip()
+                if problem:
+                    yield str(row.get("id") or number), problem
+            return
+        number = 0
+        for line in f:
+            if not line.strip():
+                continue
+            number += 1
+            record = json.loads(line)
+            if isinstance(record, str):
+                yield str(number), record
+            elif record.get(field):
+                yield str(record.get("id", number)), record[field]
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    """Get the ids already recorded in an output file, dropping a torn last line"""
+    done: Set[str] = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, "rb+") as f:
+        valid_bytes = 0
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # A crash can leave a partial record behind
+            try:
+                done.add(str(json.loads(line)["id"]))
+            except (ValueError, KeyError):
+                break
+            valid_bytes += len(line)
+        f.truncate(valid_bytes)
+    return done
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _init_worker(config: Optional[BattleConfig]) -> None:
+    """Build agents once per worker process from the config parsed by the parent"""
+    global _worker_config, _worker_agents
+    _worker_config = config or BattleConfig()
+    _worker_agents = build_agents(_worker_config)
+
+
+def run_one(problem_id: str, problem: str, details: bool = False) -> Dict[str, Any]:
+    """Run a single battle on the worker's warm agents and return its output record"""
+    if _worker_agents is None:
+        _init_worker(None)
+    started = time.perf_counter()
+    try:
+        result = collect(iter_battle(problem, _worker_config, agents=_worker_agents))
+    except Exception as exc:
+        return {"id": problem_id, "problem": problem, "error": f"{type(exc).__name__}: {exc}",
+                "latency": time.perf_counter() - started}
+    record = {
+        "id": problem_id,
+        "problem": problem,
+        "winners": result["winners"],
+        "votes": result["votes"],
+        "latency": time.perf_counter() - started
+    }
+    if details:
+        record["analyses"] = result["analyses"]
+        record["solutions"] = result["solutions"]
+    return record
+
+
+def run_batch(input_path: str, output_path: str, workers: Optional[int] = None,
+              config_file: Optional[str] = "battle_config.yaml", field: str = "problem",
+              checkpoint_every: int = 100, details: bool = False,
+              progress_every: int = 1000) -> Dict[str, Any]:
+    """Run every pending problem in input_path and append results to output_path"""
+    workers = workers or os.cpu_count() or 1
+    config = BattleConfig.load(config_file)
+    done = load_checkpoint(output_path)
+    pending = ((problem_id, problem) for problem_id, problem in read_problems(input_path, field)
+               if problem_id not in done)
+
+    latencies: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    with open(output_path, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(config,)) as pool:
+
+        def write(record: Dict[str, Any]) -> None:
+            nonlocal errors
+            out.write(json.dumps(record, default=str) + "\n")
+            latencies.append(record["latency"])
+            errors += "error" in record
+            if len(latencies) % checkpoint_every == 0:
+                out.flush()
+                os.fsync(out.fileno())
+            if progress_every and len(latencies) % progress_every == 0:
+                elapsed = time.perf_counter() - started
+                print(f"{len(latencies)} battles, {len(latencies) / elapsed:.1f} battles/s")
+
+        # Keep a bounded window in flight so huge inputs are never fully materialized
+        in_flight = set()
+        for problem_id, problem in pending:
+            in_flight.add(pool.submit(run_one, problem_id, problem, details))
+            if len(in_flight) >= workers * 4:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    write(future.result())
+        for future in wait(in_flight).done:
+            write(future.result())
+        out.flush()
+        os.fsync(out.fileno())
+
+    elapsed = time.perf_counter() - started
+    return {
+        "battles": len(latencies),
+        "errors": errors,
+        "resumed": len(done),
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 0.5) if latencies else 0.0,
+        "p99": percentile(latencies, 0.99) if latencies else 0.0
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL or CSV file of problem statements")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file results are appended to")
+    parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--config", default="battle_config.yaml", help="Battle configuration file")
+    parser.add_argument("--field", default="problem", help="Field or column holding the problem statement")
+    parser.add_argument("--checkpoint-every", type=int, default=100, help="Battles between fsyncs of the output")
+    parser.add_argument("--details", action="store_true", help="Include analyses and solutions in each record")
+    args = parser.parse_args()
+
+    stats = run_batch(args.input, args.output, args.workers, args.config, args.field,
+                      args.checkpoint_every, args.details)
+    print(f"\n{stats['battles']} battles ({stats['errors']} errors, {stats['resumed']} already done) "
+          f"in {stats['elapsed']:.2f}s")
+    print(f"Throughput: {stats['throughput']:.1f} battles/s")
+    print(f"Latency p50: {stats['p50'] * 1000:.1f} ms  p99: {stats['p99'] * 1000:.1f} ms")
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+from battle.records import EMPTY_MAPPING, freeze, thaw
+
+# Score multiplier of each agent voting_style
+STYLE_MULTIPLIERS = {
+    "generous": 1.2,
+    "moderate": 1.0,
+    "conservative": 0.8
+}
+
+DEFAULT_BATTLE_CONFIG: Dict[str, Any] = {
+    "voting_weights": {
+        "recommendations": 1.0,
+        "benefits": 0.5,
+        "risks": -0.3,
+        "implementation": 0.7
+    },
+    "agents": {
+        "Pragmatic Pete": {
+            "focus_areas": ["Business value", "ROI", "Market analysis", "Cost-benefit analysis"],
+            "biases": ["Favors proven solutions", "Prioritizes immediate business value"],
+            "voting_style": "generous"  # generous, moderate, conservative
+        },
+        "Innovative Izzy": {
+            "focus_areas": ["Cutting-edge technology", "User experience", "Future-proofing"],
+            "biases": ["Favors modern solutions", "Prioritizes user experience"],
+            "voting_style": "moderate"
+        },
+        "Risk-Averse Riley": {
+            "focus_areas": ["Security", "Reliability", "Compliance", "Risk mitigation"],
+            "biases": ["Favors proven security patterns", "Prioritizes stability"],
+            "voting_style": "conservative"
+        },
+        "Scalable Sam": {
+            "focus_areas": ["System architecture", "Performance", "Resource optimization"],
+            "biases": ["Favors scalable solutions", "Prioritizes performance"],
+            "voting_style": "moderate"
+        },
+        "Senior Dev Sam": {
+            "focus_areas": ["Code quality", "Technical debt", "Best practices"],
+            "biases": ["Favors maintainable code", "Prioritizes best practices"],
+            "voting_style": "conservative"
+        }
+    }
+}
+
+
+def merge_config(defaults: Mapping[str, Any], user_config: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Merge a user configuration into a deep copy of the defaults"""
+    config = thaw(defaults)
+    user_config = user_config or {}
+    if "voting_weights" in user_config:
+        config["voting_weights"].update(user_config["voting_weights"])
+
+    if "agents" in user_config:
+        for agent_name, agent_config in user_config["agents"].items():
+            if agent_name in config["agents"]:
+                config["agents"][agent_name].update(agent_config)
+    return config
+
+
+def content_hash(config: Mapping[str, Any]) -> str:
+    """Hash the merged configuration, independent of key order and file formatting"""
+    payload = json.dumps(thaw(config), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AgentConfig(NamedTuple):
+    """Pre-resolved, read-only configuration of one agent"""
+
+    name: str
+    voting_style: str = "moderate"
+    style_multiplier: float = 1.0
+    settings: Mapping[str, Any] = EMPTY_MAPPING
+
+    @classmethod
+    def resolve(cls, name: str, settings: Mapping[str, Any]) -> "AgentConfig":
+        voting_style = settings.get("voting_style", "moderate")
+        return cls(name, voting_style, STYLE_MULTIPLIERS.get(voting_style, 1.0), settings)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a private, mutable copy of the agent's settings for its constructor"""
+        return thaw(self.settings)
+
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    file_hash: str
+    config: "BattleConfig"
+
+
+class BattleConfig:
+    """Immutable battle configuration: the defaults merged with an optional YAML file
+
+    ``BattleConfig.load(path)`` parses a file once per process and hands out the
+    same frozen instance until the file's mtime and content change, and
+    ``reload()`` returns the current instance for the same file. Instances
+    pickle as their merged data, so a parsed config can be sent to worker
+    processes instead of a path.
+    """
+
+    _cache: Dict[Optional[str], _CacheEntry] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, config_file: Optional[str] = None):
+        shared = BattleConfig.load(config_file)
+        self._adopt(shared.config, shared.config_file, shared.content_hash, shared.agents)
+
+    def _adopt(self, config: Mapping[str, Any], config_file: Optional[str], digest: str,
+               agents: Mapping[str, AgentConfig]) -> None:
+        self.config = config
+        self.config_file = config_file
+        self.content_hash = digest
+        self.agents = agents
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any], config_file: Optional[str] = None) -> "BattleConfig":
+        """Freeze an already merged configuration"""
+        frozen = freeze(thaw(config))
+        instance = cls.__new__(cls)
+        agents = MappingProxyType({
+            name: AgentConfig.resolve(name, settings) for name, settings in frozen["agents"].items()
+        })
+        instance._adopt(frozen, config_file, content_hash(frozen), agents)
+        return instance
+
+    @classmethod
+    def load(cls, config_file: Optional[str] = None) -> "BattleConfig":
+        """Get the shared config for a file, parsing it only when it changed"""
+        key = os.path.abspath(config_file) if config_file else None
+        try:
+            stat = os.stat(key) if key else None
+        except OSError:
+            stat = None
+        with cls._cache_lock:
+            entry = cls._cache.get(key)
+            if stat is None:
+                # No file: the defaults, still bound to the path so a reload picks the file up
+                if entry is None or entry.mtime_ns != -1:
+                    entry = _CacheEntry(-1, -1, "", cls.from_dict(DEFAULT_BATTLE_CONFIG, config_file))
+                    cls._cache[key] = entry
+                return entry.config
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                return entry.config
+
+            with open(key, "rb") as f:
+                raw = f.read()
+            file_hash = hashlib.sha256(raw).hexdigest()
+            if entry is not None and entry.file_hash == file_hash:
+                config = entry.config  # Touched but not edited
+            else:
+                import yaml  # Only paid by processes that actually parse a file
+
+                config = cls.from_dict(merge_config(DEFAULT_BATTLE_CONFIG, yaml.safe_load(raw)), config_file)
+            cls._cache[key] = _CacheEntry(stat.st_mtime_ns, stat.st_size, file_hash, config)
+            return config
+
+    def reload(self) -> "BattleConfig":
+        """Get the current config for this file; returns self when nothing changed"""
+        current = BattleConfig.load(self.config_file)
+        return self if current.content_hash == self.content_hash else current
+
+    @property
+    def default_config(self) -> Mapping[str, Any]:
+        return freeze(DEFAULT_BATTLE_CONFIG)
+
+    def agent(self, agent_name: str) -> AgentConfig:
+        """Get the pre-resolved view of one agent's configuration"""
+        view = self.agents.get(agent_name)
+        return view if view is not None else AgentConfig(agent_name)
+
+    def get_agent_config(self, agent_name: str) -> Dict[str, Any]:
+        """Get configuration for a specific agent"""
+        return self.agent(agent_name).to_dict()
+
+    def get_voting_weights(self) -> Mapping[str, float]:
+        """Get the voting weights configuration"""
+        return self.config["voting_weights"]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (BattleConfig.from_dict, (thaw(self.config), self.config_file))
+
+    def __repr__(self) -> str:
+        return f"BattleConfig(config_file={self.config_file!r}, content_hash={self.content_hash[:12]!r})"
@@ -1,14 +1,40 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from agents.base_expert import BaseExpert
+from agents.thoughts import Thought
+from battle.analysis_store import AnalysisStore
+from battle.convergence import ConvergenceDetector
+from battle.executor import AgentExecutor, SequentialExecutor
+from battle.records import AgentResult, BattleResult, Rebuttal
+from battle.events import (
+    BattleEvent, AnalysisReady, RebuttalReady, ClarificationNeeded, BattleComplete, collect
+)
+from telemetry.tracing import TRACER, span
+
+def rebuttal_points(rebuttal: Any) -> List[str]:
+    """Flatten a rebuttal (list, dict of lists or str) into a list of points"""
+    return list(Rebuttal.from_any(rebuttal).points)
 
 class BattleManager:
-    def __init__(self, agents: List[BaseExpert] = None):
-        """Initialize BattleManager with optional list of agents"""
+    def __init__(self, agents: List[BaseExpert] = None, executor: AgentExecutor = None,
+                 convergence_threshold: Optional[float] = None, min_rounds: Optional[int] = None):
+        """Initialize BattleManager with optional list of agents and phase executor
+
+        Rebuttal rounds stop early once they converge to ``convergence_threshold``
+        similarity, after at least ``min_rounds``; see ConvergenceDetector.
+        """
         self.agents = agents or []
+        self.executor = executor or SequentialExecutor()
+        self.convergence_threshold = convergence_threshold
+        self.min_rounds = min_rounds
         self.problem = ""
         self.current_round = 0
         self.thought_process = []
         self.full_conversation = []
+        self.analysis_store = AnalysisStore()
+        # Rebuttals of the last battle per agent, keyed on what each one depended on
+        self._rebuttals: Dict[str, Dict[Tuple[Any, ...], Tuple[Rebuttal, int]]] = {}
+        self.rebuttal_compute_count = 0
+        self.rebuttal_hit_count = 0
 
     def add_agent(self, agent: BaseExpert):
         """Add an agent to the battle"""
@@ -20,9 +46,12 @@ class BattleManager:
         self.current_round = 0
         self.thought_process = []
         self.full_conversation = []
+        self.analysis_store = AnalysisStore()
+        self._rebuttals = {}
+        self.rebuttal_compute_count = 0
+        self.rebuttal_hit_count = 0
         for agent in self.agents:
-            agent.conversation_history = []
-            agent.interaction_history = []
+            agent.reset()
 
     def run_battle(self, problem: str) -> Dict[str, Dict[str, List[str]]]:
         """Run a battle with all agents and return structured analysis"""
@@ -30,10 +59,10 @@ class BattleManager:
         self.problem = problem
         battle_results = {}
 
-        for agent in self.agents:
-            # Get agent's analysis
-            analysis = agent.generate_analysis(problem)
-            
+        analyses = self.executor.map(
+            lambda agent: self.analysis_store.get_analysis(agent, problem), self.agents
+        )
+        for agent, analysis in zip(self.agents, analyses):
             # Store structured results
             battle_results[agent.name] = {
                 "pros": analysis.get("pros", []),
@@ -44,93 +73,148 @@ class BattleManager:
 
         return battle_results
 
-    def run_battle_with_rebuttals(self, problem: str, max_rounds: int = 3) -> Dict[str, Dict[str, Any]]:
+    def run_battle_with_rebuttals(self, problem: str, max_rounds: int = 3,
+                                  incremental: bool = False) -> Dict[str, Dict[str, Any]]:
         """Run a battle with multiple rounds of rebuttals"""
+        return collect(self.iter_battle_with_rebuttals(problem, max_rounds, incremental))
+
+    def iter_battle_with_rebuttals(self, problem: str, max_rounds: int = 3,
+                                   incremental: bool = False) -> Iterator[BattleEvent]:
+        """Run a battle with multiple rounds of rebuttals, yielding events as agents finish
+
+        The last event is always a BattleComplete carrying the same dict that
+        run_battle_with_rebuttals returns. With ``incremental``, analyses and
+        rebuttals of the previous battle are reused for every agent whose
+        inputs did not change, e.g. when re-running after a clarification.
+        The result is the same as a full run.
+        """
+        with span("BattleManager.run_battle_with_rebuttals", "battle",
+                  agents=len(self.agents), rounds=max_rounds, incremental=incremental):
+            yield from self._iter_rounds(problem, max_rounds, incremental)
+
+    def _rebuttal_key(self, agent: BaseExpert) -> Tuple[Any, ...]:
+        """Key a rebuttal on the agent's round counter and the analyses it reads"""
+        return (agent.current_round,) + tuple(
+            self.analysis_store.get_fingerprint(other) for other in self.agents if other != agent
+        )
+
+    def _iter_rounds(self, problem: str, max_rounds: int, incremental: bool = False) -> Iterator[BattleEvent]:
+        store, previous_rebuttals = self.analysis_store, self._rebuttals
         self.clear_state()
+        if incremental:
+            self.analysis_store = store
+            store.reset_stats()
+        else:
+            previous_rebuttals = {}
         self.problem = problem
-        results = {}
+        convergence = ConvergenceDetector(self.convergence_threshold, self.min_rounds)
+        analyses: Dict[str, Dict[str, Any]] = {}
+        rounds: Dict[str, List[Tuple[str, ...]]] = {}
+        thoughts: Dict[str, List[Any]] = {}
         
         # Initialize results structure for each agent
-        for agent in self.agents:
-            results[agent.name] = {
-                "analysis": agent.generate_analysis(problem),
-                "rebuttals": {"Round 1": []},
-                "thought_process": []
-            }
-            # Add initial thought process
-            results[agent.name]["thought_process"].extend(results[agent.name]["analysis"].get("thought_process", []))
+        with span("analysis", "phase", agents=len(self.agents)):
+            agent_analyses = self.executor.imap(
+                lambda agent: self.analysis_store.get_analysis(agent, problem), self.agents
+            )
+            for agent, analysis in zip(self.agents, agent_analyses):
+                analyses[agent.name] = analysis
+                rounds[agent.name] = []
+                # Add initial thought process
+                thoughts[agent.name] = list(analysis.get("thought_process", []))
+                yield AnalysisReady(agent.name, analysis)
         
         # Check if any agent needs clarification
         for agent in self.agents:
             if agent.needs_clarification():
-                return {
-                    "status": "needs_clarification",
-                    "questions": agent.get_clarifying_questions(),
-                    "agent": agent.name,
-                    "current_results": results
-                }
+                yield ClarificationNeeded(agent.name, agent.get_clarifying_questions())
+                yield self._complete("needs_clarification", analyses, rounds, thoughts,
+                                     agent=agent.name, questions=agent.get_clarifying_questions())
+                return
         
         # Run rebuttal rounds
+        rounds_run = 0
         for round_num in range(1, max_rounds + 1):
             self.current_round = round_num
-            round_key = f"Round {round_num}"
+            rounds_run = round_num
             
-            # If this is not the first round, initialize the round
-            if round_num > 1:
-                for agent in self.agents:
-                    if round_key not in results[agent.name]["rebuttals"]:
-                        results[agent.name]["rebuttals"][round_key] = []
-            
-            # Collect rebuttals from each agent
-            for agent in self.agents:
-                other_analyses = {
-                    other.name: other.generate_analysis(problem)
-                    for other in self.agents
-                    if other != agent
+            # Collect rebuttals from each agent, reusing the stored analyses
+            with span("rebuttal", "phase", round=round_num) as round_span:
+                keys = {agent.name: self._rebuttal_key(agent) for agent in self.agents}
+                reused = {
+                    agent.name: previous_rebuttals[agent.name][keys[agent.name]]
+                    for agent in self.agents
+                    if keys[agent.name] in previous_rebuttals.get(agent.name, {})
                 }
-                
-                rebuttal = agent.generate_rebuttal(other_analyses)
-                
-                # Add thought process to results
-                results[agent.name]["thought_process"].extend(rebuttal.get("thought_process", []))
-                
-                # Ensure rebuttal is properly structured
-                if isinstance(rebuttal, list):
-                    results[agent.name]["rebuttals"][round_key] = rebuttal
-                elif isinstance(rebuttal, dict):
-                    # Convert dict rebuttal to list of strings
-                    rebuttal_list = []
-                    for key, value in rebuttal.items():
-                        if key != "thought_process":  # Skip thought process as it's already added
-                            if isinstance(value, list):
-                                rebuttal_list.extend(value)
-                            else:
-                                rebuttal_list.append(str(value))
-                    results[agent.name]["rebuttals"][round_key] = rebuttal_list
-                else:
-                    # Handle string rebuttal
-                    results[agent.name]["rebuttals"][round_key] = [str(rebuttal)]
+                rebuttals = self.executor.imap(
+                    lambda agent: agent.generate_rebuttal(
+                        self.analysis_store.other_snapshots(agent, self.agents, problem)
+                    ),
+                    [agent for agent in self.agents if agent.name not in reused]
+                )
+                for agent in self.agents:
+                    if agent.name in reused:
+                        record, agent.current_round = reused[agent.name]
+                        self.rebuttal_hit_count += 1
+                    else:
+                        record = Rebuttal.from_any(next(rebuttals))
+                        self.rebuttal_compute_count += 1
+                    self._rebuttals.setdefault(agent.name, {})[keys[agent.name]] = (record, agent.current_round)
+                    
+                    # Add thought process to results
+                    thoughts[agent.name].extend(record.thought_process)
+                    rounds[agent.name].append(record.points)
+                    yield RebuttalReady(agent.name, round_num, record.points, record.thought_process)
+                # Fingerprinting every agent's points only pays off for detection or a trace
+                if convergence.enabled or TRACER.enabled:
+                    round_span.set(similarity=convergence.update(
+                        {agent.name: rounds[agent.name][-1] for agent in self.agents}
+                    ))
             
             # After each round, check if any agent needs clarification
             for agent in self.agents:
                 if agent.needs_clarification():
-                    return {
-                        "status": "needs_clarification",
-                        "questions": agent.get_clarifying_questions(),
-                        "agent": agent.name,
-                        "current_results": results,
-                        "round": round_num
-                    }
+                    yield ClarificationNeeded(agent.name, agent.get_clarifying_questions(), round_num)
+                    yield self._complete("needs_clarification", analyses, rounds, thoughts,
+                                         agent=agent.name, questions=agent.get_clarifying_questions(),
+                                         round=round_num)
+                    return
+            
+            # Stop once the rounds have stopped changing
+            if convergence.converged():
+                break
         
         # Add final thought process summary
         for agent in self.agents:
-            results[agent.name]["thought_process"].append(
-                f"{agent.name} completed all rounds of analysis and rebuttals"
-            )
+            if rounds_run < max_rounds:
+                thought = Thought(agent.name, "{agent} stopped after round {round} as rebuttals converged",
+                                  round=rounds_run)
+            else:
+                thought = Thought(agent.name, "{agent} completed all rounds of analysis and rebuttals")
+            thoughts[agent.name].append(thought)
         
+        yield self._complete("completed", analyses, rounds, thoughts,
+                             rounds_run=rounds_run, rounds_saved=max_rounds - rounds_run)
+
+    def _complete(self, status: str, analyses: Dict[str, Dict[str, Any]],
+                  rounds: Dict[str, List[Tuple[str, ...]]], thoughts: Dict[str, List[Any]],
+                  **details: Any) -> BattleComplete:
+        """Freeze the battle state into a BattleResult and wrap it with its dict form in an event"""
+        record = BattleResult(
+            status,
+            {
+                name: AgentResult(analysis, tuple(rounds[name]), tuple(thoughts[name]))
+                for name, analysis in analyses.items()
+            },
+            **details
+        )
+        return BattleComplete(record.to_dict(), record)
+
+    def get_reuse_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get how many analyses and rebuttals the last battle computed and reused"""
         return {
-            "status": "completed",
-            "results": results
+            "analyses": self.analysis_store.get_stats(),
+            "rebuttals": {"computed": self.rebuttal_compute_count, "reused": self.rebuttal_hit_count}
         }
 
     def get_thought_process(self) -> List[str]:
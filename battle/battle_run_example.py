@@ -1,73 +1,18 @@
-from agents.pragmatic_pete import PragmaticPete
-from agents.innovative_izzy import InnovativeIzzy
-from agents.risk_averse_riley import RiskAverseRiley
-from agents.scalable_sam import ScalableSam
-from agents.senior_dev_sam import SeniorDevSam
-from typing import List, Dict, Any, Optional
-import yaml
-import os
-
-class BattleConfig:
-    def __init__(self, config_file: Optional[str] = None):
-        self.default_config = {
-            "voting_weights": {
-                "recommendations": 1.0,
-                "benefits": 0.5,
-                "risks": -0.3,
-                "implementation": 0.7
-            },
-            "agents": {
-                "Pragmatic Pete": {
-                    "focus_areas": ["Business value", "ROI", "Market analysis", "Cost-benefit analysis"],
-                    "biases": ["Favors proven solutions", "Prioritizes immediate business value"],
-                    "voting_style": "generous"  # generous, moderate, conservative
-                },
-                "Innovative Izzy": {
-                    "focus_areas": ["Cutting-edge technology", "User experience", "Future-proofing"],
-                    "biases": ["Favors modern solutions", "Prioritizes user experience"],
-                    "voting_style": "moderate"
-                },
-                "Risk-Averse Riley": {
-                    "focus_areas": ["Security", "Reliability", "Compliance", "Risk mitigation"],
-                    "biases": ["Favors proven security patterns", "Prioritizes stability"],
-                    "voting_style": "conservative"
-                },
-                "Scalable Sam": {
-                    "focus_areas": ["System architecture", "Performance", "Resource optimization"],
-                    "biases": ["Favors scalable solutions", "Prioritizes performance"],
-                    "voting_style": "moderate"
-                },
-                "Senior Dev Sam": {
-                    "focus_areas": ["Code quality", "Technical debt", "Best practices"],
-                    "biases": ["Favors maintainable code", "Prioritizes best practices"],
-                    "voting_style": "conservative"
-                }
-            }
-        }
-        
-        self.config = self.default_config.copy()
-        if config_file and os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                user_config = yaml.safe_load(f)
-                self._merge_configs(user_config)
-    
-    def _merge_configs(self, user_config: Dict[str, Any]) -> None:
-        """Merge user configuration with defaults"""
-        if "voting_weights" in user_config:
-            self.config["voting_weights"].update(user_config["voting_weights"])
-        
-        if "agents" in user_config:
-            for agent_name, agent_config in user_config["agents"].items():
-                if agent_name in self.config["agents"]:
-                    self.config["agents"][agent_name].update(agent_config)
-    
-    def get_agent_config(self, agent_name: str) -> Dict[str, Any]:
-        """Get configuration for a specific agent"""
-        return self.config["agents"].get(agent_name, {})
-    
-    def get_voting_weights(self) -> Dict[str, float]:
-        """Get the voting weights configuration"""
-        return self.config["voting_weights"]
+from battle.agent_pool import shared_pool
+from battle.battle_config import BattleConfig
+from battle.context_builder import ContextBuilder
+from battle.executor import AgentExecutor, SequentialExecutor
+from battle.dag import DagNode, DagScheduler
+from battle.scoring import ScoringEngine
+from battle.battle_manager import rebuttal_points
+from battle.records import Solution
+from battle.events import (
+    BattleEvent, AnalysisReady, RebuttalReady, SolutionReady, VoteCast, BattleComplete
+)
+from config.settings import BATTLE_SCHEDULER
+from telemetry.tracing import span
+from functools import partial
+from typing import List, Dict, Any, Optional, Iterator, Union
 
 def format_list(items: List[str], indent: int = 4) -> str:
     """Format a list of items with proper indentation"""
@@ -75,13 +20,16 @@ def format_list(items: List[str], indent: int = 4) -> str:
         return "None"
     return "\n".join(" " * indent + "- " + item for item in items)
 
-def calculate_solution_score(agent_suggestions: List[str], other_solution: Dict[str, Any], 
+def calculate_solution_score(agent_suggestions: List[str], other_solution: Union[Dict[str, Any], Solution],
                            weights: Dict[str, float], voting_style: str) -> float:
     """Calculate how well a solution aligns with an agent's suggestions"""
     score = 0.0
     if not other_solution:
         return score
         
+    # Normalize list- or dict-valued categories once
+    solution = Solution.coerce(other_solution)
+    
     # Convert suggestions and solution elements to lowercase for comparison
     agent_suggestions_lower = [s.lower() for s in agent_suggestions]
     
@@ -93,11 +41,7 @@ def calculate_solution_score(agent_suggestions: List[str], other_solution: Dict[
     }.get(voting_style, 1.0)
     
     # Check recommendations alignment
-    recommendations = []
-    if isinstance(other_solution.get('recommendations'), list):
-        recommendations = [r.lower() for r in other_solution['recommendations']]
-    elif isinstance(other_solution.get('recommendations'), dict):
-        recommendations = [str(v).lower() for v in other_solution['recommendations'].values()]
+    recommendations = [item.lower() for item in solution.recommendations]
     
     for suggestion in agent_suggestions_lower:
         for rec in recommendations:
@@ -106,11 +50,7 @@ def calculate_solution_score(agent_suggestions: List[str], other_solution: Dict[
                 break
     
     # Check benefits alignment
-    benefits = []
-    if isinstance(other_solution.get('benefits'), list):
-        benefits = [b.lower() for b in other_solution['benefits']]
-    elif isinstance(other_solution.get('benefits'), dict):
-        benefits = [str(v).lower() for v in other_solution['benefits'].values()]
+    benefits = [item.lower() for item in solution.benefits]
     
     for suggestion in agent_suggestions_lower:
         for benefit in benefits:
@@ -119,11 +59,7 @@ def calculate_solution_score(agent_suggestions: List[str], other_solution: Dict[
                 break
     
     # Check risks alignment
-    risks = []
-    if isinstance(other_solution.get('risks'), list):
-        risks = [r.lower() for r in other_solution['risks']]
-    elif isinstance(other_solution.get('risks'), dict):
-        risks = [str(v).lower() for v in other_solution['risks'].values()]
+    risks = [item.lower() for item in solution.risks]
     
     for suggestion in agent_suggestions_lower:
         for risk in risks:
@@ -132,8 +68,8 @@ def calculate_solution_score(agent_suggestions: List[str], other_solution: Dict[
                 break
     
     # Check implementation alignment
-    implementation = other_solution.get('implementation', {})
-    if isinstance(implementation, dict):
+    implementation = solution.implementation
+    if implementation is not None:
         complexity = str(implementation.get('complexity', '')).lower()
         time_to_market = str(implementation.get('time_to_market', '')).lower()
         if 'simple' in complexity or 'fast' in time_to_market:
@@ -141,143 +77,318 @@ def calculate_solution_score(agent_suggestions: List[str], other_solution: Dict[
     
     return score
 
-def run_battle(problem: str, config: Optional[BattleConfig] = None) -> None:
-    """Run a battle between all agents"""
+def iter_battle(problem: str, config: Optional[BattleConfig] = None,
+                executor: Optional[AgentExecutor] = None,
+                agents: Optional[List[Any]] = None, scheduler: Optional[str] = None) -> Iterator[BattleEvent]:
+    """Run a battle between all agents, yielding an event as each agent finishes a phase
+
+    Without ``agents`` a warm set is checked out of the config's shared
+    AgentPool for the battle. Pass ``agents`` (built from the same config) to
+    manage agent instances yourself. ``scheduler`` is ``"phases"`` (every
+    phase waits for the previous one to finish) or ``"dag"`` (each agent's
+    work starts as soon as the results it reads are ready, so events of
+    different phases interleave); it defaults to BATTLE_SCHEDULER. Both give
+    the same result.
+    """
     if config is None:
         config = BattleConfig()
+    if executor is None:
+        executor = SequentialExecutor()
+    scheduler = scheduler or BATTLE_SCHEDULER
+    if scheduler not in SCHEDULERS:
+        raise ValueError(f"Battle scheduler {scheduler} not supported")
+    run = SCHEDULERS[scheduler]
     
-    # Initialize agents with configuration
-    agents = [
-        PragmaticPete("Pragmatic Pete", config.get_agent_config("Pragmatic Pete")),
-        InnovativeIzzy("Innovative Izzy", config.get_agent_config("Innovative Izzy")),
-        RiskAverseRiley("Risk-Averse Riley", config.get_agent_config("Risk-Averse Riley")),
-        ScalableSam("Scalable Sam", config.get_agent_config("Scalable Sam")),
-        SeniorDevSam("Senior Dev Sam", config.get_agent_config("Senior Dev Sam"))
-    ]
-    
-    # Get voting weights
-    weights = config.get_voting_weights()
+    if agents is None:
+        with shared_pool(config).lease() as agents:
+            yield from run(problem, config, executor, agents)
+    else:
+        yield from run(problem, config, executor, agents)
+
+def _analysis_entry(analysis: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Keep the analysis categories the other phases read"""
+    return {
+        "pros": analysis.get("pros", []),
+        "cons": analysis.get("cons", []),
+        "risks": analysis.get("risks", []),
+        "suggestions": analysis.get("suggestions", []),
+        "summary": analysis.get("summary", [])
+    }
+
+def _rebut(agent: Any, other_agent: Any, analyses: Dict[str, Dict[str, List[str]]]) -> List[str]:
+    """Get an agent's rebuttal points against one other agent's analysis"""
+    # Pass only the specific agent's analysis
+    return rebuttal_points(agent.generate_rebuttal({other_agent.name: analyses[other_agent.name]}))
+
+def _solve(agent: Any, problem: str, analyses: Dict[str, Dict[str, List[str]]],
+           agent_rebuttals: Dict[str, str], context_builder: ContextBuilder) -> Dict[str, Any]:
+    """Generate an agent's solution from the others' analyses and its own rebuttals"""
+    other_analyses, agent_rebuttals = context_builder.build(
+        agent.focus_areas,
+        {name: analysis for name, analysis in analyses.items() if name != agent.name},
+        agent_rebuttals
+    )
+    context = {
+        "technical_analysis": agent.analyze_problem(problem),
+        "other_analyses": other_analyses,
+        "rebuttals": agent_rebuttals,
+        "persona": agent.persona
+    }
+    return agent.generate_solution(problem, context)
+
+def _score(agents: List[Any], config: BattleConfig, analyses: Dict[str, Dict[str, List[str]]],
+           solutions: Dict[str, Solution]) -> Any:
+    """Score every voter against every candidate in one batched pass"""
+    return ScoringEngine(config.get_voting_weights()).score_matrix(
+        [analyses[voter.name]['suggestions'] for voter in agents],
+        [solutions[candidate.name] for candidate in agents],
+        [config.agent(voter.name).voting_style for voter in agents]
+    )
+
+def _iter_votes(agents: List[Any], scores: Any, votes: Dict[str, float]) -> Iterator[BattleEvent]:
+    """Add each voter's scores to the candidates' votes, yielding every vote cast"""
+    for i, voter in enumerate(agents):
+        for j, candidate in enumerate(agents):
+            if voter != candidate:
+                score = float(scores[i, j])
+                votes[candidate.name] += score
+                yield VoteCast(voter.name, candidate.name, score)
+
+def _complete(analyses: Dict[str, Dict[str, List[str]]], rebuttals: Dict[str, Dict[str, str]],
+              solutions: Dict[str, Solution], votes: Dict[str, float],
+              context_builder: ContextBuilder) -> BattleComplete:
+    """Determine the winner(s) and wrap the battle result in its event"""
+    max_votes = max(votes.values())
+    winners = [name for name, vote_count in votes.items() if abs(vote_count - max_votes) < 0.1]
     
+    return BattleComplete({
+        "analyses": analyses,
+        "rebuttals": rebuttals,
+        "solutions": {name: solution.to_dict() for name, solution in solutions.items()},
+        "votes": votes,
+        "winners": winners,
+        "context_tokens": context_builder.get_stats()
+    })
+
+def _iter_phases(problem: str, config: BattleConfig, executor: AgentExecutor,
+                 agents: List[Any]) -> Iterator[BattleEvent]:
+    """Run every battle phase with the given agent set, one phase after another"""
     # Collect initial analyses
     analyses: Dict[str, Dict[str, List[str]]] = {}
-    print("\n=== Initial Analyses ===")
-    for agent in agents:
-        # Use generate_analysis instead of analyze_problem directly
-        analysis = agent.generate_analysis(problem)
-        analyses[agent.name] = {
-            "pros": analysis.get("pros", []),
-            "cons": analysis.get("cons", []),
-            "risks": analysis.get("risks", []),
-            "suggestions": analysis.get("suggestions", []),
-            "summary": analysis.get("summary", [])
-        }
-        print(f"\n{agent.name}'s Analysis:")
-        print("Pros:")
-        print(format_list(analysis['pros']))
-        print("Cons:")
-        print(format_list(analysis['cons']))
-        print("Risks:")
-        print(format_list(analysis['risks']))
-        print("Suggestions:")
-        print(format_list(analysis['suggestions']))
-        if "summary" in analysis:
-            print("\nSummary:")
-            print(format_list(analysis['summary']))
+    # Use generate_analysis instead of analyze_problem directly
+    with span("analysis", "phase", agents=len(agents)):
+        agent_analyses = executor.imap(lambda agent: agent.generate_analysis(problem), agents)
+        for agent, analysis in zip(agents, agent_analyses):
+            analyses[agent.name] = _analysis_entry(analysis)
+            yield AnalysisReady(agent.name, analysis)
     
     # Generate rebuttals
-    print("\n=== Rebuttals ===")
     rebuttals: Dict[str, Dict[str, str]] = {}
-    for agent in agents:
-        rebuttals[agent.name] = {}
-        other_agents = [a for a in agents if a != agent]
-        for other_agent in other_agents:
-            # Pass only the specific agent's analysis
-            rebuttal = agent.generate_rebuttal(analyses[other_agent.name])
-            if rebuttal.strip():  # Only show non-empty rebuttals
-                rebuttals[agent.name][other_agent.name] = rebuttal
-                print(f"\n{agent.name} responds to {other_agent.name}:")
-                print(rebuttal)
-    
-    # Generate solutions and collect votes
-    print("\n=== Solutions and Voting ===")
-    solutions: Dict[str, Dict[str, Any]] = {}
-    votes: Dict[str, float] = {agent.name: 0.0 for agent in agents}
+
+    def collect_rebuttals(agent) -> Dict[str, List[str]]:
+        agent_rebuttals = {}
+        for other_agent in agents:
+            if other_agent == agent:
+                continue
+            points = _rebut(agent, other_agent, analyses)
+            if "\n".join(points).strip():  # Only keep non-empty rebuttals
+                agent_rebuttals[other_agent.name] = points
+        return agent_rebuttals
+
+    with span("rebuttal", "phase", round=1):
+        for agent, agent_rebuttals in zip(agents, executor.imap(collect_rebuttals, agents)):
+            rebuttals[agent.name] = {}
+            for other_name, points in agent_rebuttals.items():
+                rebuttals[agent.name][other_name] = "\n".join(points)
+                yield RebuttalReady(agent.name, 1, points, target=other_name)
     
-    # First, generate all solutions
-    for agent in agents:
-        context = {
-            "technical_analysis": agent.analyze_problem(problem),
-            "other_analyses": {name: analysis for name, analysis in analyses.items() if name != agent.name},
-            "rebuttals": rebuttals.get(agent.name, {}),
-            "persona": agent.persona
-        }
-        solution = agent.generate_solution(problem, context)
-        solutions[agent.name] = {
-            "recommendations": solution.get("recommendations", []),
-            "benefits": solution.get("benefits", []),
-            "risks": solution.get("risks", []),
-            "implementation": solution.get("implementation", {})
-        }
-        print(f"\n{agent.name}'s Solution:")
-        print("Recommendations:")
-        print(format_list(solution.get('recommendations', [])))
+    # Generate all solutions
+    solutions: Dict[str, Solution] = {}
+    # Every agent sees the others' points, so keep each context within the model's token budget
+    context_builder = ContextBuilder()
+
+    with span("solution", "phase") as trace:
+        solve = lambda agent: _solve(agent, problem, analyses, rebuttals.get(agent.name, {}), context_builder)
+        for agent, solution in zip(agents, executor.imap(solve, agents)):
+            solutions[agent.name] = Solution.from_dict(solution)
+            yield SolutionReady(agent.name, solutions[agent.name].to_dict())
+        trace.set(**context_builder.get_stats())
     
     # Then, have each agent vote based on alignment with their suggestions
-    print("\nVoting Process:")
-    for voter in agents:
-        voter_suggestions = analyses[voter.name]['suggestions']
-        voter_config = config.get_agent_config(voter.name)
-        voting_style = voter_config.get('voting_style', 'moderate')
-        
-        for candidate in agents:
-            if voter != candidate:
-                score = calculate_solution_score(
-                    voter_suggestions, 
-                    solutions[candidate.name],
-                    weights,
-                    voting_style
-                )
-                votes[candidate.name] += score
-                if score > 0:
-                    print(f"{voter.name} gives {score:.1f} points to {candidate.name}")
-    
-    # Print results
-    print("\n=== Final Results ===")
-    print("\nVoting Results:")
-    # Sort by vote count
-    sorted_votes = sorted(votes.items(), key=lambda x: x[1], reverse=True)
-    for agent_name, vote_count in sorted_votes:
-        print(f"{agent_name}: {vote_count:.1f} points")
-    
-    # Determine winner(s)
-    max_votes = max(votes.values())
-    winners = [name for name, vote_count in votes.items() if abs(vote_count - max_votes) < 0.1]
+    votes: Dict[str, float] = {agent.name: 0.0 for agent in agents}
+    with span("voting", "phase"):
+        yield from _iter_votes(agents, _score(agents, config, analyses, solutions), votes)
     
-    if len(winners) == 1:
-        print(f"\nWinner: {winners[0]}")
-        winning_solution = solutions[winners[0]]
-        print("\nWinning Recommendations:")
-        print(format_list(winning_solution.get('recommendations', [])))
-    else:
-        print(f"\nTie between: {', '.join(winners)}")
-        print("\nShared Recommendations:")
-        shared_recs = set()
-        for winner in winners:
-            recs = set(solutions[winner].get('recommendations', []))
-            if not shared_recs:
-                shared_recs = recs
+    yield _complete(analyses, rebuttals, solutions, votes, context_builder)
+
+def _iter_dag(problem: str, config: BattleConfig, executor: AgentExecutor,
+              agents: List[Any]) -> Iterator[BattleEvent]:
+    """Run the battle as a dependency graph instead of phase by phase
+
+    An agent's rebuttal of another agent waits only for that agent's
+    analysis, its solution for its own rebuttals, and voting for the
+    solutions. Each agent's calls keep the order the phased battle makes
+    them in, since agents are stateful, so the result is the same.
+    """
+    analyses: Dict[str, Dict[str, List[str]]] = {}
+    rebuttals: Dict[str, Dict[str, str]] = {agent.name: {} for agent in agents}
+    solutions: Dict[str, Solution] = {}
+    context_builder = ContextBuilder()
+    by_name = {agent.name: agent for agent in agents}
+
+    def solve(agent) -> Dict[str, Any]:
+        # Analyses arrive in completion order; contexts read them in agent order
+        return _solve(agent, problem, {name: analyses[name] for name in by_name},
+                      rebuttals[agent.name], context_builder)
+
+    nodes = [DagNode(("analysis", agent.name), partial(agent.generate_analysis, problem), agent=agent.name)
+             for agent in agents]
+    for agent in agents:
+        previous = ("analysis", agent.name)
+        for other_agent in agents:
+            if other_agent == agent:
+                continue
+            key = ("rebuttal", agent.name, other_agent.name)
+            nodes.append(DagNode(key, partial(_rebut, agent, other_agent, analyses),
+                                 (previous, ("analysis", other_agent.name)), agent.name))
+            previous = key
+        nodes.append(DagNode(
+            ("solution", agent.name),
+            partial(solve, agent),
+            (previous,) + tuple(("analysis", other.name) for other in agents if other != agent),
+            agent.name
+        ))
+    nodes.append(DagNode(("voting",), lambda: _score(agents, config, analyses, solutions),
+                         tuple(("solution", agent.name) for agent in agents)))
+
+    dag = DagScheduler(executor)
+    scores = None
+    with span("dag", "phase", agents=len(agents), nodes=len(nodes)) as trace:
+        for key, result in dag.run(nodes):
+            if key[0] == "analysis":
+                analyses[key[1]] = _analysis_entry(result)
+                yield AnalysisReady(key[1], result)
+            elif key[0] == "rebuttal":
+                if "\n".join(result).strip():  # Only keep non-empty rebuttals
+                    rebuttals[key[1]][key[2]] = "\n".join(result)
+                    yield RebuttalReady(key[1], 1, result, target=key[2])
+            elif key[0] == "solution":
+                solutions[key[1]] = Solution.from_dict(result)
+                yield SolutionReady(key[1], solutions[key[1]].to_dict())
             else:
-                shared_recs &= recs
-        print(format_list(list(shared_recs)))
+                scores = result
+        trace.set(**dag.get_stats(), **context_builder.get_stats())
+
+    # Report in agent order, as the phased battle does
+    analyses = {name: analyses[name] for name in by_name}
+    solutions = {name: solutions[name] for name in by_name}
+    votes: Dict[str, float] = {agent.name: 0.0 for agent in agents}
+    yield from _iter_votes(agents, scores, votes)
+    yield _complete(analyses, rebuttals, solutions, votes, context_builder)
+
+SCHEDULERS = {"phases": _iter_phases, "dag": _iter_dag}
+
+class BattlePrinter:
+    """Prints battle events to the console as they arrive"""
+
+    PHASE_HEADERS = [
+        (AnalysisReady, "\n=== Initial Analyses ==="),
+        (RebuttalReady, "\n=== Rebuttals ==="),
+        (SolutionReady, "\n=== Solutions and Voting ==="),
+        (VoteCast, "\nVoting Process:"),
+        (BattleComplete, "\n=== Final Results ===")
+    ]
+
+    def __init__(self):
+        self.phase = -1
+
+    def _enter_phase(self, event: BattleEvent) -> None:
+        """Print the headers of every phase up to the event's one"""
+        for index, (event_type, header) in enumerate(self.PHASE_HEADERS):
+            if isinstance(event, event_type):
+                if index < self.phase:
+                    # DAG-scheduled battles interleave phases; repeat the header on returning to one
+                    self.phase = index - 1
+                while self.phase < index:
+                    self.phase += 1
+                    print(self.PHASE_HEADERS[self.phase][1])
+                return
+
+    def handle(self, event: BattleEvent) -> None:
+        self._enter_phase(event)
+        if isinstance(event, AnalysisReady):
+            analysis = event.analysis
+            print(f"\n{event.agent}'s Analysis:")
+            print("Pros:")
+            print(format_list(analysis['pros']))
+            print("Cons:")
+            print(format_list(analysis['cons']))
+            print("Risks:")
+            print(format_list(analysis['risks']))
+            print("Suggestions:")
+            print(format_list(analysis['suggestions']))
+            if "summary" in analysis:
+                print("\nSummary:")
+                print(format_list(analysis['summary']))
+        elif isinstance(event, RebuttalReady):
+            print(f"\n{event.agent} responds to {event.target}:")
+            print("\n".join(event.points))
+        elif isinstance(event, SolutionReady):
+            print(f"\n{event.agent}'s Solution:")
+            print("Recommendations:")
+            print(format_list(event.solution.get('recommendations', [])))
+        elif isinstance(event, VoteCast):
+            if event.score > 0:
+                print(f"{event.voter} gives {event.score:.1f} points to {event.candidate}")
+        elif isinstance(event, BattleComplete):
+            self._print_results(event.result)
+
+    def _print_results(self, result: Dict[str, Any]) -> None:
+        votes = result["votes"]
+        winners = result["winners"]
+        solutions = result["solutions"]
+        print("\nVoting Results:")
+        # Sort by vote count
+        sorted_votes = sorted(votes.items(), key=lambda x: x[1], reverse=True)
+        for agent_name, vote_count in sorted_votes:
+            print(f"{agent_name}: {vote_count:.1f} points")
+        
+        if len(winners) == 1:
+            print(f"\nWinner: {winners[0]}")
+            winning_solution = solutions[winners[0]]
+            print("\nWinning Recommendations:")
+            print(format_list(winning_solution.get('recommendations', [])))
+        else:
+            print(f"\nTie between: {', '.join(winners)}")
+            print("\nShared Recommendations:")
+            shared_recs = set()
+            for winner in winners:
+                recs = set(solutions[winner].get('recommendations', []))
+                if not shared_recs:
+                    shared_recs = recs
+                else:
+                    shared_recs &= recs
+            print(format_list(list(shared_recs)))
+
+def run_battle(problem: str, config: Optional[BattleConfig] = None,
+               executor: Optional[AgentExecutor] = None, scheduler: Optional[str] = None) -> Dict[str, Any]:
+    """Run a battle between all agents, printing each result as soon as it is ready"""
+    printer = BattlePrinter()
+    result: Dict[str, Any] = {}
+    with span("battle_run_example.run_battle", "battle"):
+        for event in iter_battle(problem, config, executor, scheduler=scheduler):
+            printer.handle(event)
+            if isinstance(event, BattleComplete):
+                result = event.result
+    return result
 
 if __name__ == "__main__":
     print("Welcome to the AI Arena!")
     print("This battle system will analyze your product idea or feature using multiple AI agents.")
     print("Each agent will provide their unique perspective and vote on the best approach.")
     
-    # Check for configuration file
-    config_file = "battle_config.yaml"
-    config = BattleConfig(config_file) if os.path.exists(config_file) else None
+    # Use the configuration file when present, the defaults otherwise
+    config = BattleConfig.load("battle_config.yaml")
     
     problem = input("\nEnter a product idea or feature to analyze: ")
     try:
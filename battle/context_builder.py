@@ -0,0 +1,178 @@
+import math
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from agents.rebuttal_budget import terms
+from config.settings import DEFAULT_MODEL, MODEL_CONFIGS
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+
+@lru_cache(maxsize=None)
+def _encoder(model: str) -> Any:
+    """Get tiktoken's encoder for a model, or None when tiktoken is unavailable"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are fetched on first use; without them fall back to the estimate
+        return None
+
+
+@lru_cache(maxsize=8192)
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Count the tokens of a text with tiktoken, or estimate them when it is not installed
+
+    The estimate takes the larger of the word and punctuation count and one
+    token per four characters, which tends to overcount English slightly.
+    """
+    encoder = _encoder(model or DEFAULT_MODEL)
+    if encoder is not None:
+        return len(encoder.encode(text))
+    return max(len(_PIECE.findall(text)), math.ceil(len(text) / 4))
+
+
+def context_budget(model: Optional[str] = None) -> Optional[int]:
+    """Get the solution-context token budget configured for a model"""
+    return MODEL_CONFIGS.get(model or DEFAULT_MODEL, {}).get("context_tokens")
+
+
+class ContextItem(NamedTuple):
+    """One point of another agent's analysis or of a rebuttal"""
+
+    section: str
+    source: str
+    category: str
+    value: Any
+    tokens: int
+    relevance: int
+
+
+class ContextBuilder:
+    """Fits the other agents' analyses and the rebuttals of a solution context to a token budget
+
+    Every point is counted with ``count_tokens`` and ranked by how many of
+    the agent's focus-area terms it shares, with ties kept in their original
+    order. The most relevant points that fit the budget are kept in their
+    original order, and each list that lost points ends with a one-line
+    summary of how many were left out when that still fits. With no budget the
+    context is passed through unchanged and only counted. Token totals
+    accumulate across ``build`` calls, so one builder reports a whole battle.
+    """
+
+    def __init__(self, budget: Optional[int] = None, model: Optional[str] = None):
+        self.model = model or DEFAULT_MODEL
+        self.budget = budget if budget is not None else context_budget(self.model)
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.points_dropped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget is not None
+
+    def _items(self, focus_terms: frozenset, section: str,
+               groups: Dict[str, Dict[str, List[Any]]]) -> List[ContextItem]:
+        items = []
+        for source, categories in groups.items():
+            for category, values in categories.items():
+                for value in values:
+                    text = str(value)
+                    items.append(ContextItem(section, source, category, value,
+                                             count_tokens(text, self.model), len(terms(text) & focus_terms)))
+        return items
+
+    def _select(self, items: List[ContextItem]) -> List[int]:
+        """Pick the most relevant items that fit the budget, returned in their original order"""
+        ranked = sorted(range(len(items)), key=lambda index: -items[index].relevance)
+        kept, used = [], 0
+        for index in ranked:
+            if used + items[index].tokens <= self.budget:
+                kept.append(index)
+                used += items[index].tokens
+        return sorted(kept)
+
+    def build(self, focus_areas: Iterable[str], other_analyses: Dict[str, Dict[str, Any]],
+              rebuttals: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """Get the other agents' analyses and the rebuttals trimmed to the budget
+
+        Analyses map agent names to categories of points; non-list values are
+        passed through. Rebuttals map names to a list of points or to a
+        newline-joined string, and keep their shape.
+        """
+        focus_terms = frozenset().union(*(terms(area) for area in focus_areas))
+        analysis_groups = {
+            name: {category: values for category, values in analysis.items() if isinstance(values, list)}
+            for name, analysis in other_analyses.items()
+        }
+        rebuttal_groups = {
+            name: {"": points.split("\n") if isinstance(points, str) else list(points)}
+            for name, points in rebuttals.items()
+        }
+        items = self._items(focus_terms, "analysis", analysis_groups) + \
+            self._items(focus_terms, "rebuttal", rebuttal_groups)
+        total = sum(item.tokens for item in items)
+        if not self.enabled or total <= self.budget:
+            self._record(total, total, 0)
+            return other_analyses, rebuttals
+
+        kept_indexes = self._select(items)
+        used = sum(items[index].tokens for index in kept_indexes)
+        kept: Dict[Tuple[str, str, str], List[Any]] = {}
+        for index in kept_indexes:
+            item = items[index]
+            kept.setdefault((item.section, item.source, item.category), []).append(item.value)
+
+        # Note how much each list lost while the summaries still fit
+        dropped: Dict[Tuple[str, str, str], int] = {}
+        for item in items:
+            key = (item.section, item.source, item.category)
+            dropped[key] = dropped.get(key, 0) + 1
+        for key, values in kept.items():
+            dropped[key] -= len(values)
+        for key, count in dropped.items():
+            if not count:
+                continue
+            summary = f"({count} more point{'s' if count > 1 else ''} omitted)"
+            tokens = count_tokens(summary, self.model)
+            if used + tokens <= self.budget:
+                kept.setdefault(key, []).append(summary)
+                used += tokens
+        self._record(total, used, len(items) - len(kept_indexes))
+
+        trimmed_analyses = {
+            name: {
+                category: kept.get(("analysis", name, category), []) if isinstance(values, list) else values
+                for category, values in analysis.items()
+            }
+            for name, analysis in other_analyses.items()
+        }
+        trimmed_rebuttals = {}
+        for name, points in rebuttals.items():
+            values = kept.get(("rebuttal", name, ""), [])
+            trimmed_rebuttals[name] = "\n".join(values) if isinstance(points, str) else values
+        return trimmed_analyses, trimmed_rebuttals
+
+    def _record(self, tokens_in: int, tokens_out: int, points_dropped: int) -> None:
+        # Agents may build their contexts concurrently
+        with self._lock:
+            self.tokens_in += tokens_in
+            self.tokens_out += tokens_out
+            self.points_dropped += points_dropped
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the context tokens before and after trimming, and the tokens saved"""
+        return {
+            "tokens": self.tokens_out,
+            "tokens_before": self.tokens_in,
+            "tokens_saved": self.tokens_in - self.tokens_out,
+            "points_dropped": self.points_dropped
+        }
@@ -0,0 +1,56 @@
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from config.settings import CONVERGENCE_THRESHOLD, MIN_REBUTTAL_ROUNDS
+
+
+def fingerprint(points: Iterable[str]) -> FrozenSet[int]:
+    """Fingerprint a set of rebuttal points, ignoring their order"""
+    return frozenset(hash(str(point)) for point in points)
+
+
+def similarity(previous: FrozenSet[int], current: FrozenSet[int]) -> float:
+    """Jaccard similarity of two fingerprints; two empty rounds are identical"""
+    if not previous and not current:
+        return 1.0
+    return len(previous & current) / len(previous | current)
+
+
+class ConvergenceDetector:
+    """Decides when rebuttal rounds have stopped changing
+
+    Every round, each agent's rebuttal points are fingerprinted and compared
+    with its previous round. The battle's similarity is that of the agent
+    that changed most, so one agent still moving keeps the rounds going.
+    Detection is off when the threshold is None.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, min_rounds: Optional[int] = None):
+        self.threshold = threshold if threshold is not None else CONVERGENCE_THRESHOLD
+        self.min_rounds = max(1, min_rounds if min_rounds is not None else MIN_REBUTTAL_ROUNDS)
+        self.similarities: List[float] = []
+        self._previous: Dict[str, FrozenSet[int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold is not None
+
+    def update(self, rounds: Dict[str, Iterable[str]]) -> float:
+        """Record one round of rebuttal points per agent and return its similarity to the last"""
+        current = {name: fingerprint(points) for name, points in rounds.items()}
+        if self._previous:
+            value = min(
+                (similarity(self._previous.get(name, frozenset()), points) for name, points in current.items()),
+                default=1.0
+            )
+        else:
+            value = 0.0
+        self._previous = current
+        self.similarities.append(value)
+        return value
+
+    def converged(self) -> bool:
+        """Check whether the rounds recorded so far allow the battle to stop"""
+        return (
+            self.enabled
+            and len(self.similarities) >= self.min_rounds
+            and self.similarities[-1] >= self.threshold
+        )
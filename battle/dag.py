@@ -0,0 +1,113 @@
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from battle.executor import AgentExecutor, AgentTimeoutError, SequentialExecutor
+
+
+class DagNode(NamedTuple):
+    """One unit of battle work and the nodes whose results it reads"""
+
+    key: Hashable
+    fn: Callable[[], Any]
+    deps: Tuple[Hashable, ...] = ()
+    agent: Optional[str] = None
+
+
+class DagScheduler:
+    """Runs a dependency graph of nodes, starting each one as soon as its inputs are ready
+
+    Nodes are submitted to an AgentExecutor, so the executor's concurrency
+    and per-node timeout apply. ``run`` yields ``(key, result)`` as nodes
+    finish; nodes that finish together are yielded in graph order. A node's
+    dependents are only submitted after its result has been yielded, so a
+    consumer can store the result for them to read.
+    """
+
+    def __init__(self, executor: Optional[AgentExecutor] = None):
+        self.executor = executor or SequentialExecutor()
+        self._timings: Dict[Hashable, Tuple[float, float]] = {}
+        self._deps: Dict[Hashable, Tuple[Hashable, ...]] = {}
+        self._started: Dict[Hashable, float] = {}
+        self._wall = 0.0
+
+    def _timed(self, node: DagNode) -> Callable[[], Tuple[Any, float, float]]:
+        def run() -> Tuple[Any, float, float]:
+            started = self._started[node.key] = time.perf_counter()
+            result = node.fn()
+            return result, started, time.perf_counter()
+        return run
+
+    def _overdue(self, running: Dict[Future, DagNode], timeout: float) -> Tuple[Optional[DagNode], Optional[float]]:
+        """Get a running node past its deadline, or else the seconds until the next deadline"""
+        now = time.perf_counter()
+        remaining = timeout
+        for node in running.values():
+            started = self._started.get(node.key)
+            if started is None:
+                continue
+            if now >= started + timeout:
+                return node, None
+            remaining = min(remaining, started + timeout - now)
+        return None, remaining
+
+    def run(self, nodes: Sequence[DagNode]) -> Iterator[Tuple[Hashable, Any]]:
+        """Run every node after its dependencies, yielding results as they are ready"""
+        order = {node.key: index for index, node in enumerate(nodes)}
+        waiting_on: Dict[Hashable, int] = {}
+        dependents: Dict[Hashable, List[Hashable]] = {node.key: [] for node in nodes}
+        for node in nodes:
+            for dep in node.deps:
+                if dep not in order:
+                    raise ValueError(f"Node {node.key!r} depends on unknown node {dep!r}")
+                dependents[dep].append(node.key)
+            waiting_on[node.key] = len(node.deps)
+
+        self._deps, self._timings, self._started = {node.key: node.deps for node in nodes}, {}, {}
+        ready: Deque[Hashable] = deque(node.key for node in nodes if not node.deps)
+        running: Dict[Future, DagNode] = {}
+        started = time.perf_counter()
+        timeout = self.executor.timeout
+        while ready or running:
+            while ready:
+                node = nodes[order[ready.popleft()]]
+                running[self.executor.submit(self._timed(node))] = node
+            remaining = None
+            if timeout is not None:
+                # Deadlines count from when a node starts, not from when it is queued
+                late, remaining = self._overdue(running, timeout)
+                if late is not None:
+                    for future in running:
+                        future.cancel()
+                    raise AgentTimeoutError(late.agent or str(late.key), timeout)
+            done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda future: order[running[future].key]):
+                node = running.pop(future)
+                result, node_started, node_finished = future.result()
+                self._timings[node.key] = (node_started, node_finished)
+                yield node.key, result
+                for dependent in dependents[node.key]:
+                    waiting_on[dependent] -= 1
+                    if not waiting_on[dependent]:
+                        ready.append(dependent)
+        self._wall = time.perf_counter() - started
+        if len(self._timings) < len(nodes):
+            raise ValueError("Battle graph has a dependency cycle")
+
+    def critical_path(self) -> float:
+        """Get the seconds of the longest dependency chain of the last run, by measured node times"""
+        finish: Dict[Hashable, float] = {}
+        # Results arrive in a topological order, so every dependency is already measured
+        for key in self._timings:
+            node_started, node_finished = self._timings[key]
+            finish[key] = node_finished - node_started + max((finish[dep] for dep in self._deps[key]), default=0.0)
+        return max(finish.values(), default=0.0)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get the node count, wall time, summed node time and critical path of the last run in ms"""
+        return {
+            "nodes": len(self._timings),
+            "wall_ms": self._wall * 1000,
+            "work_ms": sum(end - start for start, end in self._timings.values()) * 1000,
+            "critical_path_ms": self.critical_path() * 1000
+        }
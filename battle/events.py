@@ -0,0 +1,94 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class BattleEvent:
+    """Base class for everything a battle emits while it runs"""
+
+    kind = "event"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the event as a plain dict with a ``type`` field"""
+        data = {"type": self.kind}
+        data.update({f.name: getattr(self, f.name) for f in fields(self)})
+        return data
+
+
+@dataclass(frozen=True)
+class AnalysisReady(BattleEvent):
+    agent: str
+    analysis: Dict[str, Any]
+
+    kind = "analysis"
+
+
+@dataclass(frozen=True)
+class RebuttalReady(BattleEvent):
+    agent: str
+    round: int
+    points: Sequence[str]
+    thought_process: List[str] = field(default_factory=list)
+    target: Optional[str] = None
+
+    kind = "rebuttal"
+
+
+@dataclass(frozen=True)
+class SolutionReady(BattleEvent):
+    agent: str
+    solution: Dict[str, Any]
+
+    kind = "solution"
+
+
+@dataclass(frozen=True)
+class VoteCast(BattleEvent):
+    voter: str
+    candidate: str
+    score: float
+
+    kind = "vote"
+
+
+@dataclass(frozen=True)
+class ClarificationNeeded(BattleEvent):
+    agent: str
+    questions: List[str]
+    round: Optional[int] = None
+
+    kind = "clarification"
+
+
+@dataclass(frozen=True)
+class BattleComplete(BattleEvent):
+    result: Dict[str, Any]
+    # Record form of the result (a BattleResult) when the producer has one
+    record: Any = field(default=None, compare=False, repr=False)
+
+    kind = "complete"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.kind, "result": self.result}
+
+
+def collect(events: Iterator[BattleEvent]) -> Dict[str, Any]:
+    """Drain an event stream and return the final battle result"""
+    result: Dict[str, Any] = {}
+    for event in events:
+        if isinstance(event, BattleComplete):
+            result = event.result
+    return result
+
+
+async def aiterate(events: Iterator[BattleEvent]) -> AsyncIterator[BattleEvent]:
+    """Consume a blocking event stream from async code without stalling the loop"""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    sentinel = object()
+    while True:
+        event = await loop.run_in_executor(None, next, events, sentinel)
+        if event is sentinel:
+            return
+        yield event
@@ -0,0 +1,215 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from config.settings import EXECUTOR_MODE, MAX_CONCURRENT_AGENTS, AGENT_TIMEOUT
+
+
+class AgentTimeoutError(TimeoutError):
+    """Raised when an agent does not finish a phase within its timeout"""
+
+    def __init__(self, agent_name: str, timeout: float):
+        super().__init__(f"Agent {agent_name} did not finish within {timeout:.2f}s")
+        self.agent_name = agent_name
+        self.timeout = timeout
+
+
+def _agent_name(agent: Any) -> str:
+    return getattr(agent, "name", repr(agent))
+
+
+class AgentExecutor:
+    """Runs one phase of work for a list of agents and returns results in agent order"""
+
+    mode = "base"
+
+    def __init__(self, max_concurrency: Optional[int] = None, timeout: Optional[float] = None):
+        self.max_concurrency = max(1, max_concurrency or MAX_CONCURRENT_AGENTS)
+        self.timeout = timeout if timeout is not None else AGENT_TIMEOUT
+
+    def map(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> List[Any]:
+        """Apply fn to every agent and return the results in the same order"""
+        raise NotImplementedError
+
+    def imap(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> Iterator[Any]:
+        """Like map, but yield each result as soon as it and all earlier ones are ready"""
+        return iter(self.map(fn, agents))
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        """Start one call, returning a future for its result; runs it inline unless overridden"""
+        future: Future = Future()
+        try:
+            future.set_result(fn())
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def close(self) -> None:
+        """Release any worker resources held by the executor"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SequentialExecutor(AgentExecutor):
+    """Runs agents one by one in the calling thread
+
+    Timeouts cannot interrupt a running agent here, so they are not enforced.
+    """
+
+    mode = "sequential"
+
+    def map(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> List[Any]:
+        return [fn(agent) for agent in agents]
+
+    def imap(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> Iterator[Any]:
+        for agent in agents:
+            yield fn(agent)
+
+
+class ThreadPoolAgentExecutor(AgentExecutor):
+    """Runs agents concurrently on a shared thread pool"""
+
+    mode = "thread"
+
+    def __init__(self, max_concurrency: Optional[int] = None, timeout: Optional[float] = None):
+        super().__init__(max_concurrency, timeout)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                        thread_name_prefix="agent")
+
+    def map(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> List[Any]:
+        return list(self.imap(fn, agents))
+
+    def imap(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> Iterator[Any]:
+        started: Dict[int, float] = {}
+
+        def run(index: int, agent: Any) -> Any:
+            # Each agent's deadline counts from when a worker picks it up, not from submission
+            started[index] = time.monotonic()
+            return fn(agent)
+
+        futures = [self._pool.submit(run, index, agent) for index, agent in enumerate(agents)]
+        for index, (agent, future) in enumerate(zip(agents, futures)):
+            while True:
+                remaining = None
+                if self.timeout is not None:
+                    start = started.get(index)
+                    remaining = self.timeout if start is None else max(0.0, start + self.timeout - time.monotonic())
+                try:
+                    result = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    start = started.get(index)
+                    # Still queued behind other agents, which have deadlines of their own
+                    if start is None or time.monotonic() < start + self.timeout:
+                        continue
+                    for pending in futures:
+                        pending.cancel()
+                    raise AgentTimeoutError(_agent_name(agent), self.timeout) from None
+                yield result
+                break
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        return self._pool.submit(fn)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+class AsyncioAgentExecutor(AgentExecutor):
+    """Runs agents as asyncio tasks bounded by a semaphore
+
+    Coroutine functions are awaited directly; plain functions run on a worker
+    thread so blocking agent code does not stall the event loop.
+    """
+
+    mode = "asyncio"
+
+    def __init__(self, max_concurrency: Optional[int] = None, timeout: Optional[float] = None):
+        super().__init__(max_concurrency, timeout)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                        thread_name_prefix="agent-async")
+
+    async def _run_one(self, fn: Callable[[Any], Any], agent: Any, semaphore: Any) -> Any:
+        import asyncio
+        import inspect
+
+        async with semaphore:
+            if inspect.iscoroutinefunction(fn):
+                call = fn(agent)
+            else:
+                call = asyncio.get_running_loop().run_in_executor(self._pool, fn, agent)
+            try:
+                return await asyncio.wait_for(call, self.timeout)
+            except asyncio.TimeoutError:
+                raise AgentTimeoutError(_agent_name(agent), self.timeout) from None
+
+    async def amap(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> List[Any]:
+        """Apply fn to every agent concurrently from inside a running event loop"""
+        # Imported on first use so sequential and threaded battles never load asyncio
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return list(await asyncio.gather(*(self._run_one(fn, agent, semaphore) for agent in agents)))
+
+    async def _settle_each(self, fn: Callable[[Any], Any], agents: Sequence[Any], results: List[Future]) -> None:
+        """Run every agent, handing each outcome to its future as soon as it is known"""
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(agent: Any, result: Future) -> None:
+            try:
+                result.set_result(await self._run_one(fn, agent, semaphore))
+            except BaseException as exc:
+                result.set_exception(exc)
+
+        await asyncio.gather(*(run(agent, result) for agent, result in zip(agents, results)))
+
+    def imap(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> Iterator[Any]:
+        """Yield each result in agent order as soon as it and all earlier ones are ready
+
+        The agents run on their own event loop in a helper thread, so results
+        are handed out while later agents are still running.
+        """
+        import asyncio
+
+        results: List[Future] = [Future() for _ in agents]
+        threading.Thread(target=asyncio.run, args=(self._settle_each(fn, agents, results),),
+                         name="agent-loop", daemon=True).start()
+        for result in results:
+            yield result.result()
+
+    def map(self, fn: Callable[[Any], Any], agents: Sequence[Any]) -> List[Any]:
+        import asyncio
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.amap(fn, agents))
+        raise RuntimeError("AsyncioAgentExecutor.map cannot be called from a running event loop; "
+                           "await amap() instead")
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        return self._pool.submit(fn)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+EXECUTORS = {
+    SequentialExecutor.mode: SequentialExecutor,
+    ThreadPoolAgentExecutor.mode: ThreadPoolAgentExecutor,
+    AsyncioAgentExecutor.mode: AsyncioAgentExecutor
+}
+
+
+def create_executor(mode: Optional[str] = None, max_concurrency: Optional[int] = None,
+                    timeout: Optional[float] = None) -> AgentExecutor:
+    """Create an executor by mode name: sequential, thread or asyncio"""
+    mode = mode or EXECUTOR_MODE
+    if mode not in EXECUTORS:
+        raise ValueError(f"Executor mode {mode} not supported")
+    return EXECUTORS[mode](max_concurrency=max_concurrency, timeout=timeout)
@@ -0,0 +1,235 @@
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+from agents.rebuttal_budget import terms
+from agents.thoughts import render_thoughts
+
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert a value into a read-only structure"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy a frozen structure back into plain dicts and lists"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _items(value: Any) -> Tuple[Any, ...]:
+    """Normalize a list or dict of items into a tuple of items"""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(str(item) for item in value.values())
+    return ()
+
+
+def _shared(point: Any) -> Any:
+    """Intern a rebuttal point so identical points from other agents and rounds share one string"""
+    return sys.intern(point) if type(point) is str else point
+
+
+class Analysis(NamedTuple):
+    """Read-only, tuple-backed view of an agent's analysis
+
+    ``get`` mirrors ``dict.get`` so the record can be handed to
+    ``generate_rebuttal`` wherever an analysis dict was expected. The
+    significant words of its points, and their relevance to each set of focus
+    terms, are worked out on first use and shared by every agent that reads
+    the record.
+    """
+
+    pros: Tuple[str, ...] = ()
+    cons: Tuple[str, ...] = ()
+    risks: Tuple[str, ...] = ()
+    suggestions: Tuple[str, ...] = ()
+    summary: Tuple[str, ...] = ()
+    clarifying_questions: Tuple[str, ...] = ()
+    thought_process: Tuple[Any, ...] = ()
+    extra: Mapping[str, Any] = EMPTY_MAPPING
+    point_terms: Optional[Dict[str, FrozenSet[str]]] = None
+    point_scores: Optional[Dict[FrozenSet[str], Dict[str, int]]] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in ANALYSIS_FIELDS:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+
+    def item_terms(self) -> Mapping[str, FrozenSet[str]]:
+        """Get the significant words of every pro, con, risk and suggestion"""
+        if self.point_terms:
+            return self.point_terms
+        found = {
+            item: terms(item)
+            for field in POINT_FIELDS for item in getattr(self, field) if isinstance(item, str)
+        }
+        if self.point_terms is not None:
+            # Concurrent readers work out the same words, so a race only costs time
+            self.point_terms.update(found)
+        return found
+
+    def item_relevance(self, focus_terms: FrozenSet[str]) -> Mapping[str, int]:
+        """Count the focus terms among the significant words of every point"""
+        scores = self.point_scores.get(focus_terms) if self.point_scores is not None else None
+        if scores is None:
+            scores = {item: len(words & focus_terms) for item, words in self.item_terms().items()}
+            if self.point_scores is not None:
+                self.point_scores[focus_terms] = scores
+        return scores
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Analysis":
+        """Build a record from an agent's analysis dict"""
+        extra = {key: value for key, value in data.items() if key not in ANALYSIS_FIELDS}
+        return cls(
+            *(_items(data.get(field)) for field in ANALYSIS_FIELDS),
+            extra=freeze(extra) if extra else EMPTY_MAPPING,
+            point_terms={},
+            point_scores={}
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the analysis dict shape agents return"""
+        data: Dict[str, Any] = {field: list(getattr(self, field)) for field in ANALYSIS_FIELDS}
+        data.update(self.extra)
+        return data
+
+
+ANALYSIS_FIELDS = Analysis._fields[:-3]
+POINT_FIELDS = ("pros", "cons", "risks", "suggestions")
+
+
+class Rebuttal(NamedTuple):
+    """Rebuttal points and thought process, whatever shape the agent returned
+
+    Agents with the same persona rebut the same points in the same words, and
+    so does each agent from one round to the next. Points are interned, so a
+    battle holds one copy of each distinct point however often it is made.
+    """
+
+    points: Tuple[str, ...] = ()
+    thought_process: Tuple[Any, ...] = ()
+
+    @classmethod
+    def from_any(cls, rebuttal: Any) -> "Rebuttal":
+        """Normalize a rebuttal returned as a list, a dict of lists or a str"""
+        if isinstance(rebuttal, (list, tuple)):
+            return cls(tuple(map(_shared, rebuttal)))
+        if isinstance(rebuttal, dict):
+            points: List[str] = []
+            for key, value in rebuttal.items():
+                if key != "thought_process":  # Thought process is reported separately
+                    if isinstance(value, list):
+                        points.extend(value)
+                    else:
+                        points.append(str(value))
+            return cls(tuple(map(_shared, points)), tuple(rebuttal.get("thought_process", ())))
+        return cls((str(rebuttal),))
+
+
+class Solution(NamedTuple):
+    """Scoring view of an agent's solution
+
+    Category items are normalized once to tuples of strings; ``source`` keeps
+    the agent's original dict for ``to_dict``.
+    """
+
+    recommendations: Tuple[str, ...] = ()
+    benefits: Tuple[str, ...] = ()
+    risks: Tuple[str, ...] = ()
+    implementation: Optional[Mapping[str, Any]] = None
+    source: Mapping[str, Any] = EMPTY_MAPPING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.source.get(key, default)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Solution":
+        """Build a record from an agent's solution dict"""
+        implementation = data.get("implementation", {})
+        return cls(
+            _items(data.get("recommendations")),
+            _items(data.get("benefits")),
+            _items(data.get("risks")),
+            implementation if isinstance(implementation, dict) else None,
+            data
+        )
+
+    @classmethod
+    def coerce(cls, solution: Any) -> "Solution":
+        """Accept either a Solution or a solution dict"""
+        return solution if isinstance(solution, Solution) else cls.from_dict(solution or {})
+
+    def is_empty(self) -> bool:
+        return not self.source
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the solution dict shape used in battle results"""
+        return {
+            "recommendations": self.source.get("recommendations", []),
+            "benefits": self.source.get("benefits", []),
+            "risks": self.source.get("risks", []),
+            "implementation": self.source.get("implementation", {})
+        }
+
+
+class AgentResult(NamedTuple):
+    """One agent's analysis, rebuttal rounds and thought process in a battle"""
+
+    analysis: Mapping[str, Any]
+    rebuttals: Tuple[Tuple[str, ...], ...] = ()
+    thought_process: Tuple[Any, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the per-agent dict shape run_battle_with_rebuttals returns, with thoughts as strings"""
+        rounds = {f"Round {number}": list(points) for number, points in enumerate(self.rebuttals, 1)}
+        analysis = self.analysis
+        if "thought_process" in analysis:
+            analysis = {**analysis, "thought_process": render_thoughts(analysis["thought_process"])}
+        return {
+            "analysis": analysis,
+            "rebuttals": rounds or {"Round 1": []},
+            "thought_process": render_thoughts(self.thought_process)
+        }
+
+
+class BattleResult(NamedTuple):
+    """Outcome of a battle with rebuttals"""
+
+    status: str
+    agents: Mapping[str, AgentResult]
+    agent: Optional[str] = None
+    questions: Sequence[str] = ()
+    round: Optional[int] = None
+    rounds_run: int = 0
+    rounds_saved: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict shape run_battle_with_rebuttals returns"""
+        results = {name: result.to_dict() for name, result in self.agents.items()}
+        if self.status == "completed":
+            return {
+                "status": self.status,
+                "results": results,
+                "rounds_run": self.rounds_run,
+                "rounds_saved": self.rounds_saved
+            }
+        data = {
+            "status": self.status,
+            "questions": self.questions,
+            "agent": self.agent,
+            "current_results": results
+        }
+        if self.round is not None:
+            data["round"] = self.round
+        return data
@@ -0,0 +1,139 @@
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+from battle.battle_config import STYLE_MULTIPLIERS
+from battle.records import Solution
+
+CATEGORIES = ("recommendations", "benefits", "risks")
+
+
+def category_items(solution: Union[Dict[str, Any], Solution], category: str) -> List[str]:
+    """Lowercased items of one solution category, accepting list or dict values"""
+    return [item.lower() for item in getattr(Solution.coerce(solution), category)]
+
+
+def has_fast_implementation(solution: Union[Dict[str, Any], Solution]) -> bool:
+    """Check whether a solution advertises a simple or fast implementation"""
+    implementation = Solution.coerce(solution).implementation
+    if implementation is None:
+        return False
+    complexity = str(implementation.get("complexity", "")).lower()
+    time_to_market = str(implementation.get("time_to_market", "")).lower()
+    return "simple" in complexity or "fast" in time_to_market
+
+
+class ScoringEngine:
+    """Scores every voter against every candidate solution in one batched pass
+
+    Suggestions and solutions are tokenized once, keywords are indexed into a
+    shared vocabulary and the voter x candidate alignment is computed with
+    matrix products instead of per-pair nested loops.
+
+    In ``compat`` mode keywords match as substrings of solution items and scores
+    are accumulated in the same order as ``calculate_solution_score``, so results
+    are bit-for-bit identical. With ``compat=False`` keywords must match whole
+    item tokens and weights are applied with a single multiply-add.
+    """
+
+    def __init__(self, weights: Dict[str, float], compat: bool = True):
+        self.weights = weights
+        self.compat = compat
+
+    def score_matrix(self, voter_suggestions: Sequence[Sequence[str]],
+                     solutions: Sequence[Union[Optional[Dict[str, Any]], Solution]],
+                     voting_styles: Sequence[str]) -> np.ndarray:
+        """Compute a (voters, candidates) matrix of alignment scores"""
+        n_voters, n_candidates = len(voter_suggestions), len(solutions)
+        if n_voters == 0 or n_candidates == 0:
+            return np.zeros((n_voters, n_candidates))
+
+        # Tokenize every suggestion once and index its keywords
+        vocabulary: Dict[str, int] = {}
+        suggestion_keywords: List[List[int]] = []
+        suggestion_voter: List[int] = []
+        for voter, suggestions in enumerate(voter_suggestions):
+            for suggestion in suggestions:
+                keywords = {vocabulary.setdefault(word, len(vocabulary)) for word in suggestion.lower().split()}
+                suggestion_keywords.append(sorted(keywords))
+                suggestion_voter.append(voter)
+
+        # Index every distinct solution item and the (candidate, category) groups it belongs to
+        item_index: Dict[str, int] = {}
+        memberships: List[tuple] = []
+        fast_implementation = np.zeros(n_candidates, dtype=bool)
+        records = [Solution.coerce(solution) for solution in solutions]
+        for candidate, solution in enumerate(records):
+            if solution.is_empty():
+                continue
+            for k, category in enumerate(CATEGORIES):
+                for item in category_items(solution, category):
+                    memberships.append((item_index.setdefault(item, len(item_index)),
+                                        candidate * len(CATEGORIES) + k))
+            fast_implementation[candidate] = has_fast_implementation(solution)
+
+        counts = np.zeros((n_voters, n_candidates, len(CATEGORIES)), dtype=np.int64)
+        if suggestion_keywords and vocabulary and item_index:
+            suggestion_matrix = np.zeros((len(suggestion_keywords), len(vocabulary)), dtype=np.float32)
+            for row, keywords in enumerate(suggestion_keywords):
+                suggestion_matrix[row, keywords] = 1.0
+
+            keyword_item = self._keyword_item_matrix(list(vocabulary), list(item_index))
+
+            # A suggestion hits a (candidate, category) group when any of its keywords
+            # matches any item in the group, so reduce items into groups per keyword first
+            keyword_group = np.zeros((len(vocabulary), n_candidates * len(CATEGORIES)), dtype=np.float32)
+            memberships.sort(key=lambda membership: membership[1])
+            member_items = np.array([item for item, _ in memberships])
+            member_groups = np.array([group for _, group in memberships])
+            groups, starts = np.unique(member_groups, return_index=True)
+            keyword_group[:, groups] = np.maximum.reduceat(keyword_item[:, member_items], starts, axis=1)
+            group_hits = (suggestion_matrix @ keyword_group) > 0
+
+            voter_matrix = np.zeros((n_voters, len(suggestion_keywords)), dtype=np.float32)
+            voter_matrix[suggestion_voter, np.arange(len(suggestion_keywords))] = 1.0
+            counts = np.rint(voter_matrix @ group_hits.astype(np.float32)).astype(np.int64)
+            counts = counts.reshape(n_voters, n_candidates, len(CATEGORIES))
+
+        multipliers = np.array([STYLE_MULTIPLIERS.get(style, 1.0) for style in voting_styles])
+        implementation_bonus = np.broadcast_to(fast_implementation, (n_voters, n_candidates))
+        if self.compat:
+            scores = self._accumulate_in_order(counts, multipliers, implementation_bonus)
+        else:
+            category_weights = np.array([self.weights.get(category, 0.0) for category in CATEGORIES])
+            scores = (counts @ category_weights) * multipliers[:, None]
+            scores += implementation_bonus * self.weights.get("implementation", 0.0) * multipliers[:, None]
+
+        empty = np.array([solution.is_empty() for solution in records])
+        scores[:, empty] = 0.0
+        return scores
+
+    def _keyword_item_matrix(self, keywords: List[str], items: List[str]) -> np.ndarray:
+        """Build a (keywords, items) matrix marking which keywords match which items"""
+        matrix = np.zeros((len(keywords), len(items)), dtype=np.float32)
+        if self.compat:
+            item_array = np.array(items, dtype=np.str_)
+            for row, keyword in enumerate(keywords):
+                matrix[row] = np.char.find(item_array, keyword) >= 0
+        else:
+            keyword_index = {keyword: row for row, keyword in enumerate(keywords)}
+            for column, item in enumerate(items):
+                rows = [keyword_index[token] for token in set(item.split()) if token in keyword_index]
+                matrix[rows, column] = 1.0
+        return matrix
+
+    def _accumulate_in_order(self, counts: np.ndarray, multipliers: np.ndarray,
+                             implementation_bonus: np.ndarray) -> np.ndarray:
+        """Add weights one match at a time, category by category, like the reference loop"""
+        n_voters, n_candidates, _ = counts.shape
+        scores = np.zeros((n_voters, n_candidates))
+        for k, category in enumerate(CATEGORIES):
+            category_counts = counts[:, :, k]
+            if not category_counts.any():
+                continue
+            increment = np.broadcast_to((self.weights[category] * multipliers)[:, None], scores.shape)
+            for step in range(int(category_counts.max())):
+                mask = category_counts > step
+                scores[mask] += increment[mask]
+        if implementation_bonus.any():
+            increment = np.broadcast_to((self.weights["implementation"] * multipliers)[:, None], scores.shape)
+            scores[implementation_bonus] += increment[implementation_bonus]
+        return scores
@@ -0,0 +1,77 @@
+"""Compare phased and DAG-scheduled battles when agent latencies vary
+
+Run with ``python -m benchmarks.bench_dag``. Every agent call first sleeps
+for a latency drawn from a log-normal distribution, standing in for LLM
+calls of uneven speed. Each agent draws from its own seeded stream, so both
+schedulers see the same latencies. Both run on the same thread executor, and
+their results are checked to be identical.
+"""
+import argparse
+import functools
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from battle.battle_config import BattleConfig
+from battle.battle_run_example import iter_battle
+from battle.events import BattleComplete
+from battle.executor import ThreadPoolAgentExecutor
+from benchmarks.suite import make_battle_agents, make_problem
+
+
+def _slowed(fn: Callable[..., Any], delays: Callable[[], float]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    def call(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(delays())
+        return fn(*args, **kwargs)
+    return call
+
+
+def make_slow_agents(count: int, latency: float, spread: float, seed: int) -> List[Any]:
+    """Build agents whose analysis, rebuttal and solution calls each take a random time"""
+    agents = make_battle_agents(count)
+    for index, agent in enumerate(agents):
+        # An agent's calls run one at a time, so its stream is drawn in the same order by both schedulers
+        rng = random.Random(seed * 1000 + index)
+        delays = lambda rng=rng: latency * rng.lognormvariate(0.0, spread)
+        for method in ("generate_analysis", "generate_rebuttal", "generate_solution"):
+            setattr(agent, method, _slowed(getattr(agent, method), delays))
+    return agents
+
+
+def run_battle(scheduler: str, count: int, latency: float, spread: float, seed: int,
+               problem: str) -> Tuple[Dict[str, Any], float]:
+    agents = make_slow_agents(count, latency, spread, seed)
+    with ThreadPoolAgentExecutor(max_concurrency=count) as executor:
+        started = time.perf_counter()
+        result: Dict[str, Any] = {}
+        for event in iter_battle(problem, BattleConfig(), executor, agents, scheduler=scheduler):
+            if isinstance(event, BattleComplete):
+                result = event.result
+        return result, time.perf_counter() - started
+
+
+def run(agent_counts: List[int], latency: float, spreads: List[float], words: int, seed: int) -> None:
+    problem = make_problem(words)
+    # Warm up imports and caches so the first timed battle is not penalised
+    run_battle("phases", agent_counts[0], 0.0, 0.0, seed, problem)
+    print(f"{'agents':>6} {'spread':>7} {'phases (s)':>11} {'dag (s)':>8} {'saved':>7} {'same':>5}")
+    for count in agent_counts:
+        for spread in spreads:
+            phased, phased_time = run_battle("phases", count, latency, spread, seed, problem)
+            dag, dag_time = run_battle("dag", count, latency, spread, seed, problem)
+            same = json.dumps(phased, sort_keys=True, default=str) == json.dumps(dag, sort_keys=True, default=str)
+            print(f"{count:>6} {spread:>7.2f} {phased_time:>11.3f} {dag_time:>8.3f} "
+                  f"{1 - dag_time / phased_time:>7.1%} {'yes' if same else 'NO':>5}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[5, 10])
+    parser.add_argument("--latency", type=float, default=0.01, help="Median seconds per agent call")
+    parser.add_argument("--spread", type=float, nargs="+", default=[0.0, 0.5, 1.0],
+                        help="Log-normal sigma of per-agent latency")
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.agents, args.latency, args.spread, args.words, args.seed)
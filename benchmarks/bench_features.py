@@ -0,0 +1,102 @@
+"""Micro-benchmark keyword feature extraction on long problem statements
+
+Run with ``python -m benchmarks.bench_features``. Compares the per-method
+``any(word in problem.lower() ...)`` scans the personas used to run against
+building ProblemFeatures once per problem, and compares matcher engines.
+"""
+import argparse
+import random
+import re
+import time
+from agents.problem_features import (
+    KEYWORDS, MATCHER, AI_TERMS, AI_SOLUTION_TERMS, REAL_TIME_TERMS, ENTERPRISE_TERMS, DATA_TERMS,
+    extract_features
+)
+
+# Keyword groups each persona method scanned, in order, before ProblemFeatures existed
+LEGACY_SCANS = [
+    # InnovativeIzzy.analyze_problem / generate_solution
+    [AI_TERMS, REAL_TIME_TERMS, ("mobile", "app", "interface"), ("web", "platform", "dashboard"),
+     ("scale", "growth", "enterprise")],
+    [AI_SOLUTION_TERMS, REAL_TIME_TERMS, AI_SOLUTION_TERMS, REAL_TIME_TERMS, ("mobile", "app"),
+     AI_SOLUTION_TERMS],
+    # RiskAverseRiley
+    [AI_TERMS, REAL_TIME_TERMS, ("market", "competition", "growth"), ENTERPRISE_TERMS, DATA_TERMS],
+    [AI_SOLUTION_TERMS, REAL_TIME_TERMS, AI_SOLUTION_TERMS, REAL_TIME_TERMS, DATA_TERMS,
+     AI_SOLUTION_TERMS],
+    # ScalableSam
+    [AI_TERMS, REAL_TIME_TERMS, ENTERPRISE_TERMS, ("mobile", "app", "user"), ("market", "growth", "scale")],
+    [AI_SOLUTION_TERMS, REAL_TIME_TERMS] * 4,
+    # SeniorDevSam.generate_solution
+    [AI_SOLUTION_TERMS, REAL_TIME_TERMS] * 4,
+]
+# Every method ran twice per battle: once inside generate_analysis, once in the solution phase
+CALLS_PER_BATTLE = 2
+FILLER = ("the team wants to ship a new onboarding flow for customers so that quarterly reports "
+          "show better retention across regions while keeping the roadmap focused").split()
+
+
+def make_problem(words: int, seed: int = 3) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(FILLER) for _ in range(words))
+
+
+def legacy_battle(problem: str) -> list:
+    results = []
+    for _ in range(CALLS_PER_BATTLE):
+        # BaseExpert.generate_analysis split the problem for its word count in every agent
+        results.append(len(problem.split()) < 10)
+        for method in LEGACY_SCANS:
+            problem_lower = problem.lower()
+            results.extend(any(word in problem_lower for word in group) for group in method)
+    return results
+
+
+def features_battle(problem: str) -> list:
+    extract_features.cache_clear()
+    results = []
+    for _ in range(CALLS_PER_BATTLE):
+        features = extract_features(problem)
+        results.append(features.word_count < 10)
+        for method in LEGACY_SCANS:
+            features = extract_features(problem)
+            results.extend(features.has_any(*group) for group in method)
+    return results
+
+
+def timed(fn, *args, repeat: int = 20) -> tuple:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def run(sizes, repeat: int) -> None:
+    alternation = "|".join(sorted(map(re.escape, set(KEYWORDS)), key=len, reverse=True))
+    combined_regex = re.compile(f"(?=({alternation}))")
+
+    print(f"{'words':>7} {'legacy ms':>10} {'features ms':>12} {'speedup':>8} | "
+          f"{'matcher ms':>11} {'regex ms':>9}")
+    for words in sizes:
+        problem = make_problem(words)
+        # Sprinkle a few keywords so both paths see hits and misses
+        problem += " with a mobile app for enterprise data"
+        legacy_ms, legacy = timed(legacy_battle, problem, repeat=repeat)
+        features_ms, features = timed(features_battle, problem, repeat=repeat)
+        if legacy != features:
+            raise SystemExit(f"Feature flags diverged from legacy scans at {words} words")
+
+        lowered = problem.lower()
+        matcher_ms, matched = timed(MATCHER.match, lowered, repeat=repeat)
+        regex_ms, regex_matched = timed(lambda text: {m.group(1) for m in combined_regex.finditer(text)},
+                                        lowered, repeat=repeat)
+        print(f"{words:>7} {legacy_ms:>10.3f} {features_ms:>12.3f} {legacy_ms / features_ms:>7.1f}x | "
+              f"{matcher_ms:>11.3f} {regex_ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
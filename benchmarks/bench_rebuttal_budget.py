@@ -0,0 +1,49 @@
+"""Compare battle time and memory with and without a rebuttal budget
+
+Run with ``python -m benchmarks.bench_rebuttal_budget``. Each battle is
+run once untraced for wall time and once under tracemalloc for the memory
+its result holds.
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+from battle.battle_manager import BattleManager
+from benchmarks.suite import make_battle_agents, make_problem
+
+
+def run_battle(agents: int, budget: Optional[int], problem: str, rounds: int) -> Tuple[Dict[str, Any], float]:
+    battle_agents = make_battle_agents(agents)
+    for agent in battle_agents:
+        agent.rebuttal_budget.limit = budget
+    manager = BattleManager(battle_agents)
+    started = time.perf_counter()
+    result = manager.run_battle_with_rebuttals(problem, rounds)
+    return result, time.perf_counter() - started
+
+
+def run(agent_counts: List[int], budget: int, words: int, rounds: int) -> None:
+    problem = make_problem(words)
+    print(f"{'agents':>6} {'budget':>7} {'time (s)':>9} {'retained MiB':>13} {'peak MiB':>9} {'points/round':>13}")
+    for agents in agent_counts:
+        for limit in (None, budget):
+            result, elapsed = run_battle(agents, limit, problem, rounds)
+            tracemalloc.start()
+            try:
+                result, _ = run_battle(agents, limit, problem, rounds)
+                retained, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            points = max(len(agent["rebuttals"]["Round 1"]) for agent in result["results"].values())
+            print(f"{agents:>6} {str(limit or '-'):>7} {elapsed:>9.3f} {retained / 2 ** 20:>13.1f} "
+                  f"{peak / 2 ** 20:>9.1f} {points:>13}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--budget", type=int, default=12)
+    parser.add_argument("--words", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    run(args.agents, args.budget, args.words, args.rounds)
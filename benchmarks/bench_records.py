@@ -0,0 +1,92 @@
+"""Measure memory of battle results held as slotted records against the dict shape
+
+Run with ``python -m benchmarks.bench_records``. For each agent count the
+battle is run twice in fresh subprocesses: once keeping the dict that
+``run_battle_with_rebuttals`` returns, and once keeping only the
+``BattleResult`` record carried by the final ``BattleComplete`` event. It
+reports the bytes and allocated blocks still held after the battle, the
+tracemalloc peak and the process peak RSS.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tracemalloc
+from typing import Any, Dict, List
+from battle.battle_manager import BattleManager
+from battle.events import BattleComplete
+from benchmarks.suite import make_battle_agents, make_problem
+
+MODES = ["dict", "records"]
+
+
+def traced_blocks() -> int:
+    return sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+
+
+def run_battle(manager: BattleManager, mode: str, problem: str, rounds: int) -> Any:
+    """Run a battle and return only the representation the mode keeps"""
+    if mode == "dict":
+        return manager.run_battle_with_rebuttals(problem, rounds)
+    record = None
+    for event in manager.iter_battle_with_rebuttals(problem, rounds):
+        if isinstance(event, BattleComplete):
+            record = event.record
+    return record
+
+
+def measure(mode: str, agents: int, words: int, rounds: int) -> Dict[str, Any]:
+    """Run one battle in this process and report the memory its result holds"""
+    manager = BattleManager(make_battle_agents(agents))
+    problem = make_problem(words)
+    tracemalloc.start()
+    try:
+        before_bytes, before_blocks = tracemalloc.get_traced_memory()[0], traced_blocks()
+        result = run_battle(manager, mode, problem, rounds)
+        # Drop per-battle manager and agent state so only the kept result is counted
+        manager.clear_state()
+        retained, peak = tracemalloc.get_traced_memory()
+        blocks = traced_blocks()
+    finally:
+        tracemalloc.stop()
+    return {
+        "mode": mode,
+        "agents": len(result["results"] if mode == "dict" else result.agents),
+        "retained": retained - before_bytes,
+        "peak": peak - before_bytes,
+        "blocks": blocks - before_blocks,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }
+
+
+def measure_in_subprocess(mode: str, agents: int, words: int, rounds: int) -> Dict[str, Any]:
+    """Run ``measure`` in a fresh interpreter so peak RSS is not shared between modes"""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_records", "--child", mode,
+         "--agents", str(agents), "--words", str(words), "--rounds", str(rounds)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(agent_counts: List[int], words: int, rounds: int) -> None:
+    print(f"{'agents':>6} {'mode':>8} {'retained KiB':>13} {'peak KiB':>10} {'blocks':>9} {'max RSS MiB':>12}")
+    for agents in agent_counts:
+        for mode in MODES:
+            stats = measure_in_subprocess(mode, agents, words, rounds)
+            print(f"{agents:>6} {mode:>8} {stats['retained'] / 1024:>13.1f} {stats['peak'] / 1024:>10.1f} "
+                  f"{stats['blocks']:>9} {stats['max_rss_kib'] / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, nargs="+", default=[10, 100, 200])
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(measure(args.child, args.agents[0], args.words, args.rounds)))
+    else:
+        run(args.agents, args.words, args.rounds)
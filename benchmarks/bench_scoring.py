@@ -0,0 +1,85 @@
+"""Compare calculate_solution_score against the batched ScoringEngine
+
+Run with ``python -m benchmarks.bench_scoring``. Each scale checks that
+compatibility mode reproduces the reference scores exactly.
+"""
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+from battle.battle_run_example import calculate_solution_score
+from battle.scoring import ScoringEngine
+
+WORDS = [
+    "implement", "comprehensive", "monitoring", "testing", "strategy", "market", "fit",
+    "pricing", "usage-based", "documentation", "scaling", "horizontal", "database",
+    "queries", "automated", "incident", "response", "security", "review", "pipeline",
+    "innovative", "user", "experience", "phased", "approach", "mvp", "revenue", "ci/cd"
+]
+STYLES = ["generous", "moderate", "conservative"]
+WEIGHTS = {"recommendations": 1.0, "benefits": 0.6, "risks": -0.4, "implementation": 0.8}
+
+
+def make_agents(count: int, list_size: int, seed: int = 7) -> Tuple[List[List[str]], List[Dict[str, Any]], List[str]]:
+    """Build synthetic suggestions, solutions and voting styles for ``count`` agents"""
+    rng = random.Random(seed)
+
+    def phrase() -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).capitalize()
+
+    suggestions = [[phrase() for _ in range(list_size)] for _ in range(count)]
+    solutions = []
+    for i in range(count):
+        solution = {
+            "recommendations": [phrase() for _ in range(list_size)],
+            "benefits": {f"b{j}": phrase() for j in range(list_size)} if i % 2 else [phrase() for _ in range(list_size)],
+            "risks": [phrase() for _ in range(list_size // 2)],
+            "implementation": {"complexity": rng.choice(["Simple", "Complex"]),
+                               "time_to_market": rng.choice(["Fast", "Slow"])}
+        }
+        solutions.append(solution)
+    styles = [rng.choice(STYLES) for _ in range(count)]
+    return suggestions, solutions, styles
+
+
+def reference_scores(suggestions, solutions, styles) -> List[List[float]]:
+    return [
+        [calculate_solution_score(voter, solution, WEIGHTS, style) for solution in solutions]
+        for voter, style in zip(suggestions, styles)
+    ]
+
+
+def run(scales: List[int], list_size: int, reference_limit: int) -> None:
+    print(f"{'agents':>7} {'reference (s)':>14} {'engine (s)':>11} {'token mode (s)':>15} {'speedup':>8}  exact")
+    for count in scales:
+        suggestions, solutions, styles = make_agents(count, list_size)
+
+        started = time.perf_counter()
+        engine_scores = ScoringEngine(WEIGHTS).score_matrix(suggestions, solutions, styles)
+        engine_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        ScoringEngine(WEIGHTS, compat=False).score_matrix(suggestions, solutions, styles)
+        token_time = time.perf_counter() - started
+
+        if count <= reference_limit:
+            started = time.perf_counter()
+            expected = reference_scores(suggestions, solutions, styles)
+            reference_time = time.perf_counter() - started
+            exact = engine_scores.tolist() == expected
+            print(f"{count:>7} {reference_time:>14.4f} {engine_time:>11.4f} {token_time:>15.4f} "
+                  f"{reference_time / engine_time:>7.1f}x  {exact}")
+            if not exact:
+                raise SystemExit(f"Compatibility mode diverged from reference scores at {count} agents")
+        else:
+            print(f"{count:>7} {'skipped':>14} {engine_time:>11.4f} {token_time:>15.4f} {'-':>8}  -")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[5, 50, 500])
+    parser.add_argument("--list-size", type=int, default=8, help="Suggestions and solution items per agent")
+    parser.add_argument("--reference-limit", type=int, default=500,
+                        help="Skip the slow reference implementation above this agent count")
+    args = parser.parse_args()
+    run(args.scales, args.list_size, args.reference_limit)
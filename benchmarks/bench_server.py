@@ -0,0 +1,104 @@
+"""Load-test the battle HTTP service with concurrent async clients
+
+Run with ``python -m benchmarks.bench_server``. Without ``--url`` the service
+is started in-process on a free port. Each request is a full battle; in
+``--stream`` mode the SSE endpoint is used and time to first event is reported.
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+import httpx
+from aiohttp import web
+from server.app import create_app
+from server.battle_service import BattleService
+
+PROBLEMS = [
+    "Build an AI powered mobile app that helps small business owners track real-time inventory and sales data",
+    "Create a web platform for enterprise teams to share dashboards with strong data privacy and security",
+    "Design a live customer support chat for a fast growing market with smart routing of requests to agents",
+    "Launch a corporate analytics dashboard that scales to millions of users while keeping costs predictable"
+]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def one_request(client: httpx.AsyncClient, url: str, problem: str,
+                      stream: bool) -> Tuple[int, float, Optional[float]]:
+    """Send one battle request and return (status, latency, time to first event)"""
+    started = time.perf_counter()
+    if not stream:
+        response = await client.post(f"{url}/api/solve", json={"problem": problem})
+        return response.status_code, time.perf_counter() - started, None
+    first_event = None
+    async with client.stream("POST", f"{url}/api/solve/stream", json={"problem": problem}) as response:
+        async for line in response.aiter_lines():
+            if first_event is None and line.startswith("event:"):
+                first_event = time.perf_counter() - started
+    return response.status_code, time.perf_counter() - started, first_event
+
+
+async def load(url: str, requests: int, concurrency: int, stream: bool) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    results: List[Tuple[int, float, Optional[float]]] = []
+
+    async def worker(index: int) -> None:
+        async with semaphore:
+            results.append(await one_request(client, url, PROBLEMS[index % len(PROBLEMS)], stream))
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(timeout=None, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+        stats = (await client.get(f"{url}/api/health")).json()
+
+    latencies = [latency for status, latency, _ in results if status == 200]
+    statuses = Counter(status for status, _, _ in results)
+    print(f"requests: {requests}  concurrency: {concurrency}  mode: {'sse' if stream else 'json'}")
+    print(f"statuses: {dict(statuses)}")
+    print(f"throughput: {requests / elapsed:.1f} req/s over {elapsed:.2f}s")
+    if latencies:
+        print(f"latency p50: {percentile(latencies, 0.5) * 1000:.1f} ms  "
+              f"p99: {percentile(latencies, 0.99) * 1000:.1f} ms")
+    first_events = [first for status, _, first in results if status == 200 and first is not None]
+    if first_events:
+        print(f"first event p50: {percentile(first_events, 0.5) * 1000:.1f} ms")
+    print(f"service: {stats}")
+
+
+async def run(url: Optional[str], requests: int, concurrency: int, stream: bool,
+              pool_size: Optional[int], max_queued: Optional[int]) -> None:
+    if url:
+        await load(url.rstrip("/"), requests, concurrency, stream)
+        return
+    service_options = {}
+    if pool_size is not None:
+        service_options["pool_size"] = pool_size
+    if max_queued is not None:
+        service_options["max_queued"] = max_queued
+    runner = web.AppRunner(create_app(BattleService(**service_options)))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        await load(f"http://127.0.0.1:{port}", requests, concurrency, stream)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Base URL of a running service; starts one in-process if omitted")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--stream", action="store_true", help="Use the SSE endpoint")
+    parser.add_argument("--pool-size", type=int, help="Warm agent sets for the in-process service")
+    parser.add_argument("--max-queued", type=int, help="Queue limit for the in-process service")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.requests, args.concurrency, args.stream, args.pool_size, args.max_queued))
@@ -0,0 +1,103 @@
+"""Measure the import cost of every entry point against a startup budget
+
+Run with ``python -m benchmarks.bench_startup``. Each entry point is imported
+``--repeat`` times in a fresh interpreter under ``python -X importtime`` and
+its best cumulative import time is compared with its budget. Entry points
+also list packages they must not load at startup; those checks do not depend
+on the machine. The run exits non-zero when a budget is exceeded or a
+deferred package is imported. Budgets were set at about twice the measured
+times, so scale them with ``--budget-scale`` on slower hardware. Use
+``--top`` to see the slowest modules of each entry point.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class EntryPoint(NamedTuple):
+    name: str
+    module: str
+    budget_ms: float
+    deferred: Tuple[str, ...] = ()
+
+
+ENTRY_POINTS = [
+    # The CLI checks its settings before loading the battle engine
+    EntryPoint("cli", "main", 40.0, ("ui", "battle", "agents", "llm", "httpx", "numpy", "yaml", "asyncio")),
+    EntryPoint("cli engine", "ui.cli_interface", 120.0, ("llm", "httpx", "numpy", "yaml", "asyncio")),
+    EntryPoint("batch", "battle.batch", 300.0, ("llm", "httpx", "yaml", "asyncio")),
+    EntryPoint("server", "server.app", 600.0, ("llm", "httpx")),
+]
+
+
+class ImportProfile(NamedTuple):
+    total_us: int
+    self_us: Dict[str, int]
+
+
+def profile_import(module: str) -> ImportProfile:
+    """Import a module in a fresh interpreter and parse its ``-X importtime`` report"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, check=True, capture_output=True, text=True
+    ).stderr
+    self_us: Dict[str, int] = {}
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue  # Header line
+        name = name.strip()
+        self_us[name] = self_us.get(name, 0) + int(own)
+        if name == module:
+            total_us = int(cumulative)  # The outermost import is reported last
+    return ImportProfile(total_us, self_us)
+
+
+def deferred_imports(profile: ImportProfile, deferred: Tuple[str, ...]) -> List[str]:
+    """Get the deferred packages that were imported anyway"""
+    loaded = {name.split(".")[0] for name in profile.self_us}
+    return [package for package in deferred if package in loaded]
+
+
+def run(repeat: int, budget_scale: float, top: int) -> int:
+    failures = []
+    print(f"{'entry point':<12} {'module':<18} {'import (ms)':>12} {'budget (ms)':>12}  status")
+    for entry in ENTRY_POINTS:
+        profiles = [profile_import(entry.module) for _ in range(repeat)]
+        best = min(profiles, key=lambda profile: profile.total_us)
+        budget = entry.budget_ms * budget_scale
+        problems = []
+        if best.total_us / 1000 > budget:
+            problems.append("over budget")
+        loaded = deferred_imports(best, entry.deferred)
+        if loaded:
+            problems.append("imports " + ",".join(loaded))
+        if problems:
+            failures.append(entry.name)
+        print(f"{entry.name:<12} {entry.module:<18} {best.total_us / 1000:>12.1f} {budget:>12.1f}  "
+              f"{'; '.join(problems) or 'ok'}")
+        if top:
+            slowest = sorted(best.self_us.items(), key=lambda item: item[1], reverse=True)[:top]
+            for name, own in slowest:
+                print(f"{'':<12} {name:<40} {own / 1000:>8.1f}")
+
+    if failures:
+        print(f"\n{len(failures)} entry point(s) failed their startup budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per entry point")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget (2.0 = twice as lenient)")
+    parser.add_argument("--top", type=int, default=0, help="Show the N slowest modules of each entry point")
+    args = parser.parse_args()
+    sys.exit(run(args.repeat, args.budget_scale, args.top))
@@ -0,0 +1,96 @@
+"""Compare memory of lazy thought-process records against eagerly formatted strings
+
+Run with ``python -m benchmarks.bench_thoughts``. The eager mode swaps the
+Thought and LazyText constructors for functions that format immediately,
+which reproduces the strings agents used to build, so both modes produce
+identical rendered output.
+"""
+import argparse
+import random
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Tuple
+import agents.base_expert
+import agents.pragmatic_pete
+import agents.senior_dev_sam
+import battle.battle_manager
+from battle.agent_pool import build_agents
+from battle.battle_manager import BattleManager
+from battle.battle_run_example import BattleConfig
+from benchmarks.suite import VOCABULARY
+
+# Modules that build thought records or lazy analysis text
+LAZY_MODULES = [agents.base_expert, agents.pragmatic_pete, agents.senior_dev_sam, battle.battle_manager]
+
+
+def _eager_thought(agent: str, template: str, **fields: Any) -> str:
+    return template.format(agent=agent, **fields)
+
+
+def _eager_text(template: str, **fields: Any) -> str:
+    return template.format(**fields)
+
+
+@contextmanager
+def eager_thoughts():
+    """Temporarily format thought records and analysis text as soon as they are created"""
+    saved: List[Tuple[Any, str, Any]] = []
+    for module in LAZY_MODULES:
+        for attr, replacement in (("Thought", _eager_thought), ("LazyText", _eager_text)):
+            if hasattr(module, attr):
+                saved.append((module, attr, getattr(module, attr)))
+                setattr(module, attr, replacement)
+    try:
+        yield
+    finally:
+        for module, attr, original in saved:
+            setattr(module, attr, original)
+
+
+def render(value: Any) -> Any:
+    """Render every lazy entry in a result to plain strings"""
+    if isinstance(value, dict):
+        return {key: render(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [render(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def measure(problem: str, rounds: int) -> Tuple[Dict[str, Any], int, int]:
+    """Run one battle and return its result, retained bytes and peak bytes"""
+    manager = BattleManager(build_agents(BattleConfig()))
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = manager.run_battle_with_rebuttals(problem, rounds)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current - baseline, peak - baseline
+
+
+def run(word_counts: List[int], rounds: int) -> None:
+    rng = random.Random(5)
+    print(f"{'words':>7} {'problem KiB':>12} {'eager retained':>15} {'lazy retained':>14} "
+          f"{'eager peak':>11} {'lazy peak':>10} {'saved':>7}  same output")
+    for words in word_counts:
+        problem = " ".join(rng.choice(VOCABULARY) for _ in range(words))
+        with eager_thoughts():
+            eager_result, eager_retained, eager_peak = measure(problem, rounds)
+        lazy_result, lazy_retained, lazy_peak = measure(problem, rounds)
+        same = render(eager_result) == render(lazy_result)
+        print(f"{words:>7} {len(problem) / 1024:>12.1f} {eager_retained / 1024:>12.1f} KiB "
+              f"{lazy_retained / 1024:>10.1f} KiB {eager_peak / 1024:>7.1f} KiB {lazy_peak / 1024:>6.1f} KiB "
+              f"{1 - lazy_retained / eager_retained:>6.0%}  {same}")
+        if not same:
+            raise SystemExit(f"Lazy thoughts rendered differently at {words} words")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[20, 1000, 20000])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    run(args.words, args.rounds)
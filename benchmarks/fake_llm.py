@@ -0,0 +1,58 @@
+"""In-process fake of the chat-completions API for benchmarks
+
+``FakeLLM`` plugs into ``LLMClient(http_transport=...)`` and
+``AsyncLLMClient(http_transport=...)`` through httpx.MockTransport, so
+benchmarks exercise the real request/parse path without sockets or an API key.
+"""
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict
+import httpx
+from llm.stub_server import stub_embedding
+
+
+class FakeLLM:
+    """Answers chat and embedding requests after an optional simulated latency"""
+
+    def __init__(self, latency: float = 0.0, reply: str = "Fake response", dimensions: int = 8):
+        self.latency = latency
+        self.reply = reply
+        self.dimensions = dimensions
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests += 1
+        payload: Dict[str, Any] = json.loads(request.content or b"{}")
+        if request.url.path.endswith("/embeddings"):
+            data = [
+                {"index": i, "embedding": stub_embedding(text, self.dimensions)}
+                for i, text in enumerate(payload.get("input", []))
+            ]
+            return httpx.Response(200, json={"data": data})
+        prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in payload.get("messages", []))
+        return httpx.Response(200, json={
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": self.reply}}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(self.reply.split())}
+        })
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.respond(request)
+
+    async def _handle_async(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.respond(request)
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for the sync LLMClient"""
+        return httpx.MockTransport(self._handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for AsyncLLMClient"""
+        return httpx.MockTransport(self._handle_async)
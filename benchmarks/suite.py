@@ -0,0 +1,263 @@
+"""Benchmark suite for the battle engine, agents, scoring and LLM client
+
+Run with ``python -m benchmarks.suite``. Every scenario runs at several scales
+(agent count, problem length, round count, suggestion list size) and reports
+its best wall time per call over ``--repeat`` runs and its peak traced memory.
+Each run loops the scenario for at least ``MIN_SAMPLE_TIME``, so calls that
+take microseconds are measured as precisely as whole battles, and the runs of
+all scenarios are interleaved to spread machine noise evenly. Results
+are compared with ``benchmarks/baselines.json``; the run exits non-zero when a
+metric regresses by more than ``--threshold``. Record new baselines with
+``--update``. Wall times are machine-specific, so refresh the baselines when
+moving to new hardware.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from battle.agent_pool import build_agents
+from battle.battle_manager import BattleManager
+from battle.battle_run_example import BattleConfig, calculate_solution_score
+from battle.scoring import ScoringEngine
+from benchmarks.bench_scoring import WEIGHTS, make_agents
+from benchmarks.fake_llm import FakeLLM
+from llm.llm_client import LLMClient
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# Differences below these are treated as noise, whatever the ratio. The time floor
+# applies to a whole timed run, so it shrinks per call as the loop grows
+TIME_NOISE_FLOOR = 0.0005  # seconds
+MEMORY_NOISE_FLOOR = 64 * 1024  # bytes
+# Shortest timed run; faster scenarios are called in a loop until they fill it
+MIN_SAMPLE_TIME = 0.01  # seconds
+
+VOCABULARY = [
+    "build", "an", "ai", "powered", "mobile", "app", "for", "enterprise", "teams", "with", "real-time",
+    "data", "privacy", "security", "dashboard", "web", "platform", "users", "market", "growth", "scale",
+    "smart", "live", "business", "interface", "customer", "support", "analytics", "the", "and"
+]
+
+Scenario = Tuple[str, Callable[[], Callable[[], Any]]]
+
+
+def make_problem(words: int, seed: int = 11) -> str:
+    """Build a deterministic problem statement of the given length"""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def make_battle_agents(count: int) -> List[Any]:
+    """Build ``count`` agents, cycling through the personas with unique names"""
+    config = BattleConfig()
+    personas = build_agents(config)
+    agents = []
+    for i in range(count):
+        persona = personas[i % len(personas)]
+        name = persona.name if i < len(personas) else f"{persona.name} #{i // len(personas) + 1}"
+        agents.append(type(persona)(name, config.get_agent_config(persona.name)))
+    return agents
+
+
+def battle_scenarios(agent_counts: List[int], problem_words: List[int], rounds: List[int]) -> Iterator[Scenario]:
+    for count in agent_counts:
+        for words in problem_words:
+            for round_count in rounds:
+                def setup(count=count, words=words, round_count=round_count):
+                    manager = BattleManager(make_battle_agents(count))
+                    problem = make_problem(words)
+                    return lambda: manager.run_battle_with_rebuttals(problem, round_count)
+                yield f"battle_manager agents={count} words={words} rounds={round_count}", setup
+
+
+def agent_scenarios(problem_words: List[int]) -> Iterator[Scenario]:
+    for words in problem_words:
+        problem = make_problem(words)
+        for agent in make_battle_agents(5):
+            def analysis_setup(agent=agent, problem=problem):
+                return lambda: agent.generate_analysis(problem)
+
+            def rebuttal_setup(agent=agent, problem=problem):
+                others = {
+                    other.name: other.generate_analysis(problem)
+                    for other in make_battle_agents(5) if other.name != agent.name
+                }
+                return lambda: agent.generate_rebuttal(others)
+
+            def solution_setup(agent=agent, problem=problem):
+                context = {
+                    "technical_analysis": agent.analyze_problem(problem),
+                    "other_analyses": {},
+                    "rebuttals": {},
+                    "persona": agent.persona
+                }
+                return lambda: agent.generate_solution(problem, context)
+
+            label = f"{type(agent).__name__} words={words}"
+            yield f"agent.generate_analysis {label}", analysis_setup
+            yield f"agent.generate_rebuttal {label}", rebuttal_setup
+            yield f"agent.generate_solution {label}", solution_setup
+
+
+def scoring_scenarios(agent_counts: List[int], list_sizes: List[int]) -> Iterator[Scenario]:
+    for count in agent_counts:
+        for list_size in list_sizes:
+            def reference_setup(count=count, list_size=list_size):
+                suggestions, solutions, styles = make_agents(count, list_size)
+                return lambda: [
+                    [calculate_solution_score(voter, solution, WEIGHTS, style) for solution in solutions]
+                    for voter, style in zip(suggestions, styles)
+                ]
+
+            def engine_setup(count=count, list_size=list_size):
+                suggestions, solutions, styles = make_agents(count, list_size)
+                engine = ScoringEngine(WEIGHTS)
+                return lambda: engine.score_matrix(suggestions, solutions, styles)
+
+            label = f"agents={count} list={list_size}"
+            yield f"calculate_solution_score {label}", reference_setup
+            yield f"ScoringEngine.score_matrix {label}", engine_setup
+
+
+def llm_scenarios(call_counts: List[int]) -> Iterator[Scenario]:
+    for calls in call_counts:
+        def chat_setup(calls=calls):
+            client = LLMClient("bench-key", http_transport=FakeLLM().transport())
+            messages = [{"role": "user", "content": make_problem(50)}]
+            return lambda: [client.generate_response(messages) for _ in range(calls)]
+
+        def embeddings_setup(calls=calls):
+            client = LLMClient("bench-key", http_transport=FakeLLM().transport())
+            texts = [make_problem(12, seed=i) for i in range(calls)]
+            return lambda: client.get_embeddings_batch(texts)
+
+        yield f"LLMClient.generate_response calls={calls}", chat_setup
+        yield f"LLMClient.get_embeddings_batch texts={calls}", embeddings_setup
+
+
+def build_scenarios(quick: bool) -> List[Scenario]:
+    """Assemble every scenario at the quick or full set of scales"""
+    if quick:
+        agent_counts, words, rounds, list_sizes, calls = [5], [20], [3], [8], [50]
+    else:
+        agent_counts, words, rounds, list_sizes, calls = [5, 20], [20, 200], [1, 3], [8, 32], [50, 500]
+    scenarios: List[Scenario] = []
+    scenarios.extend(battle_scenarios(agent_counts, words, rounds))
+    scenarios.extend(agent_scenarios(words))
+    scenarios.extend(scoring_scenarios([5, 50] if not quick else [5], list_sizes))
+    scenarios.extend(llm_scenarios(calls))
+    return scenarios
+
+
+def _loops(fn: Callable[[], Any]) -> int:
+    """Get how many calls of ``fn`` fill MIN_SAMPLE_TIME, going up 1, 2, 5, 10, 20, ..."""
+    loops = 1
+    while True:
+        for step in (1, 2, 5):
+            number = loops * step
+            started = time.perf_counter()
+            for _ in range(number):
+                fn()
+            if time.perf_counter() - started >= MIN_SAMPLE_TIME:
+                return number
+        loops *= 10
+
+
+def measure(scenarios: List[Scenario], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Get each scenario's best wall time per call over ``repeat`` runs and the peak traced memory of one call
+
+    Runs are interleaved, one pass over every scenario at a time, so a burst
+    of machine load slows one run of each scenario instead of all runs of one.
+    """
+    prepared = []
+    for name, setup in scenarios:
+        fn = setup()
+        fn()  # Warm up caches and lazy imports
+        prepared.append((name, fn, _loops(fn)))
+
+    times: Dict[str, List[float]] = {name: [] for name, _, _ in prepared}
+    for _ in range(repeat):
+        for name, fn, loops in prepared:
+            started = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            times[name].append((time.perf_counter() - started) / loops)
+
+    results = {}
+    for name, fn, loops in prepared:
+        # Tracing slows execution, so memory is measured on a separate run
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        results[name] = {"wall_time": min(times[name]), "peak_memory": peak, "loops": loops}
+    return results
+
+
+def compare(result: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Get the names of metrics that regressed past the threshold"""
+    floors = {"wall_time": TIME_NOISE_FLOOR / result.get("loops", 1), "peak_memory": MEMORY_NOISE_FLOOR}
+    regressions = []
+    for metric, floor in floors.items():
+        if metric not in baseline:
+            continue
+        current, previous = result[metric], baseline[metric]
+        if current - previous > floor and current > previous * (1 + threshold):
+            regressions.append(metric)
+    return regressions
+
+
+def _change(current: float, previous: Any) -> str:
+    if not previous:
+        return "new"
+    return f"{(current - previous) / previous * 100:+.0f}%"
+
+
+def run(quick: bool, repeat: int, threshold: float, pattern: str, update: bool, baseline_path: str) -> int:
+    baselines: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baselines = json.load(f)
+
+    failures = []
+    results = measure([scenario for scenario in build_scenarios(quick) if fnmatch.fnmatch(scenario[0], pattern)], repeat)
+    print(f"{'scenario':<62} {'wall (ms)':>10} {'change':>7} {'peak (KiB)':>11} {'change':>7}  status")
+    for name, result in results.items():
+        baseline = baselines.get(name, {})
+        regressions = compare(result, baseline, threshold)
+        status = "REGRESSED " + ",".join(regressions) if regressions else ("ok" if baseline else "no baseline")
+        if regressions:
+            failures.append(name)
+        print(f"{name:<62} {result['wall_time'] * 1000:>10.3f} {_change(result['wall_time'], baseline.get('wall_time')):>7} "
+              f"{result['peak_memory'] / 1024:>11.1f} {_change(result['peak_memory'], baseline.get('peak_memory')):>7}  {status}")
+
+    if update:
+        baselines.update(results)
+        with open(baseline_path, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nUpdated {len(results)} baselines in {baseline_path}")
+        return 0
+    if failures:
+        print(f"\n{len(failures)} scenario(s) regressed by more than {threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Run only the smallest scale of each scenario")
+    parser.add_argument("--repeat", type=int, default=25, help="Timed runs per scenario")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--filter", default="*", help="Only run scenarios matching this glob")
+    parser.add_argument("--update", action="store_true", help="Write the results as the new baselines")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    args = parser.parse_args()
+    sys.exit(run(args.quick, args.repeat, args.threshold, args.filter, args.update, args.baseline))
@@ -1,4 +1,14 @@
 from .settings import *
 
 __all__ = ['MODEL_CONFIGS', 'DEFAULT_MODEL', 'API_TIMEOUT', 'MAX_RETRIES', 
-           'MAX_ROUNDS', 'MIN_SOLUTION_LENGTH', 'MAX_SOLUTION_LENGTH'] 
\ No newline at end of file
+           'OPENAI_API_KEY', 'API_BASE_URL', 'RETRY_BACKOFF_BASE', 'RETRY_BACKOFF_MAX',
+           'MAX_CONNECTIONS', 'MAX_CONCURRENT_REQUESTS', 'EMBEDDING_MODEL',
+           'EMBEDDING_BATCH_SIZE', 'RATE_LIMIT_RPM', 'RATE_LIMIT_TPM', 'MAX_THROTTLED_RETRIES',
+           'CACHE_DIR', 'CACHE_TTL', 'CACHE_MAX_MEMORY_ENTRIES', 'CACHE_MAX_MEMORY_BYTES',
+           'CACHE_MAX_DISK_BYTES',
+           'EXECUTOR_MODE', 'MAX_CONCURRENT_AGENTS', 'AGENT_TIMEOUT',
+           'SERVER_HOST', 'SERVER_PORT', 'BATTLE_CONFIG_FILE', 'MAX_CONCURRENT_BATTLES',
+           'MAX_QUEUED_BATTLES', 'CORS_ORIGIN', 'TRACE_FILE',
+           'MAX_ROUNDS', 'MIN_SOLUTION_LENGTH', 'MAX_SOLUTION_LENGTH',
+           'CONVERGENCE_THRESHOLD', 'MIN_REBUTTAL_ROUNDS', 'REBUTTAL_BUDGET',
+           'BATTLE_SCHEDULER'] 
\ No newline at end of file
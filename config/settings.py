@@ -2,31 +2,51 @@ import os
 from typing import Dict, Any
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables once per process; entry points read them from here
 load_dotenv()
 
-# Model configurations
+# Client-side provider limits per model; unset means only adaptive concurrency applies
+RATE_LIMIT_RPM = int(os.getenv("RATE_LIMIT_RPM")) if os.getenv("RATE_LIMIT_RPM") else None  # requests per minute
+RATE_LIMIT_TPM = int(os.getenv("RATE_LIMIT_TPM")) if os.getenv("RATE_LIMIT_TPM") else None  # tokens per minute
+
+# Model configurations; context_tokens caps the other agents' points passed to a solution,
+# and the per-1K-token prices (USD) order the models for cascade routing
 MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
     "gpt-4-mini": {
         "temperature": float(os.getenv("TEMPERATURE", "0.7")),
         "max_tokens": int(os.getenv("MAX_TOKENS", "1000")),
         "top_p": 1.0,
         "frequency_penalty": 0.0,
-        "presence_penalty": 0.0
+        "presence_penalty": 0.0,
+        "context_tokens": int(os.getenv("CONTEXT_TOKENS", "2000")),
+        "requests_per_minute": RATE_LIMIT_RPM,
+        "tokens_per_minute": RATE_LIMIT_TPM,
+        "input_cost_per_1k": 0.003,
+        "output_cost_per_1k": 0.006
     },
     "gpt-4": {
         "temperature": float(os.getenv("TEMPERATURE", "0.7")),
         "max_tokens": int(os.getenv("MAX_TOKENS", "2000")),
         "top_p": 1.0,
         "frequency_penalty": 0.0,
-        "presence_penalty": 0.0
+        "presence_penalty": 0.0,
+        "context_tokens": int(os.getenv("CONTEXT_TOKENS", "4000")),
+        "requests_per_minute": RATE_LIMIT_RPM,
+        "tokens_per_minute": RATE_LIMIT_TPM,
+        "input_cost_per_1k": 0.03,
+        "output_cost_per_1k": 0.06
     },
     "gpt-3.5-turbo": {
         "temperature": float(os.getenv("TEMPERATURE", "0.7")),
         "max_tokens": int(os.getenv("MAX_TOKENS", "1000")),
         "top_p": 1.0,
         "frequency_penalty": 0.0,
-        "presence_penalty": 0.0
+        "presence_penalty": 0.0,
+        "context_tokens": int(os.getenv("CONTEXT_TOKENS", "2000")),
+        "requests_per_minute": RATE_LIMIT_RPM,
+        "tokens_per_minute": RATE_LIMIT_TPM,
+        "input_cost_per_1k": 0.0005,
+        "output_cost_per_1k": 0.0015
     }
 }
 
@@ -34,10 +54,49 @@ MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
 DEFAULT_MODEL = os.getenv("MODEL_NAME", "gpt-4-mini")
 
 # API settings
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+API_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
 API_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+RETRY_BACKOFF_MAX = 8.0  # seconds
+MAX_CONNECTIONS = int(os.getenv("MAX_CONNECTIONS", "20"))
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "10"))
+MAX_THROTTLED_RETRIES = 8  # 429s retried through the rate limiter without using up MAX_RETRIES
+EMBEDDING_MODEL = "text-embedding-ada-002"
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))  # inputs per request
+
+# Response cache settings
+CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))  # seconds
+CACHE_MAX_MEMORY_ENTRIES = 1024
+CACHE_MAX_MEMORY_BYTES = 16 * 1024 * 1024
+CACHE_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+# Agent execution settings
+EXECUTOR_MODE = os.getenv("EXECUTOR_MODE", "sequential")  # sequential, thread, asyncio
+MAX_CONCURRENT_AGENTS = int(os.getenv("MAX_CONCURRENT_AGENTS", "8"))
+AGENT_TIMEOUT = float(os.getenv("AGENT_TIMEOUT")) if os.getenv("AGENT_TIMEOUT") else None  # seconds
 
 # Battle settings
 MAX_ROUNDS = 3
 MIN_SOLUTION_LENGTH = 100
-MAX_SOLUTION_LENGTH = 2000 
\ No newline at end of file
+MAX_SOLUTION_LENGTH = 2000
+
+# Rebuttal round settings
+# Stop rebuttal rounds once consecutive rounds are at least this similar (0-1); off when unset
+CONVERGENCE_THRESHOLD = float(os.getenv("CONVERGENCE_THRESHOLD")) if os.getenv("CONVERGENCE_THRESHOLD") else None
+MIN_REBUTTAL_ROUNDS = int(os.getenv("MIN_REBUTTAL_ROUNDS", "2"))  # rounds run before convergence can stop a battle
+BATTLE_SCHEDULER = os.getenv("BATTLE_SCHEDULER", "phases")  # phases, or dag to start each agent's work once its inputs are ready
+REBUTTAL_BUDGET = int(os.getenv("REBUTTAL_BUDGET")) if os.getenv("REBUTTAL_BUDGET") else None  # points per agent per round; unbounded when unset
+
+# HTTP service settings
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "5000"))
+BATTLE_CONFIG_FILE = os.getenv("BATTLE_CONFIG_FILE", "battle_config.yaml")
+MAX_CONCURRENT_BATTLES = int(os.getenv("MAX_CONCURRENT_BATTLES", "4"))  # warm agent sets
+MAX_QUEUED_BATTLES = int(os.getenv("MAX_QUEUED_BATTLES", "32"))  # waiting requests before 503
+CORS_ORIGIN = os.getenv("CORS_ORIGIN", "*")
+
+# Tracing settings
+TRACE_FILE = os.getenv("TRACE_FILE")  # Chrome trace JSON written at exit; tracing is off when unset
@@ -1,3 +1,4 @@
-from .llm_client import LLMClient
+from .llm_client import LLMClient, AsyncLLMClient
+from .router import ModelRouter, AsyncModelRouter, RoutingPolicy
 
-__all__ = ['LLMClient'] 
\ No newline at end of file
+__all__ = ['LLMClient', 'AsyncLLMClient', 'ModelRouter', 'AsyncModelRouter', 'RoutingPolicy']
@@ -0,0 +1,74 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
+import numpy as np
+from config.settings import CACHE_DIR
+
+
+def text_hash(text: str) -> str:
+    """Content hash used to key an embedding"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk store of float32 embedding vectors keyed by model and text hash"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path if path is not None else os.path.join(CACHE_DIR, "embeddings.sqlite3")
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, hash))"
+        )
+        self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Look up cached vectors, returning only the texts that were found"""
+        hashes = {text_hash(text): text for text in texts}
+        found: Dict[str, np.ndarray] = {}
+        keys = list(hashes)
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                    [model, *chunk]
+                ).fetchall()
+                for digest, blob in rows:
+                    found[hashes[digest]] = np.frombuffer(blob, dtype=np.float32)
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+        return found
+
+    def set_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        """Store vectors for the given texts"""
+        rows = [
+            (model, text_hash(text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in vectors.items()
+        ]
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)", rows
+            )
+            self._db.commit()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and the number of stored vectors"""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        """Close the SQLite connection"""
+        with self._lock:
+            self._db.close()
@@ -1,11 +1,95 @@
-import openai
-from typing import Dict, Any, List
-from config.settings import MODEL_CONFIGS, DEFAULT_MODEL, API_TIMEOUT, MAX_RETRIES
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Iterator, AsyncIterator, Sequence, Tuple
+import httpx
+import numpy as np
+from config.settings import (
+    MODEL_CONFIGS, DEFAULT_MODEL, MAX_CONCURRENT_REQUESTS, MAX_THROTTLED_RETRIES,
+    EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE
+)
+from llm.transport import ChatCompletionsTransport
+from llm.response_cache import ResponseCache, cache_key
+from llm.embedding_cache import EmbeddingCache
+from llm.single_flight import AsyncSingleFlight, SingleFlight
+from llm.rate_limiter import Permit, RateLimiter, rate_limiter_for
+from telemetry.tracing import span
+
+def _lookup_key(cache: Optional[ResponseCache], payload: Dict[str, Any],
+                cache_nondeterministic: bool) -> Optional[str]:
+    """Get the cache key for a request, or None when the cache should be bypassed
+
+    Sampled responses (temperature > 0) are only cached when explicitly opted in.
+    """
+    if cache is None:
+        return None
+    if payload["temperature"] > 0 and not cache_nondeterministic:
+        cache.record_bypass()
+        return None
+    return cache_key(payload)
+
+
+def _flight_key(payload: Dict[str, Any], key: Optional[str], cache_nondeterministic: bool) -> Optional[str]:
+    """Get the key identical in-flight requests share, or None when the request must run on its own
+
+    Like caching, sharing a sampled response (temperature > 0) needs the explicit opt-in.
+    """
+    if payload["temperature"] > 0 and not cache_nondeterministic:
+        return None
+    return key or cache_key(payload)
+
+
+def _settle(limiter: Optional[RateLimiter], permit: Optional[Permit],
+            error: Optional[Exception] = None, body: Optional[Dict[str, Any]] = None) -> bool:
+    """Return a permit to its limiter with the request's outcome, reporting whether it was throttled"""
+    if limiter is None:
+        return False
+    if error is None:
+        limiter.release(permit, 200, tokens_used=(body or {}).get("usage", {}).get("total_tokens"))
+        return False
+    status = ChatCompletionsTransport.status_of(error)
+    limiter.release(permit, status, retry_after=ChatCompletionsTransport.retry_after(error))
+    return status == 429
+
+
+def _plan_embeddings(cache: Optional[EmbeddingCache],
+                     texts: Sequence[str]) -> Tuple[List[str], Dict[str, np.ndarray], List[List[str]]]:
+    """Dedupe texts, pull cached vectors and split the rest into provider-sized batches"""
+    unique = list(dict.fromkeys(texts))
+    vectors = cache.get_many(EMBEDDING_MODEL, unique) if cache is not None else {}
+    missing = [text for text in unique if text not in vectors]
+    batches = [missing[i:i + EMBEDDING_BATCH_SIZE] for i in range(0, len(missing), EMBEDDING_BATCH_SIZE)]
+    return unique, vectors, batches
+
+
+def _assemble_embeddings(texts: Sequence[str], unique: List[str],
+                         vectors: Dict[str, np.ndarray]) -> np.ndarray:
+    """Build a contiguous float32 matrix with one row per input text"""
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    unique_matrix = np.stack([np.asarray(vectors[text], dtype=np.float32) for text in unique])
+    row_of = {text: row for row, text in enumerate(unique)}
+    return np.ascontiguousarray(unique_matrix[[row_of[text] for text in texts]])
+
 
 class LLMClient:
-    def __init__(self, api_key: str):
-        openai.api_key = api_key
+    def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: Optional[float] = None,
+                 http_transport: Optional[httpx.BaseTransport] = None,
+                 cache: Optional[ResponseCache] = None, cache_nondeterministic: bool = False,
+                 embedding_cache: Optional[EmbeddingCache] = None, coalesce: bool = True,
+                 rate_limit: bool = True, rate_limiter: Optional[RateLimiter] = None):
+        self.transport = ChatCompletionsTransport(api_key, base_url, timeout)
         self.model = DEFAULT_MODEL
+        self.cache = cache
+        self.cache_nondeterministic = cache_nondeterministic
+        self.embedding_cache = embedding_cache
+        # Identical concurrent deterministic requests share one call; sampled ones only
+        # share a sample under cache_nondeterministic
+        self.single_flight = SingleFlight() if coalesce else None
+        # Requests queue behind a per-model limiter shared by every client in the process
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter
+        # One pooled client per LLMClient so agents sharing it reuse connections
+        self._http = httpx.Client(transport=http_transport, **self.transport.client_options())
 
     def set_model(self, model: str):
         """Set the model to use"""
@@ -14,31 +98,323 @@ class LLMClient:
         else:
             raise ValueError(f"Model {model} not supported")
 
-    def generate_response(self, messages: List[Dict[str, str]]) -> str:
-        """Generate a response from the LLM"""
-        config = MODEL_CONFIGS[self.model]
-        
-        for attempt in range(MAX_RETRIES):
+    def _resolve_model(self, model: Optional[str]) -> str:
+        if model is None:
+            return self.model
+        if model not in MODEL_CONFIGS:
+            raise ValueError(f"Model {model} not supported")
+        return model
+
+    def _limiter(self, payload: Dict[str, Any]) -> Optional[RateLimiter]:
+        if not self.rate_limit:
+            return None
+        return self.rate_limiter or rate_limiter_for(payload["model"])
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a JSON request, retrying transient failures with backoff
+
+        With rate limiting on, the request first waits its turn in the model's
+        limiter. Throttled (429) responses are retried once the limiter has
+        waited out the throttle, up to MAX_THROTTLED_RETRIES times, without
+        using up MAX_RETRIES.
+        """
+        limiter = self._limiter(payload)
+        tokens = self.transport.estimate_tokens(payload)
+        attempt = throttles = 0
+        while True:
+            permit = limiter.acquire(tokens) if limiter is not None else None
             try:
-                response = openai.ChatCompletion.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=config["temperature"],
-                    max_tokens=config["max_tokens"],
-                    top_p=config["top_p"],
-                    frequency_penalty=config["frequency_penalty"],
-                    presence_penalty=config["presence_penalty"]
-                )
-                return response.choices[0].message.content
+                response = self._http.post(path, json=payload)
+                response.raise_for_status()
+                body = response.json()
             except Exception as e:
-                if attempt == MAX_RETRIES - 1:
+                if _settle(limiter, permit, error=e) and throttles < MAX_THROTTLED_RETRIES:
+                    throttles += 1
+                    continue
+                attempt += 1
+                if (not isinstance(e, httpx.HTTPError) or attempt == self.transport.max_retries
+                        or not self.transport.is_retryable(e)):
                     raise e
-                continue
+                time.sleep(self.transport.backoff_delay(attempt - 1))
+            except BaseException as e:
+                _settle(limiter, permit, error=e)
+                raise
+            else:
+                _settle(limiter, permit, body=body)
+                return body
+
+    def generate_response(self, messages: List[Dict[str, str]], model: Optional[str] = None) -> str:
+        """Generate a response from the LLM, served from the cache when possible
+
+        ``model`` overrides the client's model for this call.
+        """
+        model = self._resolve_model(model)
+        with span("LLMClient.generate_response", "llm", model=model) as trace:
+            payload = self.transport.chat_payload(model, messages)
+            key = _lookup_key(self.cache, payload, self.cache_nondeterministic)
+            if key is not None:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    trace.set(cached=True)
+                    return cached
+
+            flight_key = _flight_key(payload, key, self.cache_nondeterministic)
+            if self.single_flight is not None and flight_key is not None:
+                (content, usage), shared = self.single_flight.do(flight_key, lambda: self._complete(payload, key))
+            else:
+                (content, usage), shared = self._complete(payload, key), False
+            if shared:
+                trace.set(cached=False, coalesced=True)
+            else:
+                trace.set(cached=False, prompt_tokens=usage.get("prompt_tokens"),
+                          completion_tokens=usage.get("completion_tokens"))
+            return content
+
+    def _complete(self, payload: Dict[str, Any], key: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        """Request a chat completion and cache it, returning its text and token usage"""
+        body = self._post("/chat/completions", payload)
+        content = self.transport.parse_chat(body)
+        if key is not None:
+            self.cache.set(key, content)
+        return content, body.get("usage") or {}
+
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream response tokens from the LLM as they arrive"""
+        payload = self.transport.chat_payload(self.model, messages, stream=True)
+        limiter = self._limiter(payload)
+        tokens = self.transport.estimate_tokens(payload)
+        for attempt in range(self.transport.max_retries):
+            started = False
+            permit = limiter.acquire(tokens) if limiter is not None else None
+            try:
+                with self._http.stream("POST", "/chat/completions", json=payload) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        token = self.transport.parse_stream_line(line)
+                        if token:
+                            started = True
+                            yield token
+            except BaseException as e:
+                _settle(limiter, permit, error=e)
+                # Tokens already handed to the caller cannot be replayed
+                if (not isinstance(e, httpx.HTTPError) or started or attempt == self.transport.max_retries - 1
+                        or not self.transport.is_retryable(e)):
+                    raise e
+                time.sleep(self.transport.backoff_delay(attempt))
+            else:
+                _settle(limiter, permit)
+                return
 
     def get_embeddings(self, text: str) -> List[float]:
         """Get embeddings for the given text"""
-        response = openai.Embedding.create(
-            input=text,
-            model="text-embedding-ada-002"
-        )
-        return response.data[0].embedding 
\ No newline at end of file
+        body = self._post("/embeddings", self.transport.embeddings_payload([text]))
+        return self.transport.parse_embeddings(body)[0]
+
+    def get_embeddings_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed many texts in batched calls, returning a (len(texts), dim) float32 matrix
+
+        Identical strings are embedded once and vectors are reused from the
+        embedding cache when one is configured.
+        """
+        unique, vectors, batches = _plan_embeddings(self.embedding_cache, texts)
+        for batch in batches:
+            body = self._post("/embeddings", self.transport.embeddings_payload(batch))
+            fetched = dict(zip(batch, self.transport.parse_embeddings(body)))
+            if self.embedding_cache is not None:
+                self.embedding_cache.set_many(EMBEDDING_MODEL, fetched)
+            vectors.update(fetched)
+        return _assemble_embeddings(texts, unique, vectors)
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Get the number of chat calls made and identical concurrent requests coalesced onto them"""
+        if self.single_flight is None:
+            return {"calls": 0, "coalesced": 0, "in_flight": 0}
+        return self.single_flight.get_stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Get the rate limiter counters for the current model"""
+        limiter = self._limiter({"model": self.model})
+        return limiter.get_stats() if limiter is not None else {}
+
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self._http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncLLMClient:
+    def __init__(self, api_key: str, base_url: Optional[str] = None, timeout: Optional[float] = None,
+                 max_concurrency: Optional[int] = None,
+                 http_transport: Optional[httpx.AsyncBaseTransport] = None,
+                 cache: Optional[ResponseCache] = None, cache_nondeterministic: bool = False,
+                 embedding_cache: Optional[EmbeddingCache] = None, coalesce: bool = True,
+                 rate_limit: bool = True, rate_limiter: Optional[RateLimiter] = None):
+        self.transport = ChatCompletionsTransport(api_key, base_url, timeout)
+        self.model = DEFAULT_MODEL
+        self.cache = cache
+        self.cache_nondeterministic = cache_nondeterministic
+        self.embedding_cache = embedding_cache
+        # Identical concurrent deterministic requests share one call; sampled ones only
+        # share a sample under cache_nondeterministic
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency or MAX_CONCURRENT_REQUESTS
+        self._http = httpx.AsyncClient(transport=http_transport, **self.transport.client_options())
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def set_model(self, model: str):
+        """Set the model to use"""
+        if model in MODEL_CONFIGS:
+            self.model = model
+        else:
+            raise ValueError(f"Model {model} not supported")
+
+    def _resolve_model(self, model: Optional[str]) -> str:
+        if model is None:
+            return self.model
+        if model not in MODEL_CONFIGS:
+            raise ValueError(f"Model {model} not supported")
+        return model
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the loop the client is first used on
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _limiter(self, payload: Dict[str, Any]) -> Optional[RateLimiter]:
+        if not self.rate_limit:
+            return None
+        return self.rate_limiter or rate_limiter_for(payload["model"])
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a JSON request, retrying transient failures with backoff
+
+        Rate limiting works as in LLMClient._post; queued requests wait for
+        the limiter before taking a semaphore slot.
+        """
+        limiter = self._limiter(payload)
+        tokens = self.transport.estimate_tokens(payload)
+        attempt = throttles = 0
+        while True:
+            permit = await limiter.acquire_async(tokens) if limiter is not None else None
+            try:
+                async with self.semaphore:
+                    response = await self._http.post(path, json=payload)
+                    response.raise_for_status()
+                    body = response.json()
+            except Exception as e:
+                if _settle(limiter, permit, error=e) and throttles < MAX_THROTTLED_RETRIES:
+                    throttles += 1
+                    continue
+                attempt += 1
+                if (not isinstance(e, httpx.HTTPError) or attempt == self.transport.max_retries
+                        or not self.transport.is_retryable(e)):
+                    raise e
+                # Sleep outside the semaphore so backoff does not hold a slot
+                await asyncio.sleep(self.transport.backoff_delay(attempt - 1))
+            except BaseException as e:
+                _settle(limiter, permit, error=e)
+                raise
+            else:
+                _settle(limiter, permit, body=body)
+                return body
+
+    async def generate_response(self, messages: List[Dict[str, str]], model: Optional[str] = None) -> str:
+        """Generate a response from the LLM, served from the cache when possible
+
+        ``model`` overrides the client's model for this call.
+        """
+        payload = self.transport.chat_payload(self._resolve_model(model), messages)
+        key = _lookup_key(self.cache, payload, self.cache_nondeterministic)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        flight_key = _flight_key(payload, key, self.cache_nondeterministic)
+        if self.single_flight is not None and flight_key is not None:
+            content, _ = await self.single_flight.do(flight_key, lambda: self._complete(payload, key))
+            return content
+        return await self._complete(payload, key)
+
+    async def _complete(self, payload: Dict[str, Any], key: Optional[str]) -> str:
+        """Request a chat completion and cache it"""
+        content = self.transport.parse_chat(await self._post("/chat/completions", payload))
+        if key is not None:
+            self.cache.set(key, content)
+        return content
+
+    async def stream_response(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream response tokens from the LLM as they arrive"""
+        payload = self.transport.chat_payload(self.model, messages, stream=True)
+        limiter = self._limiter(payload)
+        tokens = self.transport.estimate_tokens(payload)
+        for attempt in range(self.transport.max_retries):
+            started = False
+            permit = await limiter.acquire_async(tokens) if limiter is not None else None
+            try:
+                async with self.semaphore:
+                    async with self._http.stream("POST", "/chat/completions", json=payload) as response:
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            token = self.transport.parse_stream_line(line)
+                            if token:
+                                started = True
+                                yield token
+            except BaseException as e:
+                _settle(limiter, permit, error=e)
+                # Tokens already handed to the caller cannot be replayed
+                if (not isinstance(e, httpx.HTTPError) or started or attempt == self.transport.max_retries - 1
+                        or not self.transport.is_retryable(e)):
+                    raise e
+                await asyncio.sleep(self.transport.backoff_delay(attempt))
+            else:
+                _settle(limiter, permit)
+                return
+
+    async def get_embeddings(self, text: str) -> List[float]:
+        """Get embeddings for the given text"""
+        body = await self._post("/embeddings", self.transport.embeddings_payload([text]))
+        return self.transport.parse_embeddings(body)[0]
+
+    async def get_embeddings_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed many texts in concurrent batched calls, returning a float32 matrix"""
+        unique, vectors, batches = _plan_embeddings(self.embedding_cache, texts)
+        bodies = await asyncio.gather(*(
+            self._post("/embeddings", self.transport.embeddings_payload(batch)) for batch in batches
+        ))
+        for batch, body in zip(batches, bodies):
+            fetched = dict(zip(batch, self.transport.parse_embeddings(body)))
+            if self.embedding_cache is not None:
+                self.embedding_cache.set_many(EMBEDDING_MODEL, fetched)
+            vectors.update(fetched)
+        return _assemble_embeddings(texts, unique, vectors)
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Get the number of chat calls made and identical concurrent requests coalesced onto them"""
+        if self.single_flight is None:
+            return {"calls": 0, "coalesced": 0, "in_flight": 0}
+        return self.single_flight.get_stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Get the rate limiter counters for the current model"""
+        limiter = self._limiter({"model": self.model})
+        return limiter.get_stats() if limiter is not None else {}
+
+    async def aclose(self):
+        """Close the pooled HTTP connections"""
+        await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, NamedTuple, Optional
+from config.settings import (
+    MODEL_CONFIGS, MAX_CONNECTIONS, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX
+)
+
+# Share of the concurrency window kept after a throttled response
+DECREASE_FACTOR = 0.5
+# How often queued async callers re-check the limiter
+ASYNC_POLL_INTERVAL = 0.01  # seconds
+
+
+class TokenBucket:
+    """Refills ``per_minute`` units a minute, holding at most one minute's worth"""
+
+    def __init__(self, per_minute: float, window: float = 60.0):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / window  # units per second
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` units are available"""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+
+class Permit(NamedTuple):
+    """A request admitted by a RateLimiter, to be handed back to ``release``"""
+
+    tokens: int
+    epoch: int
+
+
+class _Waiter:
+    __slots__ = ("tokens",)
+
+    def __init__(self, tokens: int):
+        self.tokens = tokens
+
+
+class RateLimiter:
+    """Client-side limits for one model: requests and tokens per minute plus adaptive concurrency
+
+    Callers queue in arrival order and the head of the queue is admitted
+    once both token buckets hold enough and a concurrency slot is free, so
+    a large request is never starved by smaller ones behind it. The
+    concurrency window follows AIMD: every successful response widens it
+    by 1/window, and a throttled (429) response halves it, at most once per
+    window. A throttled response also pauses admissions for its Retry-After,
+    or for an exponential backoff when the server sends none.
+    Sync and async callers share one queue.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 max_concurrency: int = MAX_CONNECTIONS, window: float = 60.0):
+        self.requests = TokenBucket(requests_per_minute, window) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, window) if tokens_per_minute else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency = float(self.max_concurrency)
+        self.in_flight = 0
+        self._epoch = 0
+        self._paused_until = 0.0
+        self._throttle_streak = 0
+        self._queue: Deque[_Waiter] = deque()
+        self._cond = threading.Condition()
+        self._stats = {"admitted": 0, "throttled": 0, "decreases": 0, "wait_seconds": 0.0}
+
+    def _admit(self, waiter: _Waiter, now: float) -> Optional[float]:
+        """Admit the waiter if it is first in line and there is capacity
+
+        Returns 0 once admitted, otherwise the seconds to wait, or None to
+        wait for a release.
+        """
+        if self._queue[0] is not waiter or self.in_flight >= int(self.concurrency):
+            return None
+        wait = self._paused_until - now
+        for bucket, amount in ((self.requests, 1), (self.tokens, waiter.tokens)):
+            if bucket is not None:
+                wait = max(wait, bucket.wait_time(amount, now))
+        if wait > 0:
+            return wait
+        for bucket, amount in ((self.requests, 1), (self.tokens, waiter.tokens)):
+            if bucket is not None:
+                bucket.take(amount, now)
+        self._queue.popleft()
+        self.in_flight += 1
+        self._stats["admitted"] += 1
+        # The next caller in line may fit as well
+        self._cond.notify_all()
+        return 0.0
+
+    def _leave(self, waiter: _Waiter) -> None:
+        with self._cond:
+            if waiter in self._queue:
+                self._queue.remove(waiter)
+                self._cond.notify_all()
+
+    def acquire(self, tokens: int = 0) -> Permit:
+        """Wait in line until the request may be sent"""
+        waiter = _Waiter(tokens)
+        started = time.monotonic()
+        try:
+            with self._cond:
+                self._queue.append(waiter)
+                while True:
+                    wait = self._admit(waiter, time.monotonic())
+                    if wait == 0:
+                        self._stats["wait_seconds"] += time.monotonic() - started
+                        return Permit(tokens, self._epoch)
+                    self._cond.wait(wait)
+        except BaseException:
+            self._leave(waiter)
+            raise
+
+    async def acquire_async(self, tokens: int = 0) -> Permit:
+        """Wait in line, without blocking the event loop, until the request may be sent"""
+        waiter = _Waiter(tokens)
+        started = time.monotonic()
+        with self._cond:
+            self._queue.append(waiter)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._admit(waiter, time.monotonic())
+                    if wait == 0:
+                        self._stats["wait_seconds"] += time.monotonic() - started
+                        return Permit(tokens, self._epoch)
+                await asyncio.sleep(ASYNC_POLL_INTERVAL if wait is None else min(wait, ASYNC_POLL_INTERVAL * 10))
+        except BaseException:
+            self._leave(waiter)
+            raise
+
+    def release(self, permit: Permit, status: Optional[int] = None, retry_after: Optional[float] = None,
+                tokens_used: Optional[int] = None) -> None:
+        """Hand back a permit with the HTTP status of its request, None when it never got one
+
+        A 2xx widens the concurrency window and a 429 narrows it; other
+        outcomes leave it alone.
+        """
+        with self._cond:
+            now = time.monotonic()
+            self.in_flight -= 1
+            if status == 429:
+                self._stats["throttled"] += 1
+                # Responses to requests sent before the last decrease say nothing new
+                if permit.epoch == self._epoch:
+                    self.concurrency = max(1.0, self.concurrency * DECREASE_FACTOR)
+                    self._epoch += 1
+                    self._stats["decreases"] += 1
+                self._throttle_streak += 1
+                if retry_after is None:
+                    retry_after = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** (self._throttle_streak - 1)))
+                self._paused_until = max(self._paused_until, now + retry_after)
+            elif status is not None and 200 <= status < 300:
+                self._throttle_streak = 0
+                self.concurrency = min(float(self.max_concurrency), self.concurrency + 1.0 / self.concurrency)
+                if tokens_used is not None and self.tokens is not None and tokens_used > permit.tokens:
+                    # Providers charge max_tokens up front, so only an underestimate is settled
+                    self.tokens.take(tokens_used - permit.tokens, now)
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission counters and the current concurrency window"""
+        with self._cond:
+            return {
+                **self._stats,
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "queued": len(self._queue)
+            }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def rate_limiter_for(model: str) -> RateLimiter:
+    """Get the process-wide limiter for a model, configured from MODEL_CONFIGS
+
+    Models without ``requests_per_minute`` or ``tokens_per_minute`` still get
+    adaptive concurrency and Retry-After handling.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(model)
+        if limiter is None:
+            config = MODEL_CONFIGS.get(model, {})
+            limiter = _limiters[model] = RateLimiter(config.get("requests_per_minute"),
+                                                     config.get("tokens_per_minute"))
+        return limiter
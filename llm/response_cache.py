@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from config.settings import (
+    CACHE_DIR, CACHE_TTL, CACHE_MAX_MEMORY_ENTRIES, CACHE_MAX_MEMORY_BYTES, CACHE_MAX_DISK_BYTES
+)
+
+# Disk eviction frees space down to this fraction of the bound, so it runs once per batch of writes
+DISK_EVICTION_TARGET = 0.9
+# Disk hits buffer their last-access times and write them in batches of this size
+ACCESS_FLUSH_BATCH = 256
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """Content hash of a request payload (model, messages and sampling params)"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier response cache: an in-memory LRU in front of a SQLite file
+
+    Entries expire after ``ttl`` seconds (None keeps them forever). Each tier is
+    bounded by size and evicts least recently used entries first. The disk
+    tier's size is kept as a running total, recounted from the file only when
+    it passes the bound, and disk hits record their access time in batches,
+    so neither a write nor a hit scans the table.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = CACHE_TTL,
+                 max_memory_entries: int = CACHE_MAX_MEMORY_ENTRIES,
+                 max_memory_bytes: int = CACHE_MAX_MEMORY_BYTES,
+                 max_disk_bytes: int = CACHE_MAX_DISK_BYTES):
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._accessed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "writes": 0,
+            "evictions": 0,
+            "bytes_read": 0,
+            "bytes_written": 0
+        }
+
+        self.path = path if path is not None else os.path.join(CACHE_DIR, "responses.sqlite3")
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        self._db.commit()
+        self._disk_bytes = self._count_disk_bytes()
+
+    def _count_disk_bytes(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        return now + self.ttl if self.ttl is not None else None
+
+    def _remember(self, key: str, value: str, expires_at: Optional[float]) -> None:
+        """Put an entry in the memory tier and evict down to its bounds"""
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key)[0].encode("utf-8"))
+        self._memory[key] = (value, expires_at)
+        self._memory_bytes += len(value.encode("utf-8"))
+        while self._memory and (len(self._memory) > self.max_memory_entries
+                                or self._memory_bytes > self.max_memory_bytes):
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.encode("utf-8"))
+            self._stats["evictions"] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    self._stats["bytes_read"] += len(value.encode("utf-8"))
+                    return value
+                self._memory_bytes -= len(self._memory.pop(key)[0].encode("utf-8"))
+
+            row = self._db.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._delete(key)
+                    self._db.commit()
+                self._stats["misses"] += 1
+                return None
+
+            value, expires_at = row
+            self._accessed[key] = now
+            if len(self._accessed) >= ACCESS_FLUSH_BATCH:
+                self._flush_accessed()
+                self._db.commit()
+            self._remember(key, value, expires_at)
+            self._stats["disk_hits"] += 1
+            self._stats["bytes_read"] += len(value.encode("utf-8"))
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response in both tiers"""
+        now = time.time()
+        expires_at = self._expires_at(now)
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self._accessed.pop(key, None)
+            replaced = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, expires_at, now)
+            )
+            self._disk_bytes += size - (replaced[0] if replaced else 0)
+            self._evict_disk(now)
+            self._db.commit()
+            self._stats["writes"] += 1
+            self._stats["bytes_written"] += size
+
+    def _delete(self, key: str) -> None:
+        row = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._disk_bytes -= row[0]
+
+    def _flush_accessed(self) -> None:
+        """Write the buffered last-access times of disk hits"""
+        if self._accessed:
+            self._db.executemany(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def _evict_disk(self, now: float) -> None:
+        """Drop expired rows, then least recently used rows once the tier is over its size bound"""
+        expired = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        ).fetchone()[0]
+        if expired:
+            self._db.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            self._disk_bytes -= expired
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        # Other processes may share the file, so check the real size before evicting
+        self._disk_bytes = self._count_disk_bytes()
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        self._flush_accessed()
+        target = self.max_disk_bytes * DISK_EVICTION_TARGET
+        evicted = []
+        # The cursor walks the last_access index, so only the evicted rows are read
+        oldest = self._db.execute("SELECT key, size FROM responses ORDER BY last_access ASC")
+        for key, size in oldest:
+            if self._disk_bytes <= target:
+                break
+            evicted.append((key,))
+            self._disk_bytes -= size
+        oldest.close()
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._stats["evictions"] += len(evicted)
+
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache"""
+        with self._lock:
+            self._stats["bypassed"] += 1
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._accessed.clear()
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._disk_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and the current size of each tier"""
+        with self._lock:
+            disk_entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            stats = dict(self._stats)
+            stats.update({
+                "hits": stats["memory_hits"] + stats["disk_hits"],
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": disk_entries,
+                "disk_bytes": self._disk_bytes
+            })
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Write buffered access times and close the SQLite connection"""
+        with self._lock:
+            self._flush_accessed()
+            self._db.commit()
+            self._db.close()
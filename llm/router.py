@@ -0,0 +1,190 @@
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from config.settings import MODEL_CONFIGS, MIN_SOLUTION_LENGTH
+from telemetry.tracing import span
+
+# A validator gets the request messages and a model's response and says whether it is good enough
+Validator = Callable[[List[Dict[str, str]], str], bool]
+
+_REFUSAL = re.compile(r"^\s*(i'm sorry|i am sorry|i can't|i cannot|as an ai)\b", re.IGNORECASE)
+
+
+def not_empty(messages: List[Dict[str, str]], response: str) -> bool:
+    """Accept any response with non-whitespace content"""
+    return bool(response.strip())
+
+
+def no_refusal(messages: List[Dict[str, str]], response: str) -> bool:
+    """Reject responses that open with a refusal or an apology"""
+    return not _REFUSAL.match(response)
+
+
+def min_length(characters: int) -> Validator:
+    """Build a validator that rejects responses shorter than ``characters``"""
+    def check(messages: List[Dict[str, str]], response: str) -> bool:
+        return len(response.strip()) >= characters
+    check.__name__ = f"min_length({characters})"
+    return check
+
+
+def model_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Get the USD cost of a call from the model's per-1K-token prices"""
+    config = MODEL_CONFIGS[model]
+    return (prompt_tokens * config.get("input_cost_per_1k", 0.0)
+            + completion_tokens * config.get("output_cost_per_1k", 0.0)) / 1000
+
+
+def models_by_cost() -> Tuple[str, ...]:
+    """Get the configured models from cheapest to most expensive"""
+    return tuple(sorted(MODEL_CONFIGS, key=lambda model: model_cost(model, 1000, 1000)))
+
+
+def _estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+class RoutingPolicy(NamedTuple):
+    """How one phase's requests are routed
+
+    ``models`` is the cascade, tried in order; empty means every configured
+    model from cheapest to most expensive. Without ``escalate`` only the
+    first model is used. Otherwise the next model is tried whenever a
+    validator rejects the response, and the last model's answer is kept.
+    """
+
+    models: Tuple[str, ...] = ()
+    validators: Tuple[Validator, ...] = (not_empty, no_refusal)
+    escalate: bool = True
+
+
+DEFAULT_POLICIES: Dict[str, RoutingPolicy] = {
+    "analysis": RoutingPolicy(),
+    "rebuttal": RoutingPolicy(escalate=False),
+    "solution": RoutingPolicy(validators=(not_empty, no_refusal, min_length(MIN_SOLUTION_LENGTH))),
+    "default": RoutingPolicy()
+}
+
+
+class Route(NamedTuple):
+    """The outcome of one routed request"""
+
+    phase: str
+    model: str
+    attempts: Tuple[str, ...]
+    latency: float
+    cost: float
+    reference_cost: float
+
+
+class ModelRouter:
+    """Sends each request to the cheapest model its phase allows and escalates only when needed
+
+    Policies are looked up by phase, falling back to ``"default"``. Every
+    routed call is compared with sending it straight to ``reference_model``
+    (the most expensive configured model unless given). Cost is estimated
+    from the request and response text and the models' prices. Latency
+    saved uses the reference model's mean observed latency, or
+    ``reference_latency`` until it has served a call.
+    """
+
+    def __init__(self, client: Any, policies: Optional[Dict[str, RoutingPolicy]] = None,
+                 reference_model: Optional[str] = None, reference_latency: Optional[float] = None):
+        self.client = client
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.reference_model = reference_model or models_by_cost()[-1]
+        self.reference_latency = reference_latency
+        self._lock = threading.Lock()
+        self._phases: Dict[str, Dict[str, Any]] = {}
+        self._models: Dict[str, Dict[str, float]] = {}
+        self._totals = {"calls": 0, "latency": 0.0, "cost": 0.0, "reference_cost": 0.0}
+
+    def cascade(self, phase: str) -> Tuple[Tuple[str, ...], RoutingPolicy]:
+        """Get the models to try for a phase, in order, and its policy"""
+        policy = self.policies.get(phase, self.policies["default"])
+        models = policy.models or models_by_cost()
+        return (models if policy.escalate else models[:1]), policy
+
+    @staticmethod
+    def accepts(policy: RoutingPolicy, messages: List[Dict[str, str]], response: str) -> bool:
+        """Check a response against every validator of a policy"""
+        return all(validator(messages, response) for validator in policy.validators)
+
+    def generate_response(self, messages: List[Dict[str, str]], phase: str = "default") -> str:
+        """Generate a response on the cheapest model whose answer passes the phase's validators"""
+        models, policy = self.cascade(phase)
+        with span("ModelRouter.generate_response", "llm", phase=phase) as trace:
+            started = time.perf_counter()
+            attempts = []
+            for model in models:
+                call_started = time.perf_counter()
+                response = self.client.generate_response(messages, model=model)
+                attempts.append((model, time.perf_counter() - call_started, response))
+                if model == models[-1] or self.accepts(policy, messages, response):
+                    break
+            route = self._record(phase, messages, attempts, time.perf_counter() - started)
+            trace.set(model=route.model, escalations=len(route.attempts) - 1)
+            return response
+
+    def _record(self, phase: str, messages: List[Dict[str, str]],
+                attempts: Sequence[Tuple[str, float, str]], latency: float) -> Route:
+        prompt_tokens = sum(_estimate_tokens(str(message.get("content") or "")) for message in messages)
+        cost = sum(model_cost(model, prompt_tokens, _estimate_tokens(response)) for model, _, response in attempts)
+        reference_cost = model_cost(self.reference_model, prompt_tokens, _estimate_tokens(attempts[-1][2]))
+        route = Route(phase, attempts[-1][0], tuple(model for model, _, _ in attempts),
+                      latency, cost, reference_cost)
+        with self._lock:
+            stats = self._phases.setdefault(phase, {"calls": 0, "escalations": 0, "models": {}})
+            stats["calls"] += 1
+            stats["escalations"] += len(attempts) - 1
+            stats["models"][route.model] = stats["models"].get(route.model, 0) + 1
+            for model, model_latency, _ in attempts:
+                model_stats = self._models.setdefault(model, {"calls": 0, "latency": 0.0})
+                model_stats["calls"] += 1
+                model_stats["latency"] += model_latency
+            self._totals["calls"] += 1
+            self._totals["latency"] += latency
+            self._totals["cost"] += cost
+            self._totals["reference_cost"] += reference_cost
+        return route
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get calls and escalations per phase, and the cost and latency saved against the reference model"""
+        with self._lock:
+            reference = self._models.get(self.reference_model)
+            reference_latency = reference["latency"] / reference["calls"] if reference else self.reference_latency
+            latency_saved = None
+            if reference_latency is not None:
+                latency_saved = (reference_latency * self._totals["calls"] - self._totals["latency"]) * 1000
+            return {
+                "phases": {phase: {**stats, "models": dict(stats["models"])} for phase, stats in self._phases.items()},
+                "models": {
+                    model: {"calls": int(stats["calls"]), "latency_ms": stats["latency"] / stats["calls"] * 1000}
+                    for model, stats in self._models.items()
+                },
+                "calls": self._totals["calls"],
+                "cost": self._totals["cost"],
+                "reference_cost": self._totals["reference_cost"],
+                "cost_saved": self._totals["reference_cost"] - self._totals["cost"],
+                "latency_saved_ms": latency_saved
+            }
+
+
+class AsyncModelRouter(ModelRouter):
+    """ModelRouter for an AsyncLLMClient"""
+
+    async def generate_response(self, messages: List[Dict[str, str]], phase: str = "default") -> str:
+        """Generate a response on the cheapest model whose answer passes the phase's validators"""
+        models, policy = self.cascade(phase)
+        started = time.perf_counter()
+        attempts = []
+        for model in models:
+            call_started = time.perf_counter()
+            response = await self.client.generate_response(messages, model=model)
+            attempts.append((model, time.perf_counter() - call_started, response))
+            if model == models[-1] or self.accepts(policy, messages, response):
+                break
+        self._record(phase, messages, attempts, time.perf_counter() - started)
+        return response
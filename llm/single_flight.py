@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome with concurrent callers
+
+    The first caller for a key runs the call. Callers that arrive while it
+    is in flight wait for it and get the same result or exception. Once the
+    call finishes the key is free again, so nothing is cached.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run fn for the key, or wait for the call already in flight
+
+        Returns the result and whether it was shared from another caller's call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            shared = future is not None
+            if shared:
+                self._stats["coalesced"] += 1
+            else:
+                future = self._calls[key] = Future()
+                self._stats["calls"] += 1
+        if shared:
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of calls made, requests coalesced onto them and calls in flight"""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """The asyncio counterpart of SingleFlight, for use on one event loop
+
+    The shared call runs as its own task, so a caller that is cancelled
+    does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await fn for the key, or the call already in flight
+
+        Returns the result and whether it was shared from another caller's call.
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if shared:
+            self._stats["coalesced"] += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._stats["calls"] += 1
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the outcome as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of calls made, requests coalesced onto them and calls in flight"""
+        return {**self._stats, "in_flight": len(self._calls)}
@@ -0,0 +1,228 @@
+"""Local stand-in for the chat-completions API, for development and load testing
+
+Run it with ``python -m llm.stub_server --port 8011`` and point the clients at it
+with ``OPENAI_BASE_URL=http://127.0.0.1:8011/v1``.
+"""
+import argparse
+import hashlib
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from llm.rate_limiter import TokenBucket
+
+
+def stub_embedding(text: str, dimensions: int = 8) -> List[float]:
+    """Deterministic embedding derived from the text's hash"""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return [round(digest[i] / 255.0, 6) for i in range(dimensions)]
+
+
+def prompt_tokens(payload: Dict[str, Any]) -> int:
+    """Count a request's prompt tokens the stub's way, one per word"""
+    inputs = payload.get("input", [])
+    texts = [str(m.get("content") or "") for m in payload.get("messages", [])]
+    texts.extend([inputs] if isinstance(inputs, str) else inputs)
+    return sum(len(text.split()) for text in texts)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def stub(self) -> "StubServer":
+        return self.server.stub
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        path = self.path.rstrip("/")
+
+        failure = self.stub.next_failure()
+        if failure:
+            self._send_json(failure, {"error": {"message": "stub failure", "code": failure}})
+            return
+        retry_after = self.stub.throttle(payload)
+        if retry_after is not None:
+            self._send_json(429, {"error": {"message": "Rate limit reached", "code": "rate_limit_exceeded"}}, {
+                "Retry-After": str(math.ceil(retry_after)),
+                "retry-after-ms": str(math.ceil(retry_after * 1000))
+            })
+            return
+        if self.stub.latency:
+            time.sleep(self.stub.latency)
+
+        if path.endswith("/chat/completions"):
+            self.stub.record("chat", payload)
+            reply = self.stub.reply_for(payload.get("messages", []))
+            if payload.get("stream"):
+                self._stream_chat(payload, reply)
+            else:
+                self._send_json(200, {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "model": payload.get("model"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": reply},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {"prompt_tokens": prompt_tokens(payload), "completion_tokens": len(reply.split()),
+                              "total_tokens": prompt_tokens(payload) + len(reply.split())}
+                })
+        elif path.endswith("/embeddings"):
+            inputs = payload.get("input", [])
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            self.stub.record("embeddings", payload)
+            self._send_json(200, {
+                "object": "list",
+                "model": payload.get("model"),
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": stub_embedding(text)}
+                    for i, text in enumerate(inputs)
+                ]
+            })
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def _stream_chat(self, payload: Dict[str, Any], reply: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for word in reply.split(" "):
+            chunk = {"choices": [{"index": 0, "delta": {"content": word + " "}}]}
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            if self.stub.stream_delay:
+                time.sleep(self.stub.stream_delay)
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text: str):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class StubServer:
+    """Threaded stub server that answers chat-completions and embeddings requests
+
+    Replies echo the last user message unless ``reply`` is given. ``fail_statuses``
+    is a list of HTTP status codes returned, in order, before requests succeed.
+    ``requests_per_minute`` and ``tokens_per_minute`` enforce provider-style
+    limits per model over a ``rate_window`` (60 seconds unless shortened for
+    tests): a request counts its prompt plus ``max_tokens``, and one over the
+    limit gets a 429 with Retry-After.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 reply: Optional[str] = None, fail_statuses: Optional[List[int]] = None,
+                 stream_delay: float = 0.0, requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None, rate_window: float = 60.0):
+        self.latency = latency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.rate_window = rate_window
+        self.throttled = 0
+        self._buckets: Dict[str, Dict[str, TokenBucket]] = {}
+        self.stream_delay = stream_delay
+        self.reply = reply
+        self.fail_statuses = list(fail_statuses or [])
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def next_failure(self) -> Optional[int]:
+        with self._lock:
+            return self.fail_statuses.pop(0) if self.fail_statuses else None
+
+    def throttle(self, payload: Dict[str, Any]) -> Optional[float]:
+        """Charge a request against its model's limits, returning the seconds to wait when over them"""
+        limits = {"requests": self.requests_per_minute, "tokens": self.tokens_per_minute}
+        cost = {"requests": 1, "tokens": prompt_tokens(payload) + payload.get("max_tokens", 0)}
+        with self._lock:
+            buckets = self._buckets.setdefault(payload.get("model", ""), {
+                name: TokenBucket(limit, self.rate_window) for name, limit in limits.items() if limit
+            })
+            now = time.monotonic()
+            wait = max([bucket.wait_time(cost[name], now) for name, bucket in buckets.items()], default=0.0)
+            if wait > 0:
+                self.throttled += 1
+                return wait
+            for name, bucket in buckets.items():
+                bucket.take(cost[name], now)
+            return None
+
+    def record(self, kind: str, payload: Dict[str, Any]):
+        with self._lock:
+            self.requests.append({"kind": kind, "payload": payload})
+
+    def reply_for(self, messages: List[Dict[str, str]]) -> str:
+        if self.reply is not None:
+            return self.reply
+        user_messages = [m.get("content", "") for m in messages if m.get("role") == "user"]
+        return f"Stub reply to: {user_messages[-1] if user_messages else ''}"
+
+    def serve_forever(self):
+        """Serve requests in the calling thread until interrupted"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local chat-completions stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before replying")
+    parser.add_argument("--rpm", type=int, help="Requests per minute allowed per model")
+    parser.add_argument("--tpm", type=int, help="Tokens per minute allowed per model")
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, latency=args.latency,
+                        requests_per_minute=args.rpm, tokens_per_minute=args.tpm)
+    print(f"Stub LLM server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
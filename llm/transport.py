@@ -0,0 +1,128 @@
+import json
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional
+import httpx
+from config.settings import (
+    MODEL_CONFIGS, API_BASE_URL, API_TIMEOUT, MAX_RETRIES,
+    RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX, MAX_CONNECTIONS, EMBEDDING_MODEL
+)
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class ChatCompletionsTransport:
+    """Request building, response parsing and retry policy shared by the sync and async clients"""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None,
+                 timeout: Optional[float] = None, max_retries: Optional[int] = None):
+        self.api_key = api_key
+        self.base_url = (base_url or API_BASE_URL).rstrip("/")
+        self.timeout = timeout if timeout is not None else API_TIMEOUT
+        self.max_retries = max(1, max_retries if max_retries is not None else MAX_RETRIES)
+
+    def client_options(self) -> Dict[str, Any]:
+        """Get the keyword arguments for a pooled httpx client"""
+        return {
+            "base_url": self.base_url,
+            "headers": {"Authorization": f"Bearer {self.api_key}"},
+            "timeout": httpx.Timeout(self.timeout),
+            "limits": httpx.Limits(max_connections=MAX_CONNECTIONS,
+                                   max_keepalive_connections=MAX_CONNECTIONS)
+        }
+
+    def chat_payload(self, model: str, messages: List[Dict[str, str]],
+                     stream: bool = False) -> Dict[str, Any]:
+        """Build a chat-completions request body from the model's configuration"""
+        config = MODEL_CONFIGS[model]
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": config["temperature"],
+            "max_tokens": config["max_tokens"],
+            "top_p": config["top_p"],
+            "frequency_penalty": config["frequency_penalty"],
+            "presence_penalty": config["presence_penalty"]
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def embeddings_payload(self, texts: List[str], model: Optional[str] = None) -> Dict[str, Any]:
+        """Build an embeddings request body"""
+        return {"model": model or EMBEDDING_MODEL, "input": texts}
+
+    @staticmethod
+    def parse_chat(body: Dict[str, Any]) -> str:
+        """Extract the message text from a chat-completions response"""
+        return body["choices"][0]["message"]["content"]
+
+    @staticmethod
+    def parse_embeddings(body: Dict[str, Any]) -> List[List[float]]:
+        """Extract embeddings from an embeddings response, in input order"""
+        return [item["embedding"] for item in sorted(body["data"], key=lambda item: item["index"])]
+
+    @staticmethod
+    def parse_stream_line(line: str) -> Optional[str]:
+        """Extract the content delta from one server-sent-events line
+
+        Returns None for keep-alives and the final [DONE] marker.
+        """
+        if not line.startswith("data:"):
+            return None
+        data = line[len("data:"):].strip()
+        if not data or data == "[DONE]":
+            return None
+        choices = json.loads(data).get("choices") or [{}]
+        return choices[0].get("delta", {}).get("content")
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Check whether a failed request is worth retrying"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, httpx.TransportError)
+
+    @staticmethod
+    def estimate_tokens(payload: Dict[str, Any]) -> int:
+        """Estimate the tokens a request counts against a tokens-per-minute limit
+
+        Providers charge the prompt plus ``max_tokens`` up front; the prompt is
+        estimated at four characters a token.
+        """
+        texts = [str(message.get("content") or "") for message in payload.get("messages", [])]
+        inputs = payload.get("input", [])
+        texts.extend([inputs] if isinstance(inputs, str) else inputs)
+        return sum(len(text) for text in texts) // 4 + len(texts) + payload.get("max_tokens", 0)
+
+    @staticmethod
+    def status_of(error: Exception) -> Optional[int]:
+        """Get the HTTP status of a failed request, or None when no response arrived"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code
+        return None
+
+    @staticmethod
+    def retry_after(error: Exception) -> Optional[float]:
+        """Get the seconds a throttled response asks the client to wait, if it says"""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return None
+        headers = error.response.headers
+        try:
+            if "retry-after-ms" in headers:
+                return max(0.0, float(headers["retry-after-ms"]) / 1000)
+            if "retry-after" in headers:
+                value = headers["retry-after"]
+                try:
+                    return max(0.0, float(value))
+                except ValueError:
+                    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def backoff_delay(attempt: int) -> float:
+        """Exponential backoff with full jitter for the given zero-based attempt"""
+        return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt)))
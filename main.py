@@ -1,24 +1,21 @@
-import os
-from dotenv import load_dotenv
-from ui.cli_interface import CLIInterface
-from llm.llm_client import LLMClient
+import logging
+from config.settings import OPENAI_API_KEY
 
 def main():
-    # Load environment variables from .env file
-    load_dotenv()
-    
-    # Initialize LLM client with API key
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    # config.settings has already loaded the .env file
+    if not OPENAI_API_KEY:
         print("Error: OPENAI_API_KEY not found in environment variables or .env file")
         print("Please create a .env file with your API key or set the environment variable")
         return
 
-    llm_client = LLMClient(api_key)
-    
+    logging.basicConfig(level=logging.INFO)
+
+    # Imported here so a misconfigured launch exits before loading the battle engine
+    from ui.cli_interface import CLIInterface
+
     # Initialize and start CLI interface
     cli = CLIInterface()
     cli.start()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
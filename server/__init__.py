@@ -0,0 +1,4 @@
+from .battle_service import BattleService, ServiceBusyError, iter_solve
+from .app import create_app
+
+__all__ = ['BattleService', 'ServiceBusyError', 'iter_solve', 'create_app']
@@ -0,0 +1,128 @@
+import argparse
+import json
+from typing import Any, Dict, Optional
+from aiohttp import web
+from battle.events import BattleEvent
+from config.settings import CORS_ORIGIN, SERVER_HOST, SERVER_PORT
+from server.battle_service import BattleService, ServiceBusyError
+
+SERVICE_KEY = web.AppKey("battle_service", BattleService)
+
+
+def _dumps(data: Any) -> str:
+    # Agent output may hold tuples or other non-JSON values, so fall back to str
+    return json.dumps(data, default=str)
+
+
+def _error(status: int, message: str, **headers: str) -> web.Response:
+    return web.json_response({"error": message}, status=status, headers=headers, dumps=_dumps)
+
+
+def format_sse(event: BattleEvent) -> bytes:
+    """Encode a battle event as one Server-Sent-Events message"""
+    return f"event: {event.kind}\ndata: {_dumps(event.to_dict())}\n\n".encode("utf-8")
+
+
+async def _read_problem(request: web.Request) -> Optional[str]:
+    """Get the problem statement from a JSON body or the query string"""
+    if request.method == "POST":
+        try:
+            body: Dict[str, Any] = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        problem = body.get("problem") if isinstance(body, dict) else None
+    else:
+        problem = request.query.get("problem")
+    if not isinstance(problem, str) or not problem.strip():
+        return None
+    return problem
+
+
+async def solve(request: web.Request) -> web.Response:
+    """Run a battle and return every agent's analysis and solution"""
+    problem = await _read_problem(request)
+    if problem is None:
+        return _error(400, "Request must include a non-empty 'problem'")
+    try:
+        result = await request.app[SERVICE_KEY].solve(problem)
+    except ServiceBusyError as exc:
+        return _error(503, str(exc), **{"Retry-After": "1"})
+    return web.json_response(result, dumps=_dumps)
+
+
+async def solve_stream(request: web.Request) -> web.StreamResponse:
+    """Run a battle and stream its events as Server-Sent Events"""
+    problem = await _read_problem(request)
+    if problem is None:
+        return _error(400, "Request must include a non-empty 'problem'")
+    service = request.app[SERVICE_KEY]
+    events = service.stream(problem)
+    try:
+        # Take the first event before replying so a full pool can still answer 503
+        first = await events.__anext__()
+    except ServiceBusyError as exc:
+        return _error(503, str(exc), **{"Retry-After": "1"})
+    except StopAsyncIteration:
+        return _error(500, "Battle produced no events")
+
+    response = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+    await response.prepare(request)
+    await response.write(format_sse(first))
+    try:
+        async for event in events:
+            await response.write(format_sse(event))
+    except Exception as exc:
+        # Headers are already sent, so report the failure in-band
+        await response.write(f"event: error\ndata: {_dumps({'error': str(exc)})}\n\n".encode("utf-8"))
+    await response.write_eof()
+    return response
+
+
+async def health(request: web.Request) -> web.Response:
+    """Report agent pool occupancy"""
+    return web.json_response(request.app[SERVICE_KEY].get_stats())
+
+
+@web.middleware
+async def cors_middleware(request: web.Request, handler) -> web.StreamResponse:
+    """Allow the frontend dev server to call the API from another origin"""
+    if request.method == "OPTIONS":
+        response = web.Response()
+    else:
+        response = await handler(request)
+    response.headers["Access-Control-Allow-Origin"] = CORS_ORIGIN
+    response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
+    response.headers["Access-Control-Allow-Headers"] = "Content-Type"
+    return response
+
+
+def create_app(service: Optional[BattleService] = None) -> web.Application:
+    """Build the aiohttp application around a shared BattleService"""
+    app = web.Application(middlewares=[cors_middleware])
+    app[SERVICE_KEY] = service or BattleService()
+
+    async def close_service(app: web.Application) -> None:
+        app[SERVICE_KEY].close()
+
+    app.on_cleanup.append(close_service)
+    app.router.add_post("/api/solve", solve)
+    app.router.add_get("/api/solve/stream", solve_stream)
+    app.router.add_post("/api/solve/stream", solve_stream)
+    app.router.add_get("/api/health", health)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve AI Arena battles over HTTP")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    args = parser.parse_args()
+    web.run_app(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from battle.agent_pool import AgentPool
+from battle.battle_manager import BattleManager
+from battle.battle_config import BattleConfig
+from battle.context_builder import ContextBuilder
+from battle.events import BattleEvent, BattleComplete, SolutionReady
+from battle.executor import AgentExecutor, create_executor
+from config.settings import (
+    BATTLE_CONFIG_FILE, MAX_CONCURRENT_BATTLES, MAX_QUEUED_BATTLES, MAX_ROUNDS
+)
+from telemetry.tracing import span
+
+_DONE = object()
+
+
+class ServiceBusyError(RuntimeError):
+    """Raised when every agent set is busy and the wait queue is full"""
+
+
+def iter_solve(manager: BattleManager, problem: str, max_rounds: int = MAX_ROUNDS) -> Iterator[BattleEvent]:
+    """Run a battle and then every agent's solution, yielding events as they are ready
+
+    The final BattleComplete carries ``{agent: {analysis, solution, rebuttals,
+    thought_process}}``, the shape the frontend renders. Agents asking for
+    clarification do not stop the run; their questions stay in the analysis.
+    Solution contexts are trimmed to the model's token budget, and the tokens
+    saved are recorded on the solution span.
+    """
+    result: Dict[str, Any] = {}
+    for event in manager.iter_battle_with_rebuttals(problem, max_rounds):
+        if isinstance(event, BattleComplete):
+            result = event.result
+        else:
+            yield event
+    agent_results = result.get("results", result.get("current_results", {}))
+    context_builder = ContextBuilder()
+
+    def build_solution(agent) -> Dict[str, Any]:
+        other_analyses, rebuttals = context_builder.build(
+            agent.focus_areas,
+            {
+                name: agent_result["analysis"]
+                for name, agent_result in agent_results.items()
+                if name != agent.name
+            },
+            agent_results.get(agent.name, {}).get("rebuttals", {})
+        )
+        context = {
+            "technical_analysis": agent.analyze_problem(problem),
+            "other_analyses": other_analyses,
+            "rebuttals": rebuttals,
+            "persona": agent.persona
+        }
+        return agent.generate_solution(problem, context)
+
+    response = {}
+    with span("solution", "phase") as trace:
+        for agent, solution in zip(manager.agents, manager.executor.imap(build_solution, manager.agents)):
+            agent_result = agent_results.get(agent.name, {})
+            response[agent.name] = {
+                "analysis": agent_result.get("analysis", {}),
+                "solution": solution,
+                "rebuttals": agent_result.get("rebuttals", {}),
+                "thought_process": agent_result.get("thought_process", [])
+            }
+            yield SolutionReady(agent.name, solution)
+        trace.set(**context_builder.get_stats())
+    yield BattleComplete(response)
+
+
+class BattleService:
+    """Serves battles from a fixed pool of warm BattleManagers
+
+    Agents keep per-battle state, so each concurrent battle needs its own agent
+    set. The sets are built once at startup from a single parse of the battle
+    config and checked out of an AgentPool one request at a time, which also
+    rebuilds them when the config file changes. Requests beyond the pool size
+    wait in line, and once ``max_queued`` are waiting new ones are rejected
+    with ServiceBusyError instead of piling up.
+    """
+
+    def __init__(self, pool_size: int = MAX_CONCURRENT_BATTLES, max_queued: int = MAX_QUEUED_BATTLES,
+                 max_rounds: int = MAX_ROUNDS, config: Optional[BattleConfig] = None,
+                 executor: Optional[AgentExecutor] = None):
+        self.pool_size = max(1, pool_size)
+        self.max_queued = max(0, max_queued)
+        self.max_rounds = max_rounds
+        self.agent_pool = AgentPool(config or BattleConfig.load(BATTLE_CONFIG_FILE), self.pool_size)
+        self.executor = executor or create_executor()
+        self.managers: List[BattleManager] = [
+            BattleManager(executor=self.executor) for _ in range(self.pool_size)
+        ]
+        self._threads = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="battle")
+        self._idle: Optional[asyncio.Queue] = None
+        self.waiting = 0
+        self.active = 0
+        self.served = 0
+        self.rejected = 0
+
+    @property
+    def config(self) -> BattleConfig:
+        return self.agent_pool.config
+
+    def _idle_queue(self) -> asyncio.Queue:
+        # Created lazily so the queue binds to the loop that serves requests
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for manager in self.managers:
+                self._idle.put_nowait(manager)
+        return self._idle
+
+    async def _acquire(self) -> BattleManager:
+        idle = self._idle_queue()
+        if idle.empty() and self.waiting >= self.max_queued:
+            self.rejected += 1
+            raise ServiceBusyError(f"All {self.pool_size} agent sets are busy and "
+                                   f"{self.waiting} requests are waiting")
+        self.waiting += 1
+        try:
+            manager = await idle.get()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        manager.agents = self.agent_pool.acquire()
+        return manager
+
+    def _release(self, manager: BattleManager) -> None:
+        self.agent_pool.release(manager.agents)
+        manager.agents = []
+        self.active -= 1
+        self.served += 1
+        self._idle_queue().put_nowait(manager)
+
+    async def stream(self, problem: str) -> AsyncIterator[BattleEvent]:
+        """Run a battle on a warm agent set, yielding events as they are produced
+
+        The battle runs on its own worker thread. If the consumer stops early
+        the battle still finishes in the background before its agent set is
+        returned to the pool, so a set is never shared by two battles.
+        """
+        manager = await self._acquire()
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+
+        def produce() -> None:
+            try:
+                for event in iter_solve(manager, problem, self.max_rounds):
+                    loop.call_soon_threadsafe(events.put_nowait, event)
+            except Exception as exc:
+                loop.call_soon_threadsafe(events.put_nowait, exc)
+            finally:
+                # Release before _DONE so the set is back in the pool by the time the response is sent
+                loop.call_soon_threadsafe(self._release, manager)
+                loop.call_soon_threadsafe(events.put_nowait, _DONE)
+
+        loop.run_in_executor(self._threads, produce)
+        while True:
+            item = await events.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    async def solve(self, problem: str) -> Dict[str, Any]:
+        """Run a battle and return the final result"""
+        result: Dict[str, Any] = {}
+        async for event in self.stream(problem):
+            if isinstance(event, BattleComplete):
+                result = event.result
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool occupancy and request counters"""
+        return {
+            "pool_size": self.pool_size,
+            "active": self.active,
+            "waiting": self.waiting,
+            "served": self.served,
+            "rejected": self.rejected
+        }
+
+    def close(self) -> None:
+        """Stop the battle threads and release the agent executor"""
+        self._threads.shutdown(wait=False)
+        self.executor.close()
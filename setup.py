@@ -5,7 +5,9 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "openai>=1.0.0",
+        "httpx>=0.24.0",
+        "aiohttp>=3.9.0",
+        "numpy>=1.22.0",
         "python-dotenv>=1.0.0",
         "black>=23.0.0",
         "flake8>=6.0.0",
@@ -0,0 +1,7 @@
+from .tracing import (
+    TRACER, Tracer, span, traced_method, trace_public_methods,
+    start_tracing, stop_tracing, export_chrome_trace
+)
+
+__all__ = ['TRACER', 'Tracer', 'span', 'traced_method', 'trace_public_methods',
+           'start_tracing', 'stop_tracing', 'export_chrome_trace']
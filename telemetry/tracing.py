@@ -0,0 +1,188 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from config.settings import TRACE_FILE
+
+
+class Span:
+    """A timed region recorded as one Chrome trace "complete" event"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def set(self, **args: Any) -> None:
+        """Attach extra arguments, such as token counts, to the span"""
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.record(self, time.perf_counter_ns())
+
+
+class _NullSpan:
+    """Shared do-nothing span handed out while tracing is off"""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects spans from every thread and exports them as Chrome trace events
+
+    While disabled, ``span`` returns a shared no-op object and traced methods
+    skip straight to the wrapped call, so instrumentation costs one attribute
+    check per call.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def span(self, name: str, category: str = "battle", **args: Any):
+        """Open a span; use it as a context manager"""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, args)
+
+    def record(self, span: Span, end: int) -> None:
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start - self._origin) / 1000,  # microseconds
+            "dur": (end - span.start) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": {key: value for key, value in span.args.items() if value is not None}
+        }
+        with self._lock:
+            self._events.append(event)
+            self._thread_names[thread.ident] = thread.name
+
+    def start(self) -> None:
+        """Turn tracing on"""
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Turn tracing off, keeping what was recorded"""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Drop every recorded span"""
+        with self._lock:
+            self._events = []
+            self._thread_names = {}
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        """Get a copy of the recorded span events"""
+        with self._lock:
+            return list(self._events)
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write recorded spans as trace-event JSON for chrome://tracing or Perfetto
+
+        Returns the number of spans written.
+        """
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f, default=str)
+        return len(events)
+
+
+TRACER = Tracer(enabled=bool(TRACE_FILE))
+
+if TRACE_FILE:
+    atexit.register(TRACER.export_chrome_trace, TRACE_FILE)
+
+
+def span(name: str, category: str = "battle", **args: Any):
+    """Open a span on the global tracer"""
+    if not TRACER.enabled:
+        return NULL_SPAN
+    return Span(TRACER, name, category, args)
+
+
+def traced_method(fn: Callable, category: str = "agent") -> Callable:
+    """Wrap an agent method so each call is a span tagged with the agent and round"""
+    if getattr(fn, "__traced__", False):
+        return fn
+
+    tracer = TRACER
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not tracer.enabled:
+            return fn(self, *args, **kwargs)
+        with Span(tracer, name, category,
+                  {"agent": getattr(self, "name", None), "round": getattr(self, "current_round", None)}):
+            return fn(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_public_methods(cls: type, category: str = "agent") -> type:
+    """Wrap every public method defined directly on cls with traced_method"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not callable(value) or getattr(value, "__isabstractmethod__", False):
+            continue
+        setattr(cls, attr, traced_method(value, category))
+    return cls
+
+
+def start_tracing() -> None:
+    """Turn tracing on for the global tracer"""
+    TRACER.start()
+
+
+def stop_tracing() -> None:
+    """Turn tracing off for the global tracer"""
+    TRACER.stop()
+
+
+def export_chrome_trace(path: Optional[str] = None) -> int:
+    """Write the global tracer's spans to path, or to TRACE_FILE"""
+    path = path or TRACE_FILE
+    if not path:
+        raise ValueError("No trace path given and TRACE_FILE is not set")
+    return TRACER.export_chrome_trace(path)
@@ -0,0 +1,56 @@
+import copy
+import os
+from battle.battle_config import DEFAULT_BATTLE_CONFIG, BattleConfig, merge_config
+
+USER_CONFIG = """
+voting_weights:
+  risks: -0.5
+agents:
+  Pragmatic Pete:
+    voting_style: conservative
+    focus_areas: [Revenue]
+"""
+
+
+def write_config(path, text: str) -> str:
+    path.write_text(text)
+    return str(path)
+
+
+def test_load_reuses_the_instance_until_the_file_changes(tmp_path):
+    config_file = write_config(tmp_path / "battle_config.yaml", USER_CONFIG)
+    first = BattleConfig.load(config_file)
+    assert BattleConfig.load(config_file) is first
+    assert first.get_voting_weights()["risks"] == -0.5
+
+    # A new mtime alone is not an edit
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert BattleConfig.load(config_file) is first
+
+    write_config(tmp_path / "battle_config.yaml", USER_CONFIG.replace("-0.5", "-0.9"))
+    changed = BattleConfig.load(config_file)
+    assert changed is not first
+    assert changed.get_voting_weights()["risks"] == -0.9
+    assert first.reload() is changed
+
+
+def test_merging_leaves_the_defaults_untouched(tmp_path):
+    defaults = copy.deepcopy(DEFAULT_BATTLE_CONFIG)
+    merge_config(DEFAULT_BATTLE_CONFIG, {
+        "voting_weights": {"risks": -1.0},
+        "agents": {"Scalable Sam": {"voting_style": "generous"}}
+    })
+    BattleConfig.load(write_config(tmp_path / "battle_config.yaml", USER_CONFIG))
+    assert DEFAULT_BATTLE_CONFIG == defaults
+    assert BattleConfig.from_dict(DEFAULT_BATTLE_CONFIG).agent("Pragmatic Pete").voting_style == "generous"
+
+
+def test_agent_config_is_a_private_copy():
+    config = BattleConfig.from_dict(DEFAULT_BATTLE_CONFIG)
+    agent_config = config.get_agent_config("Pragmatic Pete")
+    agent_config["focus_areas"].append("Anything")
+    agent_config["voting_style"] = "conservative"
+    assert "Anything" not in config.get_agent_config("Pragmatic Pete")["focus_areas"]
+    assert config.agent("Pragmatic Pete").voting_style == "generous"
+    assert "Anything" not in DEFAULT_BATTLE_CONFIG["agents"]["Pragmatic Pete"]["focus_areas"]
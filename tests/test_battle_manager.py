@@ -0,0 +1,76 @@
+import json
+import pytest
+from battle.agent_pool import build_agents
+from battle.battle_config import BattleConfig
+from battle.battle_manager import BattleManager
+
+PROBLEM = "We want to build an AI powered real-time mobile app for enterprise data privacy and market growth"
+
+
+def make_manager(**options) -> BattleManager:
+    return BattleManager(build_agents(BattleConfig()), **options)
+
+
+def test_battle_result_is_plain_json():
+    result = make_manager().run_battle_with_rebuttals(PROBLEM, 2)
+    assert json.loads(json.dumps(result)) == result
+    for agent_result in result["results"].values():
+        assert all(isinstance(thought, str) for thought in agent_result["thought_process"])
+        assert all(isinstance(thought, str) for thought in agent_result["analysis"]["thought_process"])
+
+
+def run_clarified(clarification: str):
+    manager = make_manager()
+    manager.run_battle_with_rebuttals(PROBLEM, 2)
+    clarified = f"{PROBLEM}\nAdditional information: {clarification}"
+    return clarified, manager.run_battle_with_rebuttals(clarified, 2, incremental=True), manager.get_reuse_stats()
+
+
+def test_incremental_run_reuses_work_when_keywords_are_unchanged():
+    clarified, result, stats = run_clarified("the team is small")
+    assert result == make_manager().run_battle_with_rebuttals(clarified, 2)
+    assert stats["analyses"]["computed"] == 0
+    assert stats["analyses"]["reused"] > 0
+    assert stats["rebuttals"] == {"computed": 0, "reused": 10}
+
+
+def test_incremental_run_recomputes_when_keywords_change():
+    clarified, result, stats = run_clarified("it needs a web dashboard with security and scale")
+    assert result == make_manager().run_battle_with_rebuttals(clarified, 2)
+    assert stats["analyses"]["computed"] == 5
+    assert stats["rebuttals"] == {"computed": 10, "reused": 0}
+
+
+@pytest.mark.parametrize("min_rounds", [2, 3])
+def test_converged_battle_stops_after_min_rounds(min_rounds):
+    # Template rebuttals repeat word for word, so every round after the first is fully similar
+    result = make_manager(convergence_threshold=0.9, min_rounds=min_rounds).run_battle_with_rebuttals(PROBLEM, 5)
+    assert (result["rounds_run"], result["rounds_saved"]) == (min_rounds, 5 - min_rounds)
+    for agent_result in result["results"].values():
+        assert list(agent_result["rebuttals"]) == [f"Round {number}" for number in range(1, min_rounds + 1)]
+
+
+def test_battle_runs_every_round_without_a_threshold(monkeypatch):
+    monkeypatch.setattr("battle.convergence.CONVERGENCE_THRESHOLD", None)
+    result = make_manager().run_battle_with_rebuttals(PROBLEM, 5)
+    assert (result["rounds_run"], result["rounds_saved"]) == (5, 0)
+    for agent_result in result["results"].values():
+        assert len(agent_result["rebuttals"]) == 5
+
+
+def test_each_analysis_is_computed_once_per_battle():
+    manager = make_manager()
+    calls = {agent.name: 0 for agent in manager.agents}
+    for agent in manager.agents:
+        def counted(problem, agent=agent, generate=agent.generate_analysis):
+            calls[agent.name] += 1
+            return generate(problem)
+        agent.generate_analysis = counted
+
+    for battle in (1, 2):
+        manager.run_battle_with_rebuttals(PROBLEM, 3)
+        assert calls == {name: battle for name in calls}
+        stats = manager.get_reuse_stats()["analyses"]
+        # Every round's rebuttals read the other agents' analyses from the store
+        assert stats["computed"] == len(calls)
+        assert stats["reused"] >= 3 * len(calls) * (len(calls) - 1)
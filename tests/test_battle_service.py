@@ -0,0 +1,21 @@
+import asyncio
+from battle.events import BattleComplete
+from server.battle_service import BattleService
+
+PROBLEM = "Should we build a mobile app for enterprise data privacy?"
+
+
+def test_sequential_battles_never_find_the_pool_busy():
+    service = BattleService(pool_size=1, max_queued=0)
+
+    async def run_all():
+        for _ in range(10):
+            events = [event async for event in service.stream(PROBLEM)]
+            assert isinstance(events[-1], BattleComplete)
+
+    try:
+        asyncio.run(run_all())
+    finally:
+        service.close()
+    assert service.get_stats()["rejected"] == 0
+    assert service.get_stats()["served"] == 10
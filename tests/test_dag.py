@@ -0,0 +1,43 @@
+import time
+import pytest
+from battle.dag import DagNode, DagScheduler
+from battle.executor import AgentTimeoutError, create_executor
+
+
+def sleeper(value: str, latency: float):
+    def run() -> str:
+        time.sleep(latency)
+        return value
+    return run
+
+
+def test_nodes_start_once_their_dependencies_finish():
+    nodes = [
+        DagNode("slow", sleeper("slow", 0.2)),
+        DagNode("fast", sleeper("fast", 0.01)),
+        DagNode("after fast", sleeper("after fast", 0.01), ("fast",)),
+        DagNode("after both", sleeper("after both", 0.0), ("slow", "after fast"))
+    ]
+    with create_executor("thread", max_concurrency=2) as executor:
+        order = [key for key, _ in DagScheduler(executor).run(nodes)]
+    assert order == ["fast", "after fast", "slow", "after both"]
+
+
+def test_timeout_counts_from_when_each_node_starts():
+    # Six 100 ms nodes two at a time take 300 ms, but none runs longer than its 250 ms timeout
+    nodes = [DagNode(i, sleeper(str(i), 0.1)) for i in range(6)]
+    with create_executor("thread", max_concurrency=2, timeout=0.25) as executor:
+        assert len(list(DagScheduler(executor).run(nodes))) == 6
+
+
+def test_slow_node_times_out():
+    nodes = [DagNode("fast", sleeper("fast", 0.01)), DagNode("slow", sleeper("slow", 0.5), agent="Slow")]
+    with create_executor("thread", max_concurrency=2, timeout=0.1) as executor:
+        with pytest.raises(AgentTimeoutError) as error:
+            list(DagScheduler(executor).run(nodes))
+    assert error.value.agent_name == "Slow"
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError):
+        list(DagScheduler().run([DagNode("a", sleeper("a", 0.0), ("missing",))]))
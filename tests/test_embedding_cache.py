@@ -0,0 +1,39 @@
+import numpy as np
+from config.settings import EMBEDDING_MODEL
+from llm.embedding_cache import EmbeddingCache
+from llm.llm_client import LLMClient
+from llm.stub_server import StubServer, stub_embedding
+
+TEXTS = ["market growth", "data privacy", "market growth", "real-time sync"]
+
+
+def test_vectors_round_trip_through_the_file(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    vectors = {"market growth": np.array([0.25, -1.5, 3.0]), "data privacy": np.array([1e-3, 0.0, 2.0])}
+    writer = EmbeddingCache(path)
+    writer.set_many(EMBEDDING_MODEL, vectors)
+    writer.close()
+
+    reader = EmbeddingCache(path)
+    found = reader.get_many(EMBEDDING_MODEL, ["market growth", "data privacy", "unknown"])
+    assert set(found) == set(vectors)
+    for text, vector in vectors.items():
+        assert found[text].dtype == np.float32
+        np.testing.assert_array_equal(found[text], vector.astype(np.float32))
+    assert reader.get_many("another-model", ["market growth"]) == {}
+    assert reader.get_stats() == {"hits": 2, "misses": 2, "entries": 2}
+
+
+def test_batch_embeddings_are_fetched_once(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+    with StubServer() as stub:
+        client = LLMClient("test-key", base_url=stub.base_url, embedding_cache=cache, rate_limit=False)
+        first = client.get_embeddings_batch(TEXTS)
+        second = client.get_embeddings_batch(TEXTS)
+
+    # Duplicates are sent once, and the second batch comes entirely from the cache
+    sent = [request["payload"]["input"] for request in stub.requests]
+    assert sent == [["market growth", "data privacy", "real-time sync"]]
+    expected = np.array([stub_embedding(text) for text in TEXTS], dtype=np.float32)
+    np.testing.assert_array_equal(first, expected)
+    np.testing.assert_array_equal(second, expected)
@@ -0,0 +1,87 @@
+import threading
+import time
+import pytest
+from battle.executor import AgentTimeoutError, create_executor
+
+
+class FakeAgent:
+    """Stands in for an expert whose phase work is an LLM call of fixed latency"""
+
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+
+
+class ConcurrencyProbe:
+    """Records how many agents run at once"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, agent: FakeAgent) -> str:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(agent.latency)
+            return agent.name
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def make_agents(count: int, latency: float):
+    return [FakeAgent(f"Agent {i}", latency) for i in range(count)]
+
+
+@pytest.mark.parametrize("mode", ["sequential", "thread", "asyncio"])
+def test_results_keep_agent_order(mode):
+    agents = [FakeAgent(f"Agent {i}", latency) for i, latency in enumerate([0.05, 0.01, 0.03, 0.0])]
+    with create_executor(mode, max_concurrency=4) as executor:
+        assert executor.map(ConcurrencyProbe(), agents) == [agent.name for agent in agents]
+        assert list(executor.imap(ConcurrencyProbe(), agents)) == [agent.name for agent in agents]
+
+
+@pytest.mark.parametrize("mode", ["thread", "asyncio"])
+def test_concurrency_is_capped(mode):
+    probe = ConcurrencyProbe()
+    with create_executor(mode, max_concurrency=2) as executor:
+        executor.map(probe, make_agents(6, 0.05))
+    assert probe.peak == 2
+
+
+@pytest.mark.parametrize("mode", ["thread", "asyncio"])
+def test_concurrent_phase_takes_the_slowest_batch(mode):
+    with create_executor(mode, max_concurrency=6) as executor:
+        started = time.monotonic()
+        executor.map(ConcurrencyProbe(), make_agents(6, 0.1))
+        assert time.monotonic() - started < 0.4
+
+
+@pytest.mark.parametrize("mode", ["thread", "asyncio"])
+def test_timeout_counts_from_when_each_agent_starts(mode):
+    # Six 100 ms agents two at a time take 300 ms, but none runs longer than its 250 ms timeout
+    with create_executor(mode, max_concurrency=2, timeout=0.25) as executor:
+        assert len(list(executor.imap(ConcurrencyProbe(), make_agents(6, 0.1)))) == 6
+
+
+@pytest.mark.parametrize("mode", ["thread", "asyncio"])
+def test_slow_agent_times_out(mode):
+    agents = make_agents(3, 0.01) + [FakeAgent("Slow", 0.5)]
+    with create_executor(mode, max_concurrency=2, timeout=0.1) as executor:
+        with pytest.raises(AgentTimeoutError) as error:
+            list(executor.imap(ConcurrencyProbe(), agents))
+    assert error.value.agent_name == "Slow"
+
+
+@pytest.mark.parametrize("mode", ["thread", "asyncio"])
+def test_imap_streams_results_before_the_phase_ends(mode):
+    agents = [FakeAgent("Fast", 0.01), FakeAgent("Slow", 0.3)]
+    with create_executor(mode, max_concurrency=2) as executor:
+        started = time.monotonic()
+        results = executor.imap(ConcurrencyProbe(), agents)
+        assert next(results) == "Fast"
+        assert time.monotonic() - started < 0.2
+        assert next(results) == "Slow"
@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+import httpx
+import pytest
+from config.settings import DEFAULT_MODEL, MODEL_CONFIGS
+from llm.llm_client import LLMClient
+from llm.rate_limiter import RateLimiter
+from llm.stub_server import StubServer
+
+MESSAGES = [{"role": "user", "content": "Name one risk of a mobile launch"}]
+
+
+class SlowProvider:
+    """Answers chat completions after a delay, counting the calls that reach it"""
+
+    def __init__(self, latency: float = 0.1):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.latency)
+        return httpx.Response(200, content=json.dumps({
+            "choices": [{"message": {"content": f"answer {call}"}}],
+            "usage": {"prompt_tokens": 8, "completion_tokens": 2, "total_tokens": 10}
+        }))
+
+
+def concurrent_responses(temperature, monkeypatch, **client_options):
+    monkeypatch.setitem(MODEL_CONFIGS, DEFAULT_MODEL, {**MODEL_CONFIGS[DEFAULT_MODEL], "temperature": temperature})
+    provider = SlowProvider()
+    client = LLMClient("test-key", base_url="http://llm.test", http_transport=httpx.MockTransport(provider),
+                       rate_limit=False, **client_options)
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(client.generate_response(MESSAGES)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return provider.calls, responses
+
+
+def test_deterministic_requests_are_coalesced(monkeypatch):
+    calls, responses = concurrent_responses(0.0, monkeypatch)
+    assert calls == 1
+    assert responses == ["answer 1"] * 4
+
+
+def test_sampled_requests_each_get_their_own_sample(monkeypatch):
+    calls, responses = concurrent_responses(0.7, monkeypatch)
+    assert calls == 4
+    assert len(set(responses)) == 4
+
+
+def test_sampled_requests_are_coalesced_when_opted_in(monkeypatch):
+    calls, _ = concurrent_responses(0.7, monkeypatch, cache_nondeterministic=True)
+    assert calls == 1
+
+
+def stub_client(stub: StubServer, **client_options):
+    """Get a client against the stub and the backoff attempts it records instead of sleeping through"""
+    client = LLMClient("test-key", base_url=stub.base_url, **{"rate_limit": False, **client_options})
+    backoffs = []
+    client.transport.backoff_delay = lambda attempt: backoffs.append(attempt) or 0.0
+    return client, backoffs
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_transient_failures_are_retried_with_backoff(status):
+    with StubServer(reply="recovered", fail_statuses=[status, status]) as stub:
+        client, backoffs = stub_client(stub)
+        assert client.generate_response(MESSAGES) == "recovered"
+    assert backoffs == [0, 1]
+    assert not stub.fail_statuses
+
+
+def test_retries_stop_after_max_retries():
+    with StubServer(fail_statuses=[502, 502, 502, 502]) as stub:
+        client, backoffs = stub_client(stub)
+        with pytest.raises(httpx.HTTPStatusError) as error:
+            client.generate_response(MESSAGES)
+    assert error.value.response.status_code == 502
+    assert len(backoffs) == client.transport.max_retries - 1
+    assert len(stub.fail_statuses) == 4 - client.transport.max_retries
+
+
+def test_client_errors_are_not_retried():
+    with StubServer(fail_statuses=[400]) as stub:
+        client, backoffs = stub_client(stub)
+        with pytest.raises(httpx.HTTPStatusError):
+            client.generate_response(MESSAGES)
+    assert backoffs == []
+
+
+def test_throttled_request_waits_out_retry_after():
+    # One request per second: the second is throttled and told to retry after a second
+    with StubServer(reply="ok", requests_per_minute=1, rate_window=1.0) as stub:
+        client, backoffs = stub_client(stub, rate_limit=True, rate_limiter=RateLimiter())
+        client.generate_response(MESSAGES)
+        started = time.monotonic()
+        assert client.generate_response([{"role": "user", "content": "again"}]) == "ok"
+        waited = time.monotonic() - started
+    assert stub.throttled == 1
+    assert waited >= 0.9
+    # Throttles are retried through the limiter, not the backoff budget
+    assert backoffs == []
@@ -0,0 +1,54 @@
+import time
+from llm.llm_client import LLMClient
+from llm.rate_limiter import RateLimiter
+from llm.stub_server import StubServer
+
+
+def test_throttle_halves_the_window_once_per_epoch():
+    limiter = RateLimiter(max_concurrency=8)
+    first, second = limiter.acquire(), limiter.acquire()
+    limiter.release(first, 429, retry_after=0)
+    # The second request was sent before the decrease, so its 429 is not news
+    limiter.release(second, 429, retry_after=0)
+    stats = limiter.get_stats()
+    assert (stats["concurrency"], stats["throttled"], stats["decreases"]) == (4.0, 2, 1)
+
+    limiter.release(limiter.acquire(), 429, retry_after=0)
+    assert limiter.get_stats()["concurrency"] == 2.0
+
+
+def test_successes_widen_the_window_back_to_its_maximum():
+    limiter = RateLimiter(max_concurrency=8)
+    limiter.release(limiter.acquire(), 429, retry_after=0)
+    windows = []
+    for _ in range(40):
+        limiter.release(limiter.acquire(), 200)
+        windows.append(limiter.get_stats()["concurrency"])
+    assert windows == sorted(windows)
+    assert windows[0] == 4.25
+    assert windows[-1] == 8.0
+
+
+def test_throttle_pauses_admissions_for_retry_after():
+    limiter = RateLimiter()
+    limiter.release(limiter.acquire(), 429, retry_after=0.2)
+    started = time.monotonic()
+    limiter.release(limiter.acquire(), 200)
+    assert time.monotonic() - started >= 0.19
+
+
+def test_client_backs_off_and_recovers_against_a_throttling_server():
+    # Four requests a second: a burst of eight is throttled, then every request still succeeds
+    limiter = RateLimiter(max_concurrency=4)
+    with StubServer(reply="ok", requests_per_minute=4, rate_window=1.0) as stub:
+        client = LLMClient("test-key", base_url=stub.base_url, rate_limiter=limiter)
+        replies = [client.generate_response([{"role": "user", "content": f"question {i}"}]) for i in range(8)]
+    assert replies == ["ok"] * 8
+    stats = limiter.get_stats()
+    assert stub.throttled >= 1
+    assert stats["throttled"] == stub.throttled
+    assert stats["decreases"] >= 1
+    assert stats["admitted"] == 8 + stub.throttled
+    # Successes after the last throttle widen the window again
+    assert 1.0 < stats["concurrency"] < 4.0
+    assert stats["in_flight"] == 0
@@ -0,0 +1,69 @@
+from llm.llm_client import LLMClient
+from llm.response_cache import ResponseCache
+from llm.stub_server import StubServer
+
+MESSAGES = [{"role": "user", "content": "Name one risk of a mobile launch"}]
+
+
+def test_repeated_request_is_served_from_memory(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"))
+    with StubServer() as stub:
+        client = LLMClient("test-key", base_url=stub.base_url, cache=cache, cache_nondeterministic=True,
+                           rate_limit=False)
+        first = client.generate_response(MESSAGES)
+        assert client.generate_response(MESSAGES) == first
+    assert len(stub.requests) == 1
+    stats = cache.get_stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 0, 1)
+
+
+def test_disk_tier_outlives_the_process_cache(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    writer = ResponseCache(path)
+    writer.set("key", "stored answer")
+    writer.close()
+
+    reader = ResponseCache(path)
+    assert reader.get("key") == "stored answer"
+    assert reader.get("key") == "stored answer"
+    assert reader.get("missing") is None
+    stats = reader.get_stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), max_memory_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, key.upper())
+    cache.get("a")
+    cache.set("c", "C")
+    assert cache.get_stats()["memory_entries"] == 2
+    assert cache.get("a") == "A"
+    assert cache.get("b") == "B"  # Evicted from memory, still on disk
+    stats = cache.get_stats()
+    assert (stats["memory_hits"], stats["disk_hits"]) == (2, 1)
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), max_memory_entries=1, max_disk_bytes=100)
+    for key in ("a", "b", "c"):
+        cache.set(key, key * 30)
+    # A disk hit makes "a" the most recently used entry on disk
+    assert cache.get("a") == "a" * 30
+    cache.set("d", "d" * 30)
+    stats = cache.get_stats()
+    assert stats["disk_entries"] == 3
+    assert stats["disk_bytes"] == 90
+    assert stats["evictions"] >= 1
+    cache.close()
+
+    reopened = ResponseCache(str(tmp_path / "responses.sqlite3"))
+    assert reopened.get("b") is None
+    assert [reopened.get(key) for key in "acd"] == ["a" * 30, "c" * 30, "d" * 30]
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite3"), ttl=-1)
+    cache.set("key", "stale")
+    assert cache.get("key") is None
+    assert cache.get_stats()["disk_entries"] == 0
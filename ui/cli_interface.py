@@ -1,8 +1,8 @@
 from typing import Dict, Any
+from battle.agent_pool import build_agents
+from battle.battle_config import BattleConfig
 from battle.battle_manager import BattleManager
-from agents.pragmatic_pete import PragmaticPete
-from agents.innovative_izzy import InnovativeIzzy
-from agents.senior_dev_sam import SeniorDevSam
+from config.settings import BATTLE_CONFIG_FILE
 
 class CLIInterface:
     def __init__(self):
@@ -10,10 +10,9 @@ class CLIInterface:
         self._initialize_agents()
 
     def _initialize_agents(self):
-        """Initialize all agents"""
-        self.battle_manager.add_agent(PragmaticPete())
-        self.battle_manager.add_agent(InnovativeIzzy())
-        self.battle_manager.add_agent(SeniorDevSam())
+        """Initialize one agent per registered persona from the battle config"""
+        for agent in build_agents(BattleConfig.load(BATTLE_CONFIG_FILE)):
+            self.battle_manager.add_agent(agent)
 
     def start(self):
         """Start the CLI interface"""
@@ -49,7 +48,8 @@ class CLIInterface:
         if additional_info.lower() != 'skip':
             # Update the problem with additional information
             updated_problem = f"{self.battle_manager.problem}\nAdditional information: {additional_info}"
-            new_results = self.battle_manager.run_battle_with_rebuttals(updated_problem)
+            # Only agents whose inputs changed are re-run; the rest reuse current_results
+            new_results = self.battle_manager.run_battle_with_rebuttals(updated_problem, incremental=True)
             
             if new_results.get("status") == "needs_clarification":
                 self._handle_clarification(new_results)